@@ -1,4 +1,6 @@
 import asyncio
+
+import async_timeout
 import discord
 
 from gamestonk_terminal.config_terminal import TRADIER_TOKEN
@@ -95,9 +97,8 @@ async def expiry_dates_reaction(ctx, ticker, expiry, func_cmd, call_arg: tuple =
         return user == ctx.message.author and str(reaction.emoji) in emoji_list
 
     try:
-        reaction, _ = await gst_bot.wait_for(
-            "reaction_add", timeout=cfg.MENU_TIMEOUT, check=check
-        )
+        async with async_timeout.timeout(cfg.MENU_TIMEOUT):
+            reaction, _ = await gst_bot.wait_for("reaction_add", check=check)
         for N in range(0, 10):
             if reaction.emoji == emoji_list[N]:
                 if cfg.DEBUG:
@@ -1,4 +1,6 @@
 import asyncio
+
+import async_timeout
 import discord
 
 from discordbot.run_discordbot import gst_bot
@@ -12,12 +14,29 @@ from discordbot.stocks.due_diligence.supplier import supplier_command
 from discordbot.stocks.due_diligence.customer import customer_command
 from discordbot.stocks.due_diligence.arktrades import arktrades_command
 
+EMOJI_DISPATCH = {
+    "0️⃣": ("0", analyst_command),
+    "1️⃣": ("1", pt_command),
+    "2️⃣": ("2", est_command),
+    "3️⃣": ("3", sec_command),
+    "4️⃣": ("4", supplier_command),
+    "5️⃣": ("5", customer_command),
+    "6️⃣": ("6", arktrades_command),
+}
+
 
 class DueDiligenceCommands(discord.ext.commands.Cog):
     """Due Diligence menu."""
 
     def __init__(self, bot: discord.ext.commands.Bot):
         self.bot = bot
+        self._author = {"name": cfg.AUTHOR_NAME, "icon_url": cfg.AUTHOR_ICON_URL}
+
+    def _embed(self, **kwargs) -> discord.Embed:
+        """Builds an embed with the bot author fields already set"""
+        embed = discord.Embed(**kwargs)
+        embed.set_author(**self._author)
+        return embed
 
     @discord.ext.commands.command(name="stocks.dd.analyst", usage="[ticker]")
     async def analyst(self, ctx: discord.ext.commands.Context, ticker=""):
@@ -118,15 +137,13 @@ class DueDiligenceCommands(discord.ext.commands.Cog):
             print("!stocks.dd")
 
         if ticker == "":
-            embed = discord.Embed(
+            embed = self._embed(
                 title="ERROR Stocks: Due Diligence (DD) Menu",
                 colour=cfg.COLOR,
                 description="A stock ticker is required",
             )
-            embed.set_author(
-                name=cfg.AUTHOR_NAME,
-                icon_url=cfg.AUTHOR_ICON_URL,
-            )
+            await ctx.send(embed=embed)
+            return
 
         text = (
             f"0️⃣ !stocks.dd.analyst {ticker}\n"
@@ -139,70 +156,37 @@ class DueDiligenceCommands(discord.ext.commands.Cog):
         )
 
         title = "Stocks: Due Diligence (DD) Menu"
-        embed = discord.Embed(title=title, description=text, colour=cfg.COLOR)
-        embed.set_author(
-            name=cfg.AUTHOR_NAME,
-            icon_url=cfg.AUTHOR_ICON_URL,
-        )
+        embed = self._embed(title=title, description=text, colour=cfg.COLOR)
         msg = await ctx.send(embed=embed)
 
-        emoji_list = ["0️⃣", "1️⃣", "2️⃣", "3️⃣", "4️⃣", "5️⃣", "6️⃣"]
+        emoji_list = list(EMOJI_DISPATCH)
+        emoji_set = frozenset(emoji_list)
 
-        for emoji in emoji_list:
-            await msg.add_reaction(emoji)
+        await asyncio.gather(*(msg.add_reaction(emoji) for emoji in emoji_list))
 
         def check(reaction, user):
-            return user == ctx.message.author and str(reaction.emoji) in emoji_list
+            return user == ctx.message.author and str(reaction.emoji) in emoji_set
 
         try:
-            reaction, _ = await gst_bot.wait_for(
-                "reaction_add", timeout=cfg.MENU_TIMEOUT, check=check
-            )
-            if reaction.emoji == "0️⃣":
-                if cfg.DEBUG:
-                    print("Reaction selected: 0")
-                await analyst_command(ctx, ticker)
-            elif reaction.emoji == "1️⃣":
-                if cfg.DEBUG:
-                    print("Reaction selected: 1")
-                await pt_command(ctx, ticker)
-            elif reaction.emoji == "2️⃣":
-                if cfg.DEBUG:
-                    print("Reaction selected: 2")
-                await est_command(ctx, ticker)
-            elif reaction.emoji == "3️⃣":
-                if cfg.DEBUG:
-                    print("Reaction selected: 3")
-                await sec_command(ctx, ticker)
-            elif reaction.emoji == "4️⃣":
-                if cfg.DEBUG:
-                    print("Reaction selected: 4")
-                await supplier_command(ctx, ticker)
-            elif reaction.emoji == "5️⃣":
-                if cfg.DEBUG:
-                    print("Reaction selected: 5")
-                await customer_command(ctx, ticker)
-            elif reaction.emoji == "6️⃣":
-                if cfg.DEBUG:
-                    print("Reaction selected: 6")
-                await arktrades_command(ctx, ticker)
-
-            for emoji in emoji_list:
-                await msg.remove_reaction(emoji, ctx.bot.user)
+            async with async_timeout.timeout(cfg.MENU_TIMEOUT):
+                reaction, _ = await gst_bot.wait_for("reaction_add", check=check)
+            idx, command = EMOJI_DISPATCH[reaction.emoji]
+            if cfg.DEBUG:
+                print(f"Reaction selected: {idx}")
+            await command(ctx, ticker)
+
+            await msg.clear_reactions()
 
         except asyncio.TimeoutError:
-            for emoji in emoji_list:
-                await msg.remove_reaction(emoji, ctx.bot.user)
             if cfg.DEBUG:
-                embed = discord.Embed(
+                embed = self._embed(
                     description="Error timeout - you snooze you lose! 😋",
                     colour=cfg.COLOR,
                     title="TIMEOUT Stocks: Due Diligence (DD) Menu",
-                ).set_author(
-                    name=cfg.AUTHOR_NAME,
-                    icon_url=cfg.AUTHOR_ICON_URL,
                 )
-                await ctx.send(embed=embed)
+                await asyncio.gather(msg.clear_reactions(), msg.edit(embed=embed))
+            else:
+                await msg.clear_reactions()
 
 
 def setup(bot: discord.ext.commands.Bot):
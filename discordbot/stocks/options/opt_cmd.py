@@ -1,4 +1,6 @@
 import asyncio
+
+import async_timeout
 import discord
 
 import discordbot.config_discordbot as cfg
@@ -66,9 +68,8 @@ async def opt_command(ctx, ticker="", expiration="", strike="", put=""):
         return user == ctx.message.author and str(reaction.emoji) in emoji_list
 
     try:
-        reaction, _ = await gst_bot.wait_for(
-            "reaction_add", timeout=cfg.MENU_TIMEOUT, check=check
-        )
+        async with async_timeout.timeout(cfg.MENU_TIMEOUT):
+            reaction, _ = await gst_bot.wait_for("reaction_add", check=check)
         if reaction.emoji == "0️⃣":
             if cfg.DEBUG:
                 print("Reaction selected: 0")
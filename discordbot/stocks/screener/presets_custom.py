@@ -1,9 +1,32 @@
+import asyncio
+import os
+
 import discord
 
 import discordbot.config_discordbot as cfg
 
 from discordbot.stocks.screener import screener_options as so
 
+# Preset descriptions cached by (path, mtime) so repeat calls skip disk reads
+preset_cache = {}
+
+
+def _get_preset_description(preset):
+    """Extracts the description of a preset file, cached by modification time"""
+    path = so.presets_path + preset + ".ini"
+    mtime = os.stat(path).st_mtime
+    cached = preset_cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    with open(path, encoding="utf8") as f:
+        preset_line = "".join(
+            line.strip() for line in f.read().split("[General]", 1)[0].splitlines()
+        )
+    description = preset_line.split("Description: ")[1].replace("#", "")
+    preset_cache[path] = (mtime, description)
+    return description
+
 
 async def presets_custom_command(ctx):
     """Displays every custom preset"""
@@ -13,18 +36,19 @@ async def presets_custom_command(ctx):
         if cfg.DEBUG:
             print("!stocks.scr.presets")
 
-        description = ""
-        for preset in so.presets:
-            with open(
-                so.presets_path + preset + ".ini",
-                encoding="utf8",
-            ) as f:
-                preset_line = ""
-                for line in f:
-                    if line.strip() == "[General]":
-                        break
-                    preset_line += line.strip()
-            description += f"**{preset}:** *{preset_line.split('Description: ')[1].replace('#', '')}*\n"
+        # run_in_executor instead of asyncio.to_thread, which is 3.9+ while
+        # this tree still supports 3.8
+        loop = asyncio.get_running_loop()
+        descriptions = await asyncio.gather(
+            *(
+                loop.run_in_executor(None, _get_preset_description, p)
+                for p in so.presets
+            )
+        )
+        description = "".join(
+            f"**{preset}:** *{desc}*\n"
+            for preset, desc in zip(so.presets, descriptions)
+        )
 
         embed = discord.Embed(
             title="Stocks: Screener Custom Presets",
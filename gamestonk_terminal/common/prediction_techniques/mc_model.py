@@ -31,22 +31,30 @@ def get_mc_brownian(
         Array of predictions.  Has shape (n_future, n_sims)
     """
 
-    changes = data.pct_change().dropna()  # type: ignore
+    # Work on a contiguous float64 array so the simulation below stays in
+    # NumPy instead of going through pandas alignment machinery
+    values = (
+        data.to_numpy(dtype=np.float64, copy=False)
+        if isinstance(data, pd.Series)
+        else np.asarray(data, dtype=np.float64)
+    )
+    changes = values[1:] / values[:-1] - 1
+    changes = changes[~np.isnan(changes)]
 
     if use_log:
-        changes = np.log(1 + changes)
+        changes = np.log1p(changes)
 
     dist_mean = changes.mean()
-    dist_var = changes.var()
+    # ddof=1 keeps the sample variance pandas' Series.var() used to return
+    dist_var = changes.var(ddof=1)
     dist_drift = dist_mean - 0.5 * dist_var
     dist_std = np.sqrt(dist_var)
 
     random_steps = norm.ppf(np.random.rand(n_future, n_sims))
     predicted_change = np.exp(dist_drift + dist_std * random_steps)
-    possible_paths = np.zeros_like(predicted_change)
-    possible_paths[0] = data.values[-1]  # type: ignore
-
-    for t in range(1, n_future):
-        possible_paths[t] = possible_paths[t - 1] * predicted_change[t]
+    # Seed the first row with the last observed value; the cumulative product
+    # then expands to path[t] = path[t-1] * change[t] without a Python loop
+    predicted_change[0] = values[-1]
+    possible_paths = np.cumprod(predicted_change, axis=0, out=predicted_change)
 
     return possible_paths
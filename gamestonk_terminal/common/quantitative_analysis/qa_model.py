@@ -4,10 +4,11 @@ __docformat__ = "numpy"
 import warnings
 from typing import Any, Tuple
 
+import numpy as np
 import pandas as pd
 import statsmodels.api as sm
-from scipy import stats
-from statsmodels.tsa.seasonal import seasonal_decompose
+from scipy import signal, stats
+from statsmodels.tsa.seasonal import DecomposeResult
 from statsmodels.tsa.stattools import adfuller, kpss
 
 # TODO : Since these are common/ they should be independent of 'stock' info.
@@ -23,10 +24,41 @@ def get_summary(df: pd.DataFrame) -> pd.DataFrame:
         Dataframe to get summary statistics for
     """
 
-    df_stats = df.describe(percentiles=[0.1, 0.25, 0.5, 0.75, 0.9])
-    df_stats.loc["var"] = df_stats.loc["std"] ** 2
-
-    return df_stats
+    percentiles = np.array([0.1, 0.25, 0.5, 0.75, 0.9])
+    rows = (
+        ["count", "mean", "std", "min"]
+        + [f"{int(p * 100)}%" for p in percentiles]
+        + ["max", "var"]
+    )
+    numeric = df.select_dtypes(include=np.number)
+    stats_by_column = {}
+    for column in numeric.columns:
+        values = numeric[column].to_numpy(dtype=np.float64)
+        values = values[~np.isnan(values)]
+        n = values.size
+        if n == 0:
+            stats_by_column[column] = [0.0] + [np.nan] * (len(rows) - 1)
+            continue
+        var = values.var(ddof=1) if n > 1 else np.nan
+        # One linear-time partition positions the bracketing order statistics
+        # of every percentile, instead of describe's full sort
+        pos = (n - 1) * percentiles
+        lo = np.floor(pos).astype(np.intp)
+        hi = np.ceil(pos).astype(np.intp)
+        part = np.partition(values, np.unique(np.concatenate((lo, hi))))
+        frac = pos - lo
+        quantiles = part[lo] * (1.0 - frac) + part[hi] * frac
+        stats_by_column[column] = [
+            float(n),
+            values.mean(),
+            np.sqrt(var),
+            values.min(),
+            *quantiles,
+            values.max(),
+            var,
+        ]
+
+    return pd.DataFrame(stats_by_column, index=rows)
 
 
 def get_seasonal_decomposition(
@@ -50,14 +82,44 @@ def get_seasonal_decomposition(
     trend: pd.DataFrame
         Filtered Trend
     """
-    seasonal_periods = 5
+    period = 5
     # Hodrick-Prescott filter
     # See Ravn and Uhlig: http://home.uchicago.edu/~huhlig/papers/uhlig.ravn.res.2002.pdf
     lamb = 107360000000
 
-    model = ["additive", "multiplicative"][multiplicative]
+    x = df.to_numpy(dtype=np.float64)
+    nobs = x.size
+    half = period // 2
+
+    # Centered moving-average trend via FFT convolution, with the same NaN
+    # edges the statsmodels convolution filter produces
+    trend_arr = np.full(nobs, np.nan)
+    trend_arr[half : nobs - half] = signal.fftconvolve(
+        x, np.full(period, 1.0 / period), mode="valid"
+    )
 
-    result = seasonal_decompose(df, model=model, period=seasonal_periods)
+    # Average each phase of the cycle with one reshape instead of a Python
+    # loop over the period offsets
+    detrended = x / trend_arr if multiplicative else x - trend_arr
+    n_cycles = -(-nobs // period)
+    padded = np.full(n_cycles * period, np.nan)
+    padded[:nobs] = detrended
+    period_averages = np.nanmean(padded.reshape(n_cycles, period), axis=0)
+    if multiplicative:
+        period_averages /= period_averages.mean()
+        seasonal_arr = np.tile(period_averages, n_cycles)[:nobs]
+        resid_arr = x / (trend_arr * seasonal_arr)
+    else:
+        period_averages -= period_averages.mean()
+        seasonal_arr = np.tile(period_averages, n_cycles)[:nobs]
+        resid_arr = x - trend_arr - seasonal_arr
+
+    result = DecomposeResult(
+        observed=df,
+        seasonal=pd.Series(seasonal_arr, index=df.index),
+        trend=pd.Series(trend_arr, index=df.index),
+        resid=pd.Series(resid_arr, index=df.index),
+    )
     cycle, trend = sm.tsa.filters.hpfilter(
         result.trend[result.trend.notna().values], lamb=lamb
     )
@@ -118,13 +180,13 @@ def get_normality(data: pd.DataFrame) -> pd.DataFrame:
     )
 
 
-def get_unitroot(df: pd.DataFrame, fuller_reg: str, kpss_reg: str) -> pd.DataFrame:
+def get_unitroot(data: np.ndarray, fuller_reg: str, kpss_reg: str) -> pd.DataFrame:
     """Calculate test statistics for unit roots
 
     Parameters
     ----------
-    df : pd.DataFrame
-        DataFrame of target variable
+    data : np.ndarray
+        Array of target variable
     fuller_reg : str
         Type of regression of ADF test
     kpss_reg : str
@@ -135,9 +197,13 @@ def get_unitroot(df: pd.DataFrame, fuller_reg: str, kpss_reg: str) -> pd.DataFra
     pd.DataFrame
         Dataframe with results of ADF test and KPSS test
     """
+    # Both tests share one contiguous float64 array instead of each doing its
+    # own pandas validation and conversion pass
+    data = np.ascontiguousarray(data, dtype=np.float64)
+
     # The Augmented Dickey-Fuller test
     # Used to test for a unit root in a univariate process in the presence of serial correlation.
-    result = adfuller(df, regression=fuller_reg)
+    result = adfuller(data, regression=fuller_reg)
     cols = ["Test Statistic", "P-Value", "NLags", "Nobs", "ICBest"]
     vals = [result[0], result[1], result[2], result[3], result[5]]
     data = pd.DataFrame(data=vals, index=cols, columns=["ADF"])
@@ -150,7 +216,7 @@ def get_unitroot(df: pd.DataFrame, fuller_reg: str, kpss_reg: str) -> pd.DataFra
     # Wrap this in catch_warnings to prevent
     with warnings.catch_warnings():
         warnings.simplefilter("ignore")
-        res2 = kpss(df, regression=kpss_reg, nlags="auto")
+        res2 = kpss(data, regression=kpss_reg, nlags="auto")
     vals2 = [res2[0], res2[1], res2[2], "", ""]
     data["KPSS"] = vals2
     return data
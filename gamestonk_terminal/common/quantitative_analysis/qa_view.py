@@ -9,9 +9,7 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import seaborn as sns
-import statsmodels.api as sm
 from colorama import Fore, Style
-from detecta import detect_cusum
 from matplotlib import gridspec
 from pandas.plotting import register_matplotlib_converters
 from scipy import stats
@@ -237,6 +235,79 @@ def display_bw(
     print("")
 
 
+def _acf_fft(x: np.ndarray, lags: int) -> np.ndarray:
+    """Autocorrelation function via the Wiener-Khinchin theorem
+
+    One zero-padded FFT round trip yields every lag at once in O(N log N)
+    instead of the O(N*L) direct lagged sums.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Data to correlate
+    lags : int
+        Max number of lags to compute
+
+    Returns
+    -------
+    np.ndarray
+        Autocorrelations for lags 0 through `lags`
+    """
+    x = np.asarray(x, dtype=np.float64)
+    centered = x - x.mean()
+    # Pad to the next power of two past 2N to avoid circular wrap-around
+    nfft = 1 << (2 * x.size - 1).bit_length()
+    f = np.fft.rfft(centered, nfft)
+    acov = np.fft.irfft(f * np.conj(f))[: lags + 1] / x.size
+    return acov / acov[0]
+
+
+def _pacf_durbin_levinson(acf: np.ndarray) -> np.ndarray:
+    """Partial autocorrelations from the ACF via Durbin-Levinson recursion
+
+    Parameters
+    ----------
+    acf : np.ndarray
+        Autocorrelations for lags 0 through L
+
+    Returns
+    -------
+    np.ndarray
+        Partial autocorrelations for lags 0 through L
+    """
+    lags = acf.size - 1
+    pacf = np.empty(lags + 1)
+    pacf[0] = 1.0
+    phi = np.zeros((lags + 1, lags + 1))
+    for k in range(1, lags + 1):
+        numerator = acf[k] - np.dot(phi[k - 1, 1:k], acf[k - 1 : 0 : -1])
+        denominator = 1.0 - np.dot(phi[k - 1, 1:k], acf[1:k])
+        phi[k, k] = numerator / denominator
+        phi[k, 1:k] = phi[k - 1, 1:k] - phi[k, k] * phi[k - 1, k - 1 : 0 : -1]
+        pacf[k] = phi[k, k]
+    return pacf
+
+
+def _plot_correlogram(ax, values: np.ndarray, confint: np.ndarray):
+    """Draw a vlines-and-markers correlogram with its confidence band
+
+    Parameters
+    ----------
+    ax : matplotlib.axes.Axes
+        Axis to draw on
+    values : np.ndarray
+        Correlations per lag, starting at lag 0
+    confint : np.ndarray
+        Half-width of the confidence band per lag
+    """
+    lag_axis = np.arange(values.size)
+    ax.vlines(lag_axis, [0], values)
+    ax.plot(lag_axis, values, "o", markersize=5)
+    ax.axhline(0.0, color="black", lw=0.5)
+    ax.fill_between(lag_axis[1:], -confint[1:], confint[1:], alpha=0.25)
+    ax.margins(0.05)
+
+
 def display_acf(name: str, df: pd.DataFrame, target: str, lags: int):
     """Show Auto and Partial Auto Correlation of returns and change in returns
 
@@ -253,29 +324,40 @@ def display_acf(name: str, df: pd.DataFrame, target: str, lags: int):
     """
     df = df[target]
     start = df.index[0]
+
+    # The double diff is shared by all four panels, so correlate it once
+    values = np.diff(np.diff(df.to_numpy(dtype=np.float64)))
+    nobs = values.size
+    acf_values = _acf_fft(values, lags)
+    pacf_values = _pacf_durbin_levinson(acf_values)
+    # Bartlett band for the ACF, constant 1.96/sqrt(N) band for the PACF
+    cum_sq = np.concatenate(([0.0, 0.0], np.cumsum(acf_values[1:-1] ** 2)))
+    acf_confint = 1.96 * np.sqrt((1.0 + 2.0 * cum_sq) / nobs)
+    pacf_confint = np.full(lags + 1, 1.96 / np.sqrt(nobs))
+
     fig = plt.figure(figsize=plot_autoscale(), dpi=PLOT_DPI, constrained_layout=True)
     spec = gridspec.GridSpec(ncols=2, nrows=2, figure=fig)
 
     # Diff Auto-correlation function for original time series
     ax_acf = fig.add_subplot(spec[0, 0])
-    sm.graphics.tsa.plot_acf(np.diff(np.diff(df.values)), lags=lags, ax=ax_acf)
+    _plot_correlogram(ax_acf, acf_values, acf_confint)
     plt.title(f"{name} Returns Auto-Correlation from {start.strftime('%Y-%m-%d')}")
     # Diff Partial auto-correlation function for original time series
     ax_pacf = fig.add_subplot(spec[0, 1])
-    sm.graphics.tsa.plot_pacf(np.diff(np.diff(df.values)), lags=lags, ax=ax_pacf)
+    _plot_correlogram(ax_pacf, pacf_values, pacf_confint)
     plt.title(
         f"{name} Returns Partial Auto-Correlation from {start.strftime('%Y-%m-%d')}"
     )
 
     # Diff Diff Auto-correlation function for original time series
     ax_acf = fig.add_subplot(spec[1, 0])
-    sm.graphics.tsa.plot_acf(np.diff(np.diff(df.values)), lags=lags, ax=ax_acf)
+    _plot_correlogram(ax_acf, acf_values, acf_confint)
     plt.title(
         f"Change in {name} Returns Auto-Correlation from {start.strftime('%Y-%m-%d')}"
     )
     # Diff Diff Partial auto-correlation function for original time series
     ax_pacf = fig.add_subplot(spec[1, 1])
-    sm.graphics.tsa.plot_pacf(np.diff(np.diff(df.values)), lags=lags, ax=ax_pacf)
+    _plot_correlogram(ax_pacf, pacf_values, pacf_confint)
     plt.title(
         f"Change in {name}) Returns Partial Auto-Correlation from {start.strftime('%Y-%m-%d')}"
     )
@@ -287,21 +369,176 @@ def display_acf(name: str, df: pd.DataFrame, target: str, lags: int):
     print("")
 
 
-def display_cusum(df: pd.DataFrame, target: str, threshold: float, drift: float):
+def _cusum_pass(x: np.ndarray, threshold: float, drift: float):
+    """Run one direction of the CUSUM detection with vectorized segments
+
+    The clipped recurrence g[i] = max(0, g[i-1] + s[i]) has the closed form
+    g = cs - min(0, running_min(cs)) between alarms, so instead of a Python
+    loop over every sample, each alarm-free segment is evaluated with a
+    cumsum plus a running minimum and the scan jumps from alarm to alarm.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Data to scan
+    threshold : float
+        Alarm threshold
+    drift : float
+        Drift parameter
+
+    Returns
+    -------
+    ta : np.ndarray
+        Indices where an alarm was raised
+    tai : np.ndarray
+        Indices where the detected changes started
+    gp : np.ndarray
+        Cumulative sum of positive changes
+    gn : np.ndarray
+        Cumulative sum of negative changes
+    """
+    n = x.size
+    gp = np.zeros(n)
+    gn = np.zeros(n)
+    ta_list: list = []
+    tai_list: list = []
+    if n < 2:
+        return np.zeros(0, dtype=int), np.zeros(0, dtype=int), gp, gn
+
+    diffs = np.diff(x)
+    s_pos = diffs - drift
+    s_neg = -diffs - drift
+    tap = tan = 0
+    i0 = 0
+    while i0 < n - 1:
+        cs_pos = np.cumsum(s_pos[i0:])
+        cs_neg = np.cumsum(s_neg[i0:])
+        floor_pos = np.minimum(np.minimum.accumulate(cs_pos), 0.0)
+        floor_neg = np.minimum(np.minimum.accumulate(cs_neg), 0.0)
+        seg_gp = cs_pos - floor_pos
+        seg_gn = cs_neg - floor_neg
+        crossed = (seg_gp > threshold) | (seg_gn > threshold)
+        if not crossed.any():
+            gp[i0 + 1 :] = seg_gp
+            gn[i0 + 1 :] = seg_gn
+            break
+        alarm_rel = int(np.argmax(crossed))
+        alarm = i0 + 1 + alarm_rel
+        # Positions where the sums were clipped to zero mark where the start
+        # of a potential change moves forward
+        clip_pos = np.nonzero(
+            cs_pos[: alarm_rel + 1]
+            < np.concatenate(([0.0], floor_pos[:alarm_rel]))
+        )[0]
+        clip_neg = np.nonzero(
+            cs_neg[: alarm_rel + 1]
+            < np.concatenate(([0.0], floor_neg[:alarm_rel]))
+        )[0]
+        if clip_pos.size:
+            tap = i0 + 1 + clip_pos[-1]
+        if clip_neg.size:
+            tan = i0 + 1 + clip_neg[-1]
+        ta_list.append(alarm)
+        tai_list.append(tap if seg_gp[alarm_rel] > threshold else tan)
+        gp[i0 + 1 : alarm] = seg_gp[:alarm_rel]
+        gn[i0 + 1 : alarm] = seg_gn[:alarm_rel]
+        # Both sums reset to zero on alarm, so the next segment restarts here
+        i0 = alarm
+
+    return np.asarray(ta_list, dtype=int), np.asarray(tai_list, dtype=int), gp, gn
+
+
+def _detect_cusum(x: np.ndarray, threshold: float, drift: float):
+    """Detect abrupt changes via CUSUM with change endings estimated
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Data to scan
+    threshold : float
+        Alarm threshold
+    drift : float
+        Drift parameter
+
+    Returns
+    -------
+    ta : np.ndarray
+        Indices where an alarm was raised
+    tai : np.ndarray
+        Indices where the detected changes started
+    taf : np.ndarray
+        Indices where the detected changes ended
+    gp : np.ndarray
+        Cumulative sum of positive changes
+    gn : np.ndarray
+        Cumulative sum of negative changes
+    """
+    ta, tai, gp, gn = _cusum_pass(x, threshold, drift)
+    taf = np.zeros(0, dtype=int)
+    if tai.size:
+        # Change endings are the change starts of the reversed series
+        _, tai_rev, _, _ = _cusum_pass(x[::-1], threshold, drift)
+        taf = x.size - tai_rev[::-1] - 1
+        # Eliminate changes that share the same beginning
+        tai, ind = np.unique(tai, return_index=True)
+        ta = ta[ind]
+        if tai.size != taf.size:
+            if tai.size < taf.size:
+                taf = taf[[np.argmax(taf >= i) for i in ta]]
+            else:
+                ind = [np.argmax(i >= ta[::-1]) - 1 for i in taf]
+                ta = ta[ind]
+                tai = tai[ind]
+        # Delete intercalated changes (the ending of a change falling after
+        # the beginning of the next one)
+        ind = taf[:-1] - tai[1:] > 0
+        if ind.any():
+            ta = ta[~np.append(False, ind)]
+            tai = tai[~np.append(False, ind)]
+            taf = taf[~np.append(ind, False)]
+
+    return ta, tai, taf, gp, gn
+
+
+def display_cusum(data: np.ndarray, threshold: float, drift: float):
     """Cumulative sum algorithm (CUSUM) to detect abrupt changes in data
 
     Parameters
     ----------
-    df : pd.DataFrame
-        Dataframe
-    target : str
-        Column of data to look at
+    data : np.ndarray
+        Array of data to look at
     threshold : float
         Threshold value
     drift : float
         Drift parameter
     """
-    detect_cusum(df[target].values, threshold, drift, True, True)
+    values = np.asarray(data, dtype=np.float64)
+    ta, tai, taf, gp, gn = _detect_cusum(values, threshold, drift)
+
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=plot_autoscale(), dpi=PLOT_DPI)
+    t = np.arange(values.size)
+    ax1.plot(t, values, "b-", lw=2)
+    if ta.size:
+        ax1.plot(tai, values[tai], ">", mfc="g", mec="g", ms=10, label="Start")
+        if taf.size:
+            ax1.plot(taf, values[taf], "<", mfc="g", mec="g", ms=10, label="Ending")
+        ax1.plot(ta, values[ta], "o", mfc="r", mec="r", mew=1, ms=5, label="Alarm")
+        ax1.legend(loc="best", framealpha=0.5, numpoints=1)
+    ax1.set_xlim(-0.01 * values.size, values.size * 1.01 - 1)
+    ax1.set_ylabel("Amplitude")
+    ax1.set_title("Time series and detected changes")
+    ax1.grid(True)
+    ax2.plot(t, gp, "y-", label="+")
+    ax2.plot(t, gn, "m-", label="-")
+    ax2.set_xlim(-0.01 * values.size, values.size * 1.01 - 1)
+    ax2.set_xlabel("Data #")
+    ax2.set_ylim(-0.01 * threshold, 1.1 * threshold)
+    ax2.axhline(threshold, color="r")
+    ax2.set_title("Cumulative sums of positive and negative changes")
+    ax2.legend(loc="best", framealpha=0.5, numpoints=1)
+    ax2.grid(True)
+    fig.tight_layout()
+
     if gtff.USE_ION:
         plt.ion()
     plt.show()
@@ -392,19 +629,16 @@ def display_seasonal(
     )
 
 
-def display_normality(df: pd.DataFrame, target: str, export: str = ""):
+def display_normality(data: np.ndarray, export: str = ""):
     """View normality statistics
 
     Parameters
     ----------
-    df : pd.DataFrame
-        DataFrame
-    target : str
-        Column in data to look at
+    data : np.ndarray
+        Array of data to look at
     export : str
         Format to export data
     """
-    data = df[target]
     normal = qa_model.get_normality(data)
     stats1 = normal.copy().T
     print(stats1)
@@ -433,21 +667,20 @@ def display_normality(df: pd.DataFrame, target: str, export: str = ""):
     )
 
 
-def display_qqplot(name: str, df: pd.DataFrame, target: str):
+def display_qqplot(name: str, target: str, data: np.ndarray):
     """Show QQ plot for data against normal quantiles
 
     Parameters
     ----------
     name : str
         Stock ticker
-    df : pd.DataFrame
-        Dataframe
     target : str
         Column in data to look at
+    data : np.ndarray
+        Array of data to look at
     """
     # Statsmodels has a UserWarning for marker kwarg-- which we dont use
     warnings.filterwarnings(category=UserWarning, action="ignore")
-    data = df[target]
     fig, ax = plt.subplots(figsize=plot_autoscale(), dpi=PLOT_DPI)
     qqplot(data, stats.distributions.norm, fit=True, line="45", ax=ax)
     ax.set_title(f"Q-Q plot for {name} {target}")
@@ -463,16 +696,14 @@ def display_qqplot(name: str, df: pd.DataFrame, target: str):
 
 
 def display_unitroot(
-    df: pd.DataFrame, target: str, fuller_reg: str, kpss_reg: str, export: str = ""
+    data: np.ndarray, fuller_reg: str, kpss_reg: str, export: str = ""
 ):
     """Show unit root test calculations
 
     Parameters
     ----------
-    df : pd.DataFrame
-        DataFrame
-    target : str
-        Column of data to look at
+    data : np.ndarray
+        Array of data to look at
     fuller_reg : str
         Type of regression of ADF test
     kpss_reg : str
@@ -480,8 +711,7 @@ def display_unitroot(
     export : str
         Format for exporting data
     """
-    df = df[target]
-    data = qa_model.get_unitroot(df, fuller_reg, kpss_reg)
+    data = qa_model.get_unitroot(data, fuller_reg, kpss_reg)
     if gtff.USE_TABULATE_DF:
         print(
             tabulate(
@@ -3,8 +3,128 @@ __docformat__ = "numpy"
 
 from typing import Tuple
 
+import numpy as np
 import pandas as pd
-import pandas_ta as ta
+
+
+def _window_mean_var(
+    x: np.ndarray, starts: np.ndarray, ends: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Mean and sample variance of the windows [starts[i], ends[i])
+
+    One padded cumsum of the values and one of their squares replace the
+    per-window reductions, so arbitrary window bounds cost O(1) each.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Data array
+    starts : np.ndarray
+        Inclusive start index of each window
+    ends : np.ndarray
+        Exclusive end index of each window
+
+    Returns
+    -------
+    mean : np.ndarray
+        Mean of each window
+    var : np.ndarray
+        Sample variance (ddof=1) of each window, NaN for single-element ones
+    """
+    # Centering keeps the squared cumsum differences well conditioned
+    shift = x.mean()
+    centered = x - shift
+    pad = np.zeros(1)
+    cs = np.concatenate((pad, np.cumsum(centered)))
+    css = np.concatenate((pad, np.cumsum(centered * centered)))
+    count = (ends - starts).astype(np.float64)
+    total = cs[ends] - cs[starts]
+    total_sq = css[ends] - css[starts]
+    mean = total / count + shift
+    with np.errstate(divide="ignore", invalid="ignore"):
+        var = (total_sq - total ** 2 / count) / (count - 1.0)
+    var[count < 2] = np.nan
+    # Rounding can push a constant window slightly negative
+    np.clip(var, 0.0, None, out=var)
+    return mean, var
+
+
+def _rolling_quantile(x: np.ndarray, length: int, q: float) -> np.ndarray:
+    """Linear-interpolated quantile of each trailing window
+
+    Partitioning every window around the two bracketing order statistics is
+    linear-time introselect, instead of the full per-window sort pandas runs
+    for rolling quantiles.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Data array
+    length : int
+        Length of rolling window
+    q : float
+        Quantile to compute, between 0 and 1
+
+    Returns
+    -------
+    np.ndarray
+        Quantile of each window, one entry per full window
+    """
+    windows = np.lib.stride_tricks.sliding_window_view(x, length)
+    pos = (length - 1) * q
+    lo = int(np.floor(pos))
+    hi = int(np.ceil(pos))
+    if lo == hi:
+        return np.partition(windows, lo, axis=1)[:, lo]
+    part = np.partition(windows, (lo, hi), axis=1)
+    frac = pos - lo
+    return part[:, lo] * (1.0 - frac) + part[:, hi] * frac
+
+
+def _rolling_moments(
+    df: pd.Series, length: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Biased central moments m2, m3, m4 of each trailing window
+
+    Window sums of x, x^2, x^3 and x^4 are built once with padded cumsums,
+    so each moment costs O(N) instead of the O(N*W) per-window recompute
+    pandas does for rolling higher moments.
+
+    Parameters
+    ----------
+    df : pd.Series
+        Series of target data
+    length : int
+        Length of rolling window
+
+    Returns
+    -------
+    m2 : np.ndarray
+        Rolling biased variance
+    m3 : np.ndarray
+        Rolling third central moment
+    m4 : np.ndarray
+        Rolling fourth central moment
+    """
+    x = df.to_numpy(dtype=np.float64)
+    # Central moments are shift invariant; removing the global mean keeps the
+    # higher power sums small enough that the cumsum differences stay accurate
+    x = x - x.mean()
+    pad = np.zeros(1)
+    s1 = np.concatenate((pad, np.cumsum(x)))
+    s2 = np.concatenate((pad, np.cumsum(x * x)))
+    s3 = np.concatenate((pad, np.cumsum(x ** 3)))
+    s4 = np.concatenate((pad, np.cumsum(x ** 4)))
+    n = float(length)
+    sum1 = s1[length:] - s1[:-length]
+    sum2 = s2[length:] - s2[:-length]
+    sum3 = s3[length:] - s3[:-length]
+    sum4 = s4[length:] - s4[:-length]
+    mean = sum1 / n
+    m2 = sum2 / n - mean ** 2
+    m3 = (sum3 - 3.0 * mean * sum2) / n + 2.0 * mean ** 3
+    m4 = (sum4 - 4.0 * mean * sum3 + 6.0 * mean ** 2 * sum2) / n - 3.0 * mean ** 4
+    return m2, m3, m4
 
 
 def get_rolling_avg(df: pd.DataFrame, length: int) -> Tuple[pd.DataFrame, pd.DataFrame]:
@@ -24,8 +144,16 @@ def get_rolling_avg(df: pd.DataFrame, length: int) -> Tuple[pd.DataFrame, pd.Dat
     pd.DataFrame :
         Dataframe of rolling standard deviation
     """
-    rolling_mean = df.rolling(length, center=True, min_periods=1).mean()
-    rolling_std = df.rolling(length, center=True, min_periods=1).std()
+    x = df.to_numpy(dtype=np.float64)
+    n = x.size
+    # Same centered bounds pandas uses for rolling(center=True, min_periods=1)
+    offset = (length - 1) // 2
+    idx = np.arange(n)
+    starts = np.clip(idx - length + 1 + offset, 0, n)
+    ends = np.clip(idx + offset + 1, 0, n)
+    mean, var = _window_mean_var(x, starts, ends)
+    rolling_mean = pd.Series(mean, index=df.index, name=df.name)
+    rolling_std = pd.Series(np.sqrt(var), index=df.index, name=df.name)
 
     return pd.DataFrame(rolling_mean), pd.DataFrame(rolling_std)
 
@@ -45,14 +173,18 @@ def get_spread(df: pd.DataFrame, length: int) -> Tuple[pd.DataFrame, pd.DataFram
     df_var : pd.DataFrame
         Dataframe of rolling standard deviation
     """
-    df_sd = ta.stdev(
-        close=df,
-        length=length,
-    ).dropna()
-    df_var = ta.variance(
-        close=df,
-        length=length,
-    ).dropna()
+    x = df.to_numpy(dtype=np.float64)
+    n = x.size
+    if length > n:
+        empty = pd.Series(dtype=np.float64)
+        return pd.DataFrame(empty.rename(f"STDEV_{length}")), pd.DataFrame(
+            empty.rename(f"VAR_{length}")
+        )
+    idx = np.arange(length - 1, n)
+    _, var = _window_mean_var(x, idx - length + 1, idx + 1)
+    index = df.index[length - 1 :]
+    df_sd = pd.Series(np.sqrt(var), index=index, name=f"STDEV_{length}").dropna()
+    df_var = pd.Series(var, index=index, name=f"VAR_{length}").dropna()
 
     return pd.DataFrame(df_sd), pd.DataFrame(df_var)
 
@@ -78,11 +210,20 @@ def get_quantile(
     df_quantile : pd.DataFrame
         Dataframe of gievn quantile prices over window
     """
-    df_med = ta.median(close=df, length=length).dropna()
-    df_quantile = ta.quantile(
-        df,
-        length=length,
-        q=quantile_pct,
+    x = df.to_numpy(dtype=np.float64)
+    med_name = f"MEDIAN_{length}"
+    qtl_name = f"QTL_{length}_{quantile_pct}"
+    if length > x.size:
+        empty = pd.Series(dtype=np.float64)
+        return pd.DataFrame(empty.rename(med_name)), pd.DataFrame(
+            empty.rename(qtl_name)
+        )
+    index = df.index[length - 1 :]
+    df_med = pd.Series(
+        _rolling_quantile(x, length, 0.5), index=index, name=med_name
+    ).dropna()
+    df_quantile = pd.Series(
+        _rolling_quantile(x, length, quantile_pct), index=index, name=qtl_name
     ).dropna()
 
     return pd.DataFrame(df_med), pd.DataFrame(df_quantile)
@@ -103,7 +244,16 @@ def get_skew(df: pd.DataFrame, length: int) -> pd.DataFrame:
     df_skew : pd.DataFrame
         Dataframe of rolling skew
     """
-    df_skew = ta.skew(close=df, length=length).dropna()
+    name = f"SKEW_{length}"
+    if length < 3 or length > len(df):
+        return pd.Series(dtype=np.float64, name=name)
+    m2, m3, _ = _rolling_moments(df, length)
+    n = float(length)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Adjusted Fisher-Pearson coefficient, matching pandas rolling skew
+        skew = np.sqrt(n * (n - 1.0)) / (n - 2.0) * m3 / m2 ** 1.5
+    skew[m2 <= 0] = np.nan
+    df_skew = pd.Series(skew, index=df.index[length - 1 :], name=name).dropna()
     return df_skew
 
 
@@ -122,5 +272,15 @@ def get_kurtosis(df: pd.DataFrame, length: int) -> pd.DataFrame:
     df_kurt : pd.DataFrame
         Dataframe of rolling kurtosis
     """
-    df_kurt = ta.kurtosis(close=df, length=length).dropna()
+    name = f"KURT_{length}"
+    if length < 4 or length > len(df):
+        return pd.Series(dtype=np.float64, name=name)
+    m2, _, m4 = _rolling_moments(df, length)
+    n = float(length)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Unbiased excess kurtosis, matching pandas rolling kurt
+        g2 = m4 / m2 ** 2 - 3.0
+        kurt = (n - 1.0) / ((n - 2.0) * (n - 3.0)) * ((n + 1.0) * g2 + 6.0)
+    kurt[m2 <= 0] = np.nan
+    df_kurt = pd.Series(kurt, index=df.index[length - 1 :], name=name).dropna()
     return df_kurt
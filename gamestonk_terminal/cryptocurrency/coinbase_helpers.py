@@ -13,6 +13,23 @@ import requests
 from requests.auth import AuthBase
 import gamestonk_terminal.config_terminal as cfg
 
+_session: Optional[requests.Session] = None
+
+
+def _get_session() -> requests.Session:
+    """Return the shared requests session, creating it on first use so TCP/TLS
+    connections are reused across Coinbase calls. [Source: Coinbase]
+
+    Returns
+    -------
+    requests.Session
+        Shared session with connection pooling
+    """
+    global _session  # pylint: disable=global-statement
+    if _session is None:
+        _session = requests.Session()
+    return _session
+
 
 class CoinbaseProAuth(AuthBase):
     """Authorize CoinbasePro requests. Source: https://docs.pro.coinbase.com/?python#signing-a-message"""
@@ -23,9 +40,30 @@ class CoinbaseProAuth(AuthBase):
         self.passphrase = passphrase
 
     def __call__(self, request):
+        request.headers.update(
+            self.get_auth_headers(request.method, request.path_url, request.body or "")
+        )
+        return request
+
+    def get_auth_headers(self, method: str, path_url: str, body: str = "") -> dict:
+        """Build CB-ACCESS signature headers for given request data. [Source: Coinbase]
+
+        Parameters
+        ----------
+        method: str
+            Http method e.g GET
+        path_url: str
+            Endpoint path with query string e.g /accounts
+        body: str
+            Request body, empty string for GET requests
+
+        Returns
+        -------
+        dict
+            Headers with Coinbase Pro authentication
+        """
         timestamp = str(time.time())
-        message = timestamp + request.method + request.path_url + (request.body or "")
-        message = message.encode("ascii")
+        message = (timestamp + method + path_url + body).encode("ascii")
 
         try:
             hmac_key = base64.b64decode(self.secret_key)
@@ -34,16 +72,13 @@ class CoinbaseProAuth(AuthBase):
         except binascii.Error:
             signature_b64 = ""
 
-        request.headers.update(
-            {
-                "CB-ACCESS-SIGN": signature_b64,
-                "CB-ACCESS-TIMESTAMP": timestamp,
-                "CB-ACCESS-KEY": self.api_key,
-                "CB-ACCESS-PASSPHRASE": self.passphrase,
-                "Content-Type": "application/json",
-            }
-        )
-        return request
+        return {
+            "CB-ACCESS-SIGN": signature_b64,
+            "CB-ACCESS-TIMESTAMP": timestamp,
+            "CB-ACCESS-KEY": self.api_key,
+            "CB-ACCESS-PASSPHRASE": self.passphrase,
+            "Content-Type": "application/json",
+        }
 
 
 class CoinbaseRequestException(Exception):
@@ -114,7 +149,7 @@ def make_coinbase_request(
     """
 
     url = "https://api.pro.coinbase.com"
-    response = requests.get(url + endpoint, params=params, auth=auth)
+    response = _get_session().get(url + endpoint, params=params, auth=auth)
 
     if not 200 <= response.status_code < 300:
         raise CoinbaseApiException(f"Invalid Authentication: {response.text}")
@@ -1,12 +1,44 @@
 """DeFi Rate model"""
 __docformat__ = "numpy"
 
+import time
+from functools import wraps
+
 import requests
 from bs4 import BeautifulSoup
 from bs4.element import Tag
 import pandas as pd
 
 
+def _cache_with_ttl(ttl: int = 60):
+    """Decorator that caches scraped DataFrames for given number of seconds,
+    so repeated calls don't re-scrape defirate.com. Cached frames are returned
+    as copies to preserve caller mutation semantics.
+
+    Parameters
+    ----------
+    ttl: int
+        Number of seconds cached results stay valid
+    """
+
+    def decorator(func):
+        cache: dict = {}
+
+        @wraps(func)
+        def wrapper(current: bool = True) -> pd.DataFrame:
+            now = time.monotonic()
+            cached = cache.get(current)
+            if cached and cached[0] > now:
+                return cached[1].copy()
+            df = func(current)
+            cache[current] = (now + ttl, df)
+            return df.copy()
+
+        return wrapper
+
+    return decorator
+
+
 def _scrape_defirate(url: str, current: bool = True) -> Tag:
     """Helper method that scrapes table object from defirate.com
     [Source: https://defirate.com/]
@@ -36,6 +68,7 @@ def _scrape_defirate(url: str, current: bool = True) -> Tag:
     return table
 
 
+@_cache_with_ttl(ttl=60)
 def get_funding_rates(current: bool = True) -> pd.DataFrame:
     """Funding rates are transfer payments made between long and short positions on perpetual swap futures markets.
     They’re designed to keep contract prices consistent with the underlying asset.
@@ -63,6 +96,7 @@ def get_funding_rates(current: bool = True) -> pd.DataFrame:
     return pd.DataFrame(columns=headers, data=fundings)
 
 
+@_cache_with_ttl(ttl=60)
 def get_lending_rates(current: bool = True) -> pd.DataFrame:
     """Decentralized Finance lending – or DeFi lending for short – allows users to supply cryptocurrencies
     in exchange for earning an annualized return.
@@ -92,6 +126,7 @@ def get_lending_rates(current: bool = True) -> pd.DataFrame:
     return pd.DataFrame(columns=headers, data=lendings)
 
 
+@_cache_with_ttl(ttl=60)
 def get_borrow_rates(current: bool = True) -> pd.DataFrame:
     """One aspect of Decentralized Finance (DeFi) is the ability to take out a loan on top cryptocurrencies at any time
     in an entirely permissionless fashion.By using smart contracts, borrowers are able to lock collateral to protect
@@ -1,7 +1,9 @@
 """DeFi Rate View"""
 __docformat__ = "numpy"
 
+import asyncio
 import os
+import sys
 from tabulate import tabulate
 from gamestonk_terminal.helper_funcs import export_data
 from gamestonk_terminal.cryptocurrency.defi import defirate_model
@@ -24,13 +26,12 @@ def display_funding_rates(top: int, current: bool = True, export: str = "") -> N
 
     df = defirate_model.get_funding_rates(current)
 
-    df_data = df.copy()
-
-    if gtff.USE_TABULATE_DF:
+    if gtff.USE_TABULATE_DF and sys.stdout.isatty():
+        df_head = df.head(top)
         print(
             tabulate(
-                df.head(top),
-                headers=df.columns,
+                df_head.values.tolist(),
+                headers=list(df_head.columns),
                 floatfmt=".2f",
                 showindex=False,
                 tablefmt="fancy_grid",
@@ -38,13 +39,13 @@ def display_funding_rates(top: int, current: bool = True, export: str = "") -> N
             "\n",
         )
     else:
-        print(df.to_string, "\n")
+        print(df.to_string(), "\n")
 
     export_data(
         export,
         os.path.dirname(os.path.abspath(__file__)),
         "funding",
-        df_data,
+        df,
     )
 
 
@@ -64,14 +65,15 @@ def display_lending_rates(top: int, current: bool = True, export: str = "") -> N
     """
 
     df = defirate_model.get_lending_rates(current)
-    df_data = df.copy()
-    df = df.loc[:, ~df.eq("–").all()]
+    df_data = df
+    df = df.iloc[:, (df.to_numpy() != "–").any(axis=0)]
 
-    if gtff.USE_TABULATE_DF:
+    if gtff.USE_TABULATE_DF and sys.stdout.isatty():
+        df_head = df.head(top)
         print(
             tabulate(
-                df.head(top),
-                headers=df.columns,
+                df_head.values.tolist(),
+                headers=list(df_head.columns),
                 floatfmt=".2f",
                 showindex=False,
                 tablefmt="fancy_grid",
@@ -79,7 +81,7 @@ def display_lending_rates(top: int, current: bool = True, export: str = "") -> N
             "\n",
         )
     else:
-        print(df.to_string, "\n")
+        print(df.to_string(), "\n")
 
     export_data(
         export,
@@ -106,14 +108,15 @@ def display_borrow_rates(top: int, current: bool = True, export: str = "") -> No
         Export dataframe data to csv,json,xlsx file
     """
     df = defirate_model.get_borrow_rates(current)
-    df_data = df.copy()
-    df = df.loc[:, ~df.eq("–").all()]
+    df_data = df
+    df = df.iloc[:, (df.to_numpy() != "–").any(axis=0)]
 
-    if gtff.USE_TABULATE_DF:
+    if gtff.USE_TABULATE_DF and sys.stdout.isatty():
+        df_head = df.head(top)
         print(
             tabulate(
-                df.head(top),
-                headers=df.columns,
+                df_head.values.tolist(),
+                headers=list(df_head.columns),
                 floatfmt=".2f",
                 showindex=False,
                 tablefmt="fancy_grid",
@@ -121,7 +124,7 @@ def display_borrow_rates(top: int, current: bool = True, export: str = "") -> No
             "\n",
         )
     else:
-        print(df.to_string, "\n")
+        print(df.to_string(), "\n")
 
     export_data(
         export,
@@ -129,3 +132,33 @@ def display_borrow_rates(top: int, current: bool = True, export: str = "") -> No
         "borrow",
         df_data,
     )
+
+
+async def display_all_rates(top: int, current: bool = True, export: str = "") -> None:
+    """Display funding, lending and borrow rates together, running the three
+    defirate.com scrapes concurrently on worker threads.
+    [Source: https://defirate.com/]
+
+    Parameters
+    ----------
+    top: int
+        Number of records to display per table
+    current: bool
+        If true displays current rate values. If false displays last 30 day average of rates.
+    export : str
+        Export dataframe data to csv,json,xlsx file
+    """
+
+    # Warms the model TTL cache, so the renders below reuse the scraped
+    # frames.  run_in_executor instead of asyncio.to_thread, which is 3.9+
+    # while this package still supports 3.8
+    loop = asyncio.get_event_loop()
+    await asyncio.gather(
+        loop.run_in_executor(None, defirate_model.get_funding_rates, current),
+        loop.run_in_executor(None, defirate_model.get_lending_rates, current),
+        loop.run_in_executor(None, defirate_model.get_borrow_rates, current),
+    )
+
+    display_funding_rates(top, current, export)
+    display_lending_rates(top, current, export)
+    display_borrow_rates(top, current, export)
@@ -37,5 +37,8 @@ ENABLE_THOUGHTS_DAY = strtobool(os.getenv("GTFF_ENABLE_THOUGHTS_DAY", "False"))
 # Quick exit for testing
 ENABLE_QUICK_EXIT = strtobool(os.getenv("GTFF_ENABLE_QUICK_EXIT", "False"))
 
+# Cache slow-moving vendor API responses on disk (helper_funcs.cache_to_file)
+USE_FILE_CACHE = strtobool(os.getenv("GTFF_USE_FILE_CACHE", "True"))
+
 # Open report as HTML, otherwise notebook
 OPEN_REPORT_AS_HTML = strtobool(os.getenv("GTFF_OPEN_REPORT_AS_HTML", "True"))
@@ -2,7 +2,10 @@
 __docformat__ = "numpy"
 import argparse
 import functools
+import hashlib
 import logging
+import pickle
+import time
 from typing import List
 from datetime import datetime, timedelta, time as Time
 import os
@@ -160,6 +163,7 @@ def check_proportion_range(num) -> float:
     return num
 
 
+@functools.lru_cache(maxsize=64)
 def valid_date(s: str) -> datetime:
     """Argparse type to check date is in valid format"""
     try:
@@ -549,10 +553,17 @@ def parse_known_args_and_warn(
     ns_parser:
         Namespace with parsed arguments
     """
-    parser.add_argument(
-        "-h", "--help", action="store_true", help="show this help message"
-    )
-    if export_allowed > NO_EXPORT:
+    # Parsers may be cached and passed in more than once; only add the shared
+    # arguments the first time around
+    if "-h" not in parser._option_string_actions:  # pylint: disable=protected-access
+        parser.add_argument(
+            "-h", "--help", action="store_true", help="show this help message"
+        )
+    if (
+        export_allowed > NO_EXPORT
+        # pylint: disable=protected-access
+        and "--export" not in parser._option_string_actions
+    ):
         choices_export = []
         help_export = "Does not export!"
 
@@ -586,7 +597,13 @@ def parse_known_args_and_warn(
         return None
 
     if ns_parser.help:
-        parser.print_help()
+        # Formatting help walks every action and wraps text; parsers are
+        # cached across calls, so format once and reuse the string
+        help_text = getattr(parser, "_cached_help", None)
+        if help_text is None:
+            help_text = parser.format_help()
+            parser._cached_help = help_text  # pylint: disable=protected-access
+        print(help_text)
         print("")
         return None
 
@@ -696,6 +713,73 @@ def plot_autoscale():
     return x, y
 
 
+def cache_to_file(endpoint: str, ttl_hours: int = 24):
+    """Cache a function's return value on disk, keyed by its arguments.
+
+    Meant for vendor API responses that stay stable for hours (e.g. quarterly
+    fundamentals), so repeating a command does not re-fetch the same payload.
+    Failed lookups (empty dataframes) are never written to disk, and any cache
+    I/O error falls back to calling the wrapped function.
+
+    The cache is skipped entirely when gtff.USE_FILE_CACHE is off (the test
+    suite disables it so mocked and recorded responses are always exercised),
+    and GTFF_FILE_CACHE_DIR overrides where entries are stored.
+
+    Parameters
+    ----------
+    endpoint : str
+        Sub-directory name identifying the cached endpoint
+    ttl_hours : int
+        Hours a cached entry stays valid, by default 24
+
+    Returns
+    -------
+    Callable
+        Decorator adding the on-disk cache to a function
+    """
+    def _cacheable(result) -> bool:
+        """Empty dataframes mean the fetch failed, so do not persist them"""
+        head = result[0] if isinstance(result, tuple) and result else result
+        if isinstance(head, pd.DataFrame):
+            return not head.empty
+        return result is not None
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not gtff.USE_FILE_CACHE:
+                return func(*args, **kwargs)
+            cache_dir = os.getenv("GTFF_FILE_CACHE_DIR") or os.path.join(
+                os.path.expanduser("~"), ".gamestonk_terminal", "cache"
+            )
+            key = hashlib.md5(
+                repr((endpoint, args, sorted(kwargs.items()))).encode()
+            ).hexdigest()
+            path = os.path.join(cache_dir, endpoint, f"{key}.pkl")
+            try:
+                if (
+                    os.path.isfile(path)
+                    and time.time() - os.path.getmtime(path) < ttl_hours * 3600
+                ):
+                    with open(path, "rb") as handle:
+                        return pickle.load(handle)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                pass
+            result = func(*args, **kwargs)
+            if _cacheable(result):
+                try:
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    with open(path, "wb") as handle:
+                        pickle.dump(result, handle)
+                except OSError:
+                    pass
+            return result
+
+        return wrapper
+
+    return decorator
+
+
 def get_last_time_market_was_open(dt):
     """Get last time the US market was open"""
     # Check if it is a weekend
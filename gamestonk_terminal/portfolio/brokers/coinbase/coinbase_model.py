@@ -1,6 +1,9 @@
 """Coinbase model"""
 __docformat__ = "numpy"
 
+import asyncio
+
+import aiohttp
 import pandas as pd
 import gamestonk_terminal.config_terminal as cfg
 from gamestonk_terminal.cryptocurrency.coinbase_helpers import (
@@ -9,6 +12,85 @@ from gamestonk_terminal.cryptocurrency.coinbase_helpers import (
     make_coinbase_request,
 )
 
+_COINBASE_API_URL = "https://api.pro.coinbase.com"
+
+# Empty-response schemas, so callers always get the expected columns back
+_ACCOUNTS_COLUMNS = ["id", "currency", "balance", "available", "hold"]
+_HISTORY_COLUMNS = ["id", "created_at", "amount", "balance", "type"]
+_DEPOSITS_COLUMNS = ["type", "created_at", "amount", "currency"]
+
+_auth = None
+
+
+def _get_auth() -> CoinbaseProAuth:
+    """Return the shared api credentials object, built on first use so import
+    does not require keys to be configured. [Source: Coinbase]
+
+    Returns
+    -------
+    CoinbaseProAuth
+        Api credentials for authenticated endpoints
+    """
+    global _auth  # pylint: disable=global-statement
+    if _auth is None:
+        _auth = CoinbaseProAuth(
+            cfg.API_COINBASE_KEY, cfg.API_COINBASE_SECRET, cfg.API_COINBASE_PASS_PHRASE
+        )
+    return _auth
+
+
+async def _fetch_last(
+    session: aiohttp.ClientSession, pair: str, auth_headers: dict
+) -> float:
+    """Fetch last price for given trading pair. [Source: Coinbase]
+
+    Parameters
+    ----------
+    session: aiohttp.ClientSession
+        Shared client session
+    pair: str
+        Trading pair of coins e.g BTC-USD
+    auth_headers: dict
+        CB-ACCESS signature headers for this request
+
+    Returns
+    -------
+    float
+        Last traded price for the pair
+    """
+    async with session.get(
+        f"{_COINBASE_API_URL}/products/{pair}/stats", headers=auth_headers
+    ) as response:
+        return float((await response.json())["last"])
+
+
+async def _gather_prices(pairs: list, auth: CoinbaseProAuth) -> list:
+    """Fetch last prices for all pairs concurrently. [Source: Coinbase]
+
+    Parameters
+    ----------
+    pairs: list
+        Trading pairs of coins e.g [BTC-USD, ETH-USD]
+    auth: CoinbaseProAuth
+        Api credentials used to sign every request
+
+    Returns
+    -------
+    list
+        Last traded price for every pair
+    """
+    async with aiohttp.ClientSession() as session:
+        return await asyncio.gather(
+            *(
+                _fetch_last(
+                    session,
+                    pair,
+                    auth.get_auth_headers("GET", f"/products/{pair}/stats"),
+                )
+                for pair in pairs
+            )
+        )
+
 
 def get_accounts(add_current_price: bool = True, currency: str = "USD") -> pd.DataFrame:
     """Get list of all your trading accounts. [Source: Coinbase]
@@ -40,39 +122,21 @@ def get_accounts(add_current_price: bool = True, currency: str = "USD") -> pd.Da
     pd.DataFrame
         DataFrame with all your trading accounts.
     """
-    auth = CoinbaseProAuth(
-        cfg.API_COINBASE_KEY, cfg.API_COINBASE_SECRET, cfg.API_COINBASE_PASS_PHRASE
-    )
+    auth = _get_auth()
     resp = make_coinbase_request("/accounts", auth=auth)
     if not resp:
-        return pd.DataFrame()
+        return pd.DataFrame(columns=_ACCOUNTS_COLUMNS)
 
     df = pd.DataFrame(resp)
-    df = df[df.balance.astype(float) > 0]
+    balance = pd.to_numeric(df["balance"], errors="coerce")
+    df = df[balance > 0].copy()
+    balance = balance[balance > 0]
     if add_current_price:
-        current_prices = []
-        for _, row in df.iterrows():
-            to_get = f"{row.currency}-{currency}"
-            current_prices.append(
-                float(
-                    make_coinbase_request(f"/products/{to_get}/stats", auth=auth)[
-                        "last"
-                    ]
-                )
-            )
-        df["current_price"] = current_prices
-        df[f"BalanceValue({currency})"] = df.current_price * df.balance.astype(float)
-        return df[
-            [
-                "id",
-                "currency",
-                "balance",
-                "available",
-                "hold",
-                f"BalanceValue({currency})",
-            ]
-        ]
-    return df[["id", "currency", "balance", "available", "hold"]]
+        pairs = [f"{coin}-{currency}" for coin in df.currency]
+        df["current_price"] = asyncio.run(_gather_prices(pairs, auth))
+        df[f"BalanceValue({currency})"] = df["current_price"].values * balance.values
+        return df[_ACCOUNTS_COLUMNS + [f"BalanceValue({currency})"]]
+    return df[_ACCOUNTS_COLUMNS]
 
 
 def get_account_history(account: str) -> pd.DataFrame:
@@ -106,26 +170,24 @@ def get_account_history(account: str) -> pd.DataFrame:
     pd.DataFrame
         DataFrame with account history.
     """
-    auth = CoinbaseProAuth(
-        cfg.API_COINBASE_KEY, cfg.API_COINBASE_SECRET, cfg.API_COINBASE_PASS_PHRASE
-    )
+    auth = _get_auth()
 
     account = _check_account_validity(account)
     if not account:
-        return pd.DataFrame()
+        return pd.DataFrame(columns=_HISTORY_COLUMNS)
 
     resp = make_coinbase_request(f"/accounts/{account}/holds", auth=auth)
     if not resp:
-        return pd.DataFrame()
+        return pd.DataFrame(columns=_HISTORY_COLUMNS)
     df = pd.json_normalize(resp)
-
-    try:
-        df.columns = [
-            col.replace("details.", "") if "details" in col else col
+    df.rename(
+        columns={
+            col: col[len("details.") :]
             for col in df.columns
-        ]
-    except Exception as e:
-        print(e)
+            if col.startswith("details.")
+        },
+        inplace=True,
+    )
 
     return df
 
@@ -163,9 +225,7 @@ def get_orders() -> pd.DataFrame:
         Open orders in your account
     """
 
-    auth = CoinbaseProAuth(
-        cfg.API_COINBASE_KEY, cfg.API_COINBASE_SECRET, cfg.API_COINBASE_PASS_PHRASE
-    )
+    auth = _get_auth()
     resp = make_coinbase_request("/orders", auth=auth)
     if not resp:
         return pd.DataFrame(
@@ -198,18 +258,13 @@ def get_deposits(deposit_type: str = "deposit") -> pd.DataFrame:
         List of deposits
     """
 
-    auth = CoinbaseProAuth(
-        cfg.API_COINBASE_KEY, cfg.API_COINBASE_SECRET, cfg.API_COINBASE_PASS_PHRASE
-    )
+    auth = _get_auth()
+    if deposit_type not in ("internal_deposit", "deposit"):
+        deposit_type = "deposit"
     params = {"type": deposit_type}
-    if deposit_type not in ["internal_deposit", "deposit"]:
-        params["type"] = "deposit"
     resp = make_coinbase_request("/transfers", auth=auth, params=params)
     if not resp:
-        return pd.DataFrame()
-
-    if isinstance(resp, tuple):
-        resp = resp[0]
+        return pd.DataFrame(columns=_DEPOSITS_COLUMNS)
 
     # pylint:disable=no-else-return
     if deposit_type == "deposit":
@@ -8,7 +8,7 @@ import requests
 from alpha_vantage.fundamentaldata import FundamentalData
 import pandas as pd
 from gamestonk_terminal.stocks.fundamental_analysis.fa_helper import clean_df_index
-from gamestonk_terminal.helper_funcs import long_number_format
+from gamestonk_terminal.helper_funcs import cache_to_file, long_number_format
 from gamestonk_terminal import config_terminal as cfg
 
 
@@ -202,6 +202,7 @@ def get_balance_sheet(
     return pd.DataFrame()
 
 
+@cache_to_file("av_cash_flow")
 def get_cash_flow(ticker: str, number: int, quarterly: bool = False) -> pd.DataFrame:
     """Get cash flows for company
 
@@ -241,6 +242,7 @@ def get_cash_flow(ticker: str, number: int, quarterly: bool = False) -> pd.DataF
     return pd.DataFrame()
 
 
+@cache_to_file("av_earnings")
 def get_earnings(ticker: str, quarterly: bool = False) -> pd.DataFrame:
     """Get earnings calendar for ticker
 
@@ -300,6 +302,7 @@ def get_earnings(ticker: str, quarterly: bool = False) -> pd.DataFrame:
     return pd.DataFrame()
 
 
+@cache_to_file("av_fraud")
 def get_fraud_ratios(ticker: str) -> Tuple[Dict[str, float], float]:
     """Get fraud ratios based on fundamentals
 
@@ -3,25 +3,14 @@ __docformat__ = "numpy"
 # pylint:disable=too-many-lines
 
 import argparse
-import difflib
+import functools
+import logging
+from collections import deque
 from datetime import datetime, timedelta
-from typing import List, Union
+from typing import Callable, Dict, List, Union
 from prompt_toolkit.completion import NestedCompleter
 from colorama import Style
 
-from gamestonk_terminal.stocks.fundamental_analysis.financial_modeling_prep import (
-    fmp_controller,
-    fmp_view,
-)
-from gamestonk_terminal.stocks.fundamental_analysis import (
-    eclect_us_view,
-    finviz_view,
-    yahoo_finance_view,
-    av_view,
-    business_insider_view,
-    dcf_view,
-    market_watch_view,
-)
 from gamestonk_terminal import feature_flags as gtff
 from gamestonk_terminal.helper_funcs import (
     EXPORT_ONLY_RAW_DATA_ALLOWED,
@@ -34,27 +23,134 @@ from gamestonk_terminal.helper_funcs import (
 )
 from gamestonk_terminal.stocks import stocks_helper
 from gamestonk_terminal.menu import session
+import gamestonk_terminal.config_terminal as config_terminal
 
 # pylint: disable=inconsistent-return-statements
 
+logger = logging.getLogger(__name__)
+
+# Shorthand inputs normalized to their full command in a single lookup
+_ALIASES = {
+    "..": "quit",
+    "q": "quit",
+    "?": "help",
+    "h": "help",
+    "r": "reset",
+}
+
+
+def _fast_parse(other_args: List[str], spec: Dict[str, tuple]):
+    """Parse a small flag-only argument list without running argparse.
+
+    Parameters
+    ----------
+    other_args : List[str]
+        Command arguments to parse
+    spec : Dict[str, tuple]
+        Option string mapped to (dest, converter, default), where a None
+        converter marks a boolean flag
+
+    Returns
+    -------
+    Union[argparse.Namespace, None]
+        Parsed arguments, or None when the input is not covered by the spec
+        and the caller must fall back to the full argparse path
+    """
+    if "-h" in other_args or "--help" in other_args:
+        return None
+    values = {dest: default for dest, _, default in spec.values()}
+    i = 0
+    n_args = len(other_args)
+    while i < n_args:
+        entry = spec.get(other_args[i])
+        if entry is None:
+            return None
+        dest, converter, _ = entry
+        if converter is None:
+            values[dest] = True
+            i += 1
+        else:
+            if i + 1 >= n_args:
+                return None
+            try:
+                values[dest] = converter(other_args[i + 1])
+            except (ValueError, argparse.ArgumentTypeError):
+                # Let argparse produce the usual error message
+                return None
+            i += 2
+    return argparse.Namespace(**values)
+
+
+# Specs for _fast_parse, covering the flags the hot commands accept
+_CASH_SPEC = {
+    "-l": ("limit", check_positive, 1),
+    "--limit": ("limit", check_positive, 1),
+    "-q": ("b_quarter", None, False),
+    "--quarter": ("b_quarter", None, False),
+    "--export": ("export", str, ""),
+}
+_EARNINGS_SPEC = {
+    "-q": ("b_quarter", None, False),
+    "--quarter": ("b_quarter", None, False),
+    "-l": ("limit", check_positive, 5),
+    "--limit": ("limit", check_positive, 5),
+    "--export": ("export", str, ""),
+}
+_FRAUD_SPEC = {
+    "--export": ("export", str, ""),
+}
+_DCF_SPEC = {
+    "-a": ("audit", None, False),
+    "--audit": ("audit", None, False),
+    "--export": ("export", str, ""),
+}
+_WARNINGS_SPEC = {
+    "-d": ("b_debug", None, False),
+    "--debug": ("b_debug", None, False),
+    "--export": ("export", str, ""),
+}
+
+# Built once at import; the fraud parser help is ~1.5 KB of static text
+_FRAUD_DESCRIPTION = (
+    "M-score:\n------------------------------------------------\n"
+    "The Beneish model is a statistical model that uses financial ratios calculated with"
+    " accounting data of a specific company in order to check if it is likely (high"
+    " probability) that the reported earnings of the company have been manipulated."
+    " A score of -5 to -2.22 indicated a low chance of fraud, a score of -2.22 to -1.78"
+    " indicates a moderate change of fraud, and a score above -1.78 indicated a high"
+    " chance of fraud.[Source: Wikipedia]\n\nDSRI:\nDays Sales in Receivables Index"
+    " gauges whether receivables and revenue are out of balance, a large number is"
+    " expected to be associated with a higher likelihood that revenues and earnings are"
+    " overstated.\n\nGMI:\nGross Margin Index shows if gross margins are deteriorating."
+    " Research suggests that firms with worsening gross margin are more likely to engage"
+    " in earnings management, therefore there should be a positive correlation between"
+    " GMI and probability of earnings management.\n\nAQI:\nAsset Quality Index measures"
+    " the proportion of assets where potential benefit is less certain. A positive"
+    " relation between AQI and earnings manipulation is expected.\n\nSGI:\nSales Growth"
+    " Index shows the amount of growth companies are having. Higher growth companies are"
+    " more likely to commit fraud so there should be a positive relation between SGI and"
+    " earnings management.\n\nDEPI:\nDepreciation Index is the ratio for the rate of"
+    " depreciation. A DEPI greater than 1 shows that the depreciation rate has slowed and"
+    " is positively correlated with earnings management.\n\nSGAI:\nSales General and"
+    " Administrative Expenses Index measures the change in SG&A over sales. There should"
+    " be a positive relationship between SGAI and earnings management.\n\nLVGI:\nLeverage"
+    " Index represents change in leverage. A LVGI greater than one indicates a lower"
+    " change of fraud.\n\nTATA: \nTotal Accruals to Total Assets is a proxy for the"
+    " extent that cash underlies earnings. A higher number is associated with a higher"
+    " likelihood of manipulation.\n\n\n"
+    "Z-score:\n------------------------------------------------\n"
+    "The Zmijewski Score is a bankruptcy model used to predict a firm's bankruptcy in two"
+    " years. The ratio uses in the Zmijewski score were determined by probit analysis ("
+    "think of probit as probability unit). In this case, scores less than .5 represent a"
+    " higher probability of default. One of the criticisms that Zmijewski made was that"
+    " other bankruptcy scoring models oversampled distressed firms and favored situations"
+    " with more complete data.[Source: YCharts]"
+)
+
 
 class FundamentalAnalysisController:
     """Fundamental Analysis Controller."""
 
-    CHOICES = [
-        "cls",
-        "home",
-        "h",
-        "?",
-        "help",
-        "q",
-        "quit",
-        "..",
-        "exit",
-        "r",
-        "reset",
-    ]
-
     CHOICES_COMMANDS = [
         "load",
         "analysis",
@@ -73,12 +169,10 @@ class FundamentalAnalysisController:
         "hq",
         "overview",
         "key",
-        "income",
-        "balance",
-        "cash",
         "divs",
         "earnings",
         "fraud",
+        "all",
     ]
     # TODO: These commands either don't work or work inconsistently.
     # They have been excluded from the CHOICES list until they are fixed:
@@ -88,8 +182,30 @@ class FundamentalAnalysisController:
         "fmp",
     ]
 
-    CHOICES += CHOICES_COMMANDS
-    CHOICES += CHOICES_MENUS
+    CHOICES = frozenset(
+        (
+            "cls",
+            "home",
+            "h",
+            "?",
+            "help",
+            "q",
+            "quit",
+            "..",
+            "exit",
+            "r",
+            "reset",
+            *CHOICES_COMMANDS,
+            *CHOICES_MENUS,
+        )
+    )
+
+    # Command parsers are configuration-only, so they are built once on first
+    # use and shared across instances instead of rebuilt per invocation
+    _PARSERS: Dict[str, argparse.ArgumentParser] = {}
+
+    # Command name -> unbound call_* method, populated after the class body
+    _DISPATCH: Dict[str, Callable] = {}
 
     def __init__(
         self,
@@ -118,26 +234,24 @@ class FundamentalAnalysisController:
         self.start = start
         self.interval = interval
         self.suffix = suffix
+        self._help_text: Union[None, str] = None
 
         self.fa_parser = argparse.ArgumentParser(add_help=False, prog="fa")
         self.fa_parser.add_argument(
             "cmd",
             choices=self.CHOICES,
         )
-        self.completer: Union[None, NestedCompleter] = None
-        if session and gtff.USE_PROMPT_TOOLKIT:
-            choices: dict = {c: {} for c in self.CHOICES}
-            choices["load"]["-i"] = {c: {} for c in stocks_helper.INTERVALS}
-            choices["load"]["-s"] = {c: {} for c in stocks_helper.SOURCES}
-            self.completer = NestedCompleter.from_nested_dict(choices)
-
-        if queue:
-            self.queue = queue
-        else:
-            self.queue = list()
+        self.completer = _COMPLETER
+
+        # deque so the menu loop consumes commands with O(1) popleft instead
+        # of re-slicing a list
+        self.queue = deque(queue) if queue else deque()
 
     def print_help(self):
         """Print help."""
+        if self._help_text is not None:
+            print(self._help_text)
+            return
         newline = "\n"
         help_text = f"""
 Ticker: {self.ticker}
@@ -164,9 +278,11 @@ Alpha Vantage:
     cash          cash flow of the company
     earnings      earnings dates and reported EPS
     fraud         key fraud ratios
+    all           cash, earnings and fraud fetched in parallel
 Other Sources:
 >   fmp           profile,quote,enterprise,dcf,income,ratios,growth from FMP{Style.RESET_ALL}
         """
+        self._help_text = help_text
         print(help_text)
         # No longer used, but keep for future:
         # print("")
@@ -195,47 +311,48 @@ Other Sources:
 
         # Navigation slash is being used
         if "/" in an_input:
-            actions = an_input.split("/")
+            first, _, remaining = an_input.partition("/")
 
-            # Absolute path is specified
-            if not actions[0]:
-                an_input = "home"
-            # Relative path so execute first instruction
-            else:
-                an_input = actions[0]
+            # An absolute path starts with the slash itself
+            an_input = first or "home"
 
-            # Add all instructions to the queue
-            for cmd in actions[1:][::-1]:
-                if cmd:
-                    self.queue.insert(0, cmd)
+            # Add all remaining instructions to the queue
+            if remaining:
+                self.queue.extendleft(
+                    cmd for cmd in reversed(remaining.split("/")) if cmd
+                )
 
-        (known_args, other_args) = self.fa_parser.parse_known_args(an_input.split())
+        # A single known command without arguments does not need argparse
+        head, _, rest = an_input.partition(" ")
+        if not rest and head in self.CHOICES:
+            cmd = head
+            other_args: List[str] = []
+        else:
+            (known_args, other_args) = self.fa_parser.parse_known_args(
+                an_input.split()
+            )
+            cmd = known_args.cmd
 
         # Redirect commands to their correct functions
-        if known_args.cmd:
-            if known_args.cmd in ("..", "q"):
-                known_args.cmd = "quit"
-            elif known_args.cmd in ("?", "h"):
-                known_args.cmd = "help"
-            elif known_args.cmd == "r":
-                known_args.cmd = "reset"
-
-        getattr(
-            self,
-            "call_" + known_args.cmd,
-            lambda _: "Command not recognized!",
-        )(other_args)
+        if cmd:
+            cmd = _ALIASES.get(cmd, cmd)
+
+        self._DISPATCH.get(cmd, FundamentalAnalysisController._unknown)(
+            self, other_args
+        )
 
         return self.queue
 
+    def _unknown(self, _):
+        """Process commands that are not recognized."""
+
     def call_cls(self, _):
         """Process cls command."""
         system_clear()
 
     def call_home(self, _):
         """Process home command."""
-        self.queue.insert(0, "quit")
-        self.queue.insert(0, "quit")
+        self.queue.extendleft(("quit", "quit"))
 
     def call_help(self, _):
         """Process help command."""
@@ -244,70 +361,75 @@ Other Sources:
     def call_quit(self, _):
         """Process quit menu command."""
         print("")
-        self.queue.insert(0, "quit")
+        self.queue.appendleft("quit")
 
     def call_exit(self, _):
         """Process exit terminal command."""
-        self.queue.insert(0, "quit")
-        self.queue.insert(0, "quit")
-        self.queue.insert(0, "quit")
+        self.queue.extendleft(("quit", "quit", "quit"))
 
     def call_reset(self, _):
         """Process reset command."""
-        self.queue.insert(0, "fa")
-        if self.ticker:
-            self.queue.insert(0, f"load {self.ticker}")
-        self.queue.insert(0, "stocks")
-        self.queue.insert(0, "reset")
-        self.queue.insert(0, "quit")
-        self.queue.insert(0, "quit")
+        self.queue.extendleft(
+            reversed(
+                [
+                    "quit",
+                    "quit",
+                    "reset",
+                    "stocks",
+                    *([f"load {self.ticker}"] if self.ticker else []),
+                    "fa",
+                ]
+            )
+        )
 
     @try_except
     def call_load(self, other_args: List[str]):
         """Process load command."""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="load",
-            description="Load stock ticker to perform analysis on. When the data source "
-            + "is 'yf', an Indian ticker can be loaded by using '.NS' at the end, e.g. "
-            + "'SBIN.NS'. See available market in"
-            + " https://help.yahoo.com/kb/exchanges-data-providers-yahoo-finance-sln2310.html.",
-        )
-        parser.add_argument(
-            "-t",
-            "--ticker",
-            action="store",
-            dest="ticker",
-            required="-h" not in other_args,
-            help="Stock ticker",
-        )
-        parser.add_argument(
-            "-s",
-            "--start",
-            type=valid_date,
-            default=(datetime.now() - timedelta(days=366)).strftime("%Y-%m-%d"),
-            dest="start",
-            help="The starting date (format YYYY-MM-DD) of the stock",
-        )
-        parser.add_argument(
-            "-i",
-            "--interval",
-            action="store",
-            dest="interval",
-            type=int,
-            default=1440,
-            choices=stocks_helper.INTERVALS,
-            help="Intraday stock minutes",
-        )
-        parser.add_argument(
-            "--source",
-            action="store",
-            dest="source",
-            choices=stocks_helper.SOURCES,
-            default="yf",
-            help="Source of historical data.",
-        )
+        parser = self._PARSERS.get("load")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="load",
+                description="Load stock ticker to perform analysis on. When the data source "
+                + "is 'yf', an Indian ticker can be loaded by using '.NS' at the end, e.g. "
+                + "'SBIN.NS'. See available market in"
+                + " https://help.yahoo.com/kb/exchanges-data-providers-yahoo-finance-sln2310.html.",
+            )
+            parser.add_argument(
+                "-t",
+                "--ticker",
+                action="store",
+                dest="ticker",
+                help="Stock ticker",
+            )
+            parser.add_argument(
+                "-s",
+                "--start",
+                type=valid_date,
+                default=None,
+                dest="start",
+                help="The starting date (format YYYY-MM-DD) of the stock. Defaults to a year ago.",
+            )
+            parser.add_argument(
+                "-i",
+                "--interval",
+                action="store",
+                dest="interval",
+                type=int,
+                default=1440,
+                choices=stocks_helper.INTERVALS,
+                help="Intraday stock minutes",
+            )
+            parser.add_argument(
+                "--source",
+                action="store",
+                dest="source",
+                choices=stocks_helper.SOURCES,
+                default="yf",
+                help="Source of historical data.",
+            )
+            self._PARSERS["load"] = parser
         # For the case where a user uses: 'load BB'
         if other_args and "-t" not in other_args and "-h" not in other_args:
             other_args.insert(0, "-t")
@@ -316,53 +438,75 @@ Other Sources:
             parser, other_args, EXPORT_ONLY_RAW_DATA_ALLOWED
         )
         if ns_parser:
+            if not ns_parser.ticker:
+                print("A ticker is required, e.g. 'load TSLA'\n")
+                return
+            # The default start date cannot live on the cached parser as it
+            # would freeze at the first call
+            start = ns_parser.start or valid_date(
+                (datetime.now() - timedelta(days=366)).strftime("%Y-%m-%d")
+            )
             df_stock_candidate = stocks_helper.load(
                 ticker=ns_parser.ticker,
-                start=ns_parser.start,
+                start=start,
                 interval=ns_parser.interval,
                 source=ns_parser.source,
             )
 
             if not df_stock_candidate.empty:
-                self.start = ns_parser.start
+                self.start = start
                 self.interval = str(ns_parser.interval) + "min"
-                if "." in ns_parser.ticker:
-                    self.ticker = ns_parser.ticker.upper().split(".")[0]
-                else:
-                    self.ticker = ns_parser.ticker.upper()
+                # partition returns the whole string when there is no dot
+                self.ticker = ns_parser.ticker.upper().partition(".")[0]
+                # Help header shows the ticker, so drop the cached render
+                self._help_text = None
 
     @try_except
     def call_analysis(self, other_args: List[str]):
         """Process analysis command."""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="analysis",
-            description="""Display analysis of SEC filings based on NLP model. [Source: https://eclect.us]""",
-        )
+        parser = self._PARSERS.get("analysis")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="analysis",
+                description="""Display analysis of SEC filings based on NLP model. [Source: https://eclect.us]""",
+            )
+            self._PARSERS["analysis"] = parser
         ns_parser = parse_known_args_and_warn(
             parser, other_args, export_allowed=EXPORT_ONLY_RAW_DATA_ALLOWED
         )
         if ns_parser:
+            # pylint: disable=import-outside-toplevel
+            from gamestonk_terminal.stocks.fundamental_analysis import eclect_us_view
+
             eclect_us_view.display_analysis(self.ticker)
 
     @try_except
     def call_mgmt(self, other_args: List[str]):
         """Process mgmt command."""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="mgmt",
-            description="""
-                Print management team. Namely: Name, Title, Information from google and
-                (potentially) Insider Activity page. [Source: Business Insider]
-            """,
-        )
+        parser = self._PARSERS.get("mgmt")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="mgmt",
+                description="""
+                    Print management team. Namely: Name, Title, Information from google and
+                    (potentially) Insider Activity page. [Source: Business Insider]
+                """,
+            )
+            self._PARSERS["mgmt"] = parser
 
         ns_parser = parse_known_args_and_warn(
             parser, other_args, export_allowed=EXPORT_ONLY_RAW_DATA_ALLOWED
         )
         if ns_parser:
+            # pylint: disable=import-outside-toplevel
+            from gamestonk_terminal.stocks.fundamental_analysis import (
+                business_insider_view,
+            )
+
             business_insider_view.display_management(
                 ticker=self.ticker, export=ns_parser.export
             )
@@ -370,203 +514,273 @@ Other Sources:
     @try_except
     def call_data(self, other_args: List[str]):
         """Process screener command."""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="data",
-            description="""
-                Print several metrics about the company. The following fields are expected:
-                Company, Sector, Industry, Country, Index, P/E, EPS (ttm), Insider Own,
-                Shs Outstand, Perf Week, Market Cap, Forward P/E, EPS next Y, Insider Trans,
-                Shs Float, Perf Month, Income, EPS next Q, Inst Own, Short Float, Perf Quarter,
-                Sales, P/S, EPS this Y, Inst Trans, Short Ratio, Perf Half Y, Book/sh, P/B, ROA,
-                Target Price, Perf Year, Cash/sh, P/C, ROE, 52W Range, Perf YTD, P/FCF, EPS past 5Y,
-                ROI, 52W High, Beta, Quick Ratio, Sales past 5Y, Gross Margin, 52W Low, ATR,
-                Employees, Current Ratio, Sales Q/Q, Operating Margin, RSI (14), Volatility, Optionable,
-                Debt/Eq, EPS Q/Q, Profit Margin, Rel Volume, Prev Close, Shortable, LT Debt/Eq,
-                Earnings, Payout, Avg Volume, Price, Recomendation, SMA20, SMA50, SMA200, Volume, Change.
-                [Source: Finviz]
-            """,
-        )
+        parser = self._PARSERS.get("data")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="data",
+                description="""
+                    Print several metrics about the company. The following fields are expected:
+                    Company, Sector, Industry, Country, Index, P/E, EPS (ttm), Insider Own,
+                    Shs Outstand, Perf Week, Market Cap, Forward P/E, EPS next Y, Insider Trans,
+                    Shs Float, Perf Month, Income, EPS next Q, Inst Own, Short Float, Perf Quarter,
+                    Sales, P/S, EPS this Y, Inst Trans, Short Ratio, Perf Half Y, Book/sh, P/B, ROA,
+                    Target Price, Perf Year, Cash/sh, P/C, ROE, 52W Range, Perf YTD, P/FCF, EPS past 5Y,
+                    ROI, 52W High, Beta, Quick Ratio, Sales past 5Y, Gross Margin, 52W Low, ATR,
+                    Employees, Current Ratio, Sales Q/Q, Operating Margin, RSI (14), Volatility, Optionable,
+                    Debt/Eq, EPS Q/Q, Profit Margin, Rel Volume, Prev Close, Shortable, LT Debt/Eq,
+                    Earnings, Payout, Avg Volume, Price, Recomendation, SMA20, SMA50, SMA200, Volume, Change.
+                    [Source: Finviz]
+                """,
+            )
+            self._PARSERS["data"] = parser
 
         ns_parser = parse_known_args_and_warn(
             parser, other_args, export_allowed=EXPORT_ONLY_RAW_DATA_ALLOWED
         )
         if ns_parser:
+            # pylint: disable=import-outside-toplevel
+            from gamestonk_terminal.stocks.fundamental_analysis import finviz_view
+
             finviz_view.display_screen_data(self.ticker)
 
     @try_except
     def call_score(self, other_args: List[str]):
         """Process score command."""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="score",
-            description="""
-                Value investing tool based on Warren Buffett, Joseph Piotroski
-                and Benjamin Graham thoughts [Source: FMP]
-                """,
-        )
+        parser = self._PARSERS.get("score")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="score",
+                description="""
+                    Value investing tool based on Warren Buffett, Joseph Piotroski
+                    and Benjamin Graham thoughts [Source: FMP]
+                    """,
+            )
+            self._PARSERS["score"] = parser
         ns_parser = parse_known_args_and_warn(
             parser, other_args, EXPORT_ONLY_RAW_DATA_ALLOWED
         )
         if ns_parser:
+            # pylint: disable=import-outside-toplevel
+            from gamestonk_terminal.stocks.fundamental_analysis.financial_modeling_prep import (
+                fmp_view,
+            )
+
             fmp_view.valinvest_score(self.ticker)
 
     @try_except
     def call_info(self, other_args: List[str]):
         """Process info command."""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="info",
-            description="""
-                Print information about the company. The following fields are expected:
-                Zip, Sector, Full time employees, Long business summary, City, Phone, State, Country,
-                Website, Max age, Address, Industry, Previous close, Regular market open, Two hundred
-                day average, Payout ratio, Regular market day high, Average daily volume 10 day,
-                Regular market previous close, Fifty day average, Open, Average volume 10 days, Beta,
-                Regular market day low, Price hint, Currency, Trailing PE, Regular market volume,
-                Market cap, Average volume, Price to sales trailing 12 months, Day low, Ask, Ask size,
-                Volume, Fifty two week high, Forward PE, Fifty two week low, Bid, Tradeable, Bid size,
-                Day high, Exchange, Short name, Long name, Exchange timezone name, Exchange timezone
-                short name, Is esg populated, Gmt off set milliseconds, Quote type, Symbol, Message
-                board id, Market, Enterprise to revenue, Profit margins, Enterprise to ebitda, 52 week
-                change, Forward EPS, Shares outstanding, Book value, Shares short, Shares percent
-                shares out, Last fiscal year end, Held percent institutions, Net income to common,
-                Trailing EPS, Sand p52 week change, Price to book, Held percent insiders, Next fiscal
-                year end, Most recent quarter, Short ratio, Shares short previous month date, Float
-                shares, Enterprise value, Last split date, Last split factor, Earnings quarterly growth,
-                Date short interest, PEG ratio, Short percent of float, Shares short prior month,
-                Regular market price, Logo_url. [Source: Yahoo Finance]
-            """,
-        )
+        parser = self._PARSERS.get("info")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="info",
+                description="""
+                    Print information about the company. The following fields are expected:
+                    Zip, Sector, Full time employees, Long business summary, City, Phone, State, Country,
+                    Website, Max age, Address, Industry, Previous close, Regular market open, Two hundred
+                    day average, Payout ratio, Regular market day high, Average daily volume 10 day,
+                    Regular market previous close, Fifty day average, Open, Average volume 10 days, Beta,
+                    Regular market day low, Price hint, Currency, Trailing PE, Regular market volume,
+                    Market cap, Average volume, Price to sales trailing 12 months, Day low, Ask, Ask size,
+                    Volume, Fifty two week high, Forward PE, Fifty two week low, Bid, Tradeable, Bid size,
+                    Day high, Exchange, Short name, Long name, Exchange timezone name, Exchange timezone
+                    short name, Is esg populated, Gmt off set milliseconds, Quote type, Symbol, Message
+                    board id, Market, Enterprise to revenue, Profit margins, Enterprise to ebitda, 52 week
+                    change, Forward EPS, Shares outstanding, Book value, Shares short, Shares percent
+                    shares out, Last fiscal year end, Held percent institutions, Net income to common,
+                    Trailing EPS, Sand p52 week change, Price to book, Held percent insiders, Next fiscal
+                    year end, Most recent quarter, Short ratio, Shares short previous month date, Float
+                    shares, Enterprise value, Last split date, Last split factor, Earnings quarterly growth,
+                    Date short interest, PEG ratio, Short percent of float, Shares short prior month,
+                    Regular market price, Logo_url. [Source: Yahoo Finance]
+                """,
+            )
+            self._PARSERS["info"] = parser
         ns_parser = parse_known_args_and_warn(
             parser, other_args, EXPORT_ONLY_RAW_DATA_ALLOWED
         )
         if ns_parser:
+            # pylint: disable=import-outside-toplevel
+            from gamestonk_terminal.stocks.fundamental_analysis import (
+                yahoo_finance_view,
+            )
+
             yahoo_finance_view.display_info(self.ticker)
 
     @try_except
     def call_shrs(self, other_args: List[str]):
         """Process shrs command."""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="shrs",
-            description="""Print Major, institutional and mutualfunds shareholders.
-            [Source: Yahoo Finance]""",
-        )
+        parser = self._PARSERS.get("shrs")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="shrs",
+                description="""Print Major, institutional and mutualfunds shareholders.
+                [Source: Yahoo Finance]""",
+            )
+            self._PARSERS["shrs"] = parser
         ns_parser = parse_known_args_and_warn(
             parser, other_args, EXPORT_ONLY_RAW_DATA_ALLOWED
         )
 
         if ns_parser:
+            # pylint: disable=import-outside-toplevel
+            from gamestonk_terminal.stocks.fundamental_analysis import (
+                yahoo_finance_view,
+            )
+
             yahoo_finance_view.display_shareholders(self.ticker)
 
     @try_except
     def call_sust(self, other_args: List[str]):
         """Process sust command."""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="sust",
-            description="""
-                Print sustainability values of the company. The following fields are expected:
-                Palmoil, Controversialweapons, Gambling, Socialscore, Nuclear, Furleather, Alcoholic,
-                Gmo, Catholic, Socialpercentile, Peercount, Governancescore, Environmentpercentile,
-                Animaltesting, Tobacco, Total ESG, Highestcontroversy, ESG Performance, Coal, Pesticides,
-                Adult, Percentile, Peergroup, Smallarms, Environmentscore, Governancepercentile,
-                Militarycontract. [Source: Yahoo Finance]
-            """,
-        )
+        parser = self._PARSERS.get("sust")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="sust",
+                description="""
+                    Print sustainability values of the company. The following fields are expected:
+                    Palmoil, Controversialweapons, Gambling, Socialscore, Nuclear, Furleather, Alcoholic,
+                    Gmo, Catholic, Socialpercentile, Peercount, Governancescore, Environmentpercentile,
+                    Animaltesting, Tobacco, Total ESG, Highestcontroversy, ESG Performance, Coal, Pesticides,
+                    Adult, Percentile, Peergroup, Smallarms, Environmentscore, Governancepercentile,
+                    Militarycontract. [Source: Yahoo Finance]
+                """,
+            )
+            self._PARSERS["sust"] = parser
         ns_parser = parse_known_args_and_warn(
             parser, other_args, EXPORT_ONLY_RAW_DATA_ALLOWED
         )
         if ns_parser:
+            # pylint: disable=import-outside-toplevel
+            from gamestonk_terminal.stocks.fundamental_analysis import (
+                yahoo_finance_view,
+            )
+
             yahoo_finance_view.display_sustainability(self.ticker)
 
     @try_except
     def call_cal(self, other_args: List[str]):
         """Process cal command."""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="cal",
-            description="""
-                Calendar earnings of the company. Including revenue and earnings estimates.
-                [Source: Yahoo Finance]
-            """,
-        )
+        parser = self._PARSERS.get("cal")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="cal",
+                description="""
+                    Calendar earnings of the company. Including revenue and earnings estimates.
+                    [Source: Yahoo Finance]
+                """,
+            )
+            self._PARSERS["cal"] = parser
         ns_parser = parse_known_args_and_warn(
             parser, other_args, EXPORT_ONLY_RAW_DATA_ALLOWED
         )
         if ns_parser:
+            # pylint: disable=import-outside-toplevel
+            from gamestonk_terminal.stocks.fundamental_analysis import (
+                yahoo_finance_view,
+            )
+
             yahoo_finance_view.display_calendar_earnings(ticker=self.ticker)
 
     @try_except
     def call_web(self, other_args: List[str]):
         """Process web command."""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="web",
-            description="""
-                Opens company's website. [Source: Yahoo Finance]
-            """,
-        )
+        parser = self._PARSERS.get("web")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="web",
+                description="""
+                    Opens company's website. [Source: Yahoo Finance]
+                """,
+            )
+            self._PARSERS["web"] = parser
         ns_parser = parse_known_args_and_warn(
             parser, other_args, EXPORT_ONLY_RAW_DATA_ALLOWED
         )
         if ns_parser:
+            # pylint: disable=import-outside-toplevel
+            from gamestonk_terminal.stocks.fundamental_analysis import (
+                yahoo_finance_view,
+            )
+
             yahoo_finance_view.open_web(self.ticker)
 
     @try_except
     def call_hq(self, other_args: List[str]):
         """Process hq command."""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="hq",
-            description="""
-                Opens in Google Maps HQ location of the company. [Source: Yahoo Finance]
-            """,
-        )
+        parser = self._PARSERS.get("hq")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="hq",
+                description="""
+                    Opens in Google Maps HQ location of the company. [Source: Yahoo Finance]
+                """,
+            )
+            self._PARSERS["hq"] = parser
         ns_parser = parse_known_args_and_warn(
             parser, other_args, EXPORT_ONLY_RAW_DATA_ALLOWED
         )
         if ns_parser:
+            # pylint: disable=import-outside-toplevel
+            from gamestonk_terminal.stocks.fundamental_analysis import (
+                yahoo_finance_view,
+            )
+
             yahoo_finance_view.open_headquarters_map(self.ticker)
 
     @try_except
     def call_divs(self, other_args: List[str]):
         """Process divs command."""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="divs",
-            description="Historical dividends for a company",
-        )
-        parser.add_argument(
-            "-l",
-            "--limit",
-            dest="limit",
-            type=check_positive,
-            default=16,
-            help="Number of previous dividends to show",
-        )
-        parser.add_argument(
-            "-p",
-            "--plot",
-            dest="plot",
-            default=False,
-            action="store_true",
-            help="Plots changes in dividend over time",
-        )
+        parser = self._PARSERS.get("divs")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="divs",
+                description="Historical dividends for a company",
+            )
+            parser.add_argument(
+                "-l",
+                "--limit",
+                dest="limit",
+                type=check_positive,
+                default=16,
+                help="Number of previous dividends to show",
+            )
+            parser.add_argument(
+                "-p",
+                "--plot",
+                dest="plot",
+                default=False,
+                action="store_true",
+                help="Plots changes in dividend over time",
+            )
+            self._PARSERS["divs"] = parser
         ns_parser = parse_known_args_and_warn(
             parser, other_args, export_allowed=EXPORT_ONLY_RAW_DATA_ALLOWED
         )
         if ns_parser:
+            # pylint: disable=import-outside-toplevel
+            from gamestonk_terminal.stocks.fundamental_analysis import (
+                yahoo_finance_view,
+            )
+
             yahoo_finance_view.display_dividends(
                 ticker=self.ticker,
                 limit=ns_parser.limit,
@@ -577,94 +791,112 @@ Other Sources:
     @try_except
     def call_overview(self, other_args: List[str]):
         """Process overview command."""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="overview",
-            description="""
-                Prints an overview about the company. The following fields are expected:
-                Symbol, Asset type, Name, Description, Exchange, Currency, Country, Sector, Industry,
-                Address, Full time employees, Fiscal year end, Latest quarter, Market capitalization,
-                EBITDA, PE ratio, PEG ratio, Book value, Dividend per share, Dividend yield, EPS,
-                Revenue per share TTM, Profit margin, Operating margin TTM, Return on assets TTM,
-                Return on equity TTM, Revenue TTM, Gross profit TTM, Diluted EPS TTM, Quarterly
-                earnings growth YOY, Quarterly revenue growth YOY, Analyst target price, Trailing PE,
-                Forward PE, Price to sales ratio TTM, Price to book ratio, EV to revenue, EV to EBITDA,
-                Beta, 52 week high, 52 week low, 50 day moving average, 200 day moving average, Shares
-                outstanding, Shares float, Shares short, Shares short prior month, Short ratio, Short
-                percent outstanding, Short percent float, Percent insiders, Percent institutions,
-                Forward annual dividend rate, Forward annual dividend yield, Payout ratio, Dividend
-                date, Ex dividend date, Last split factor, and Last split date. Also, the C i k field
-                corresponds to Central Index Key, which can be used to search a company on
-                https://www.sec.gov/edgar/searchedgar/cik.htm [Source: Alpha Vantage]
-            """,
-        )
+        parser = self._PARSERS.get("overview")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="overview",
+                description="""
+                    Prints an overview about the company. The following fields are expected:
+                    Symbol, Asset type, Name, Description, Exchange, Currency, Country, Sector, Industry,
+                    Address, Full time employees, Fiscal year end, Latest quarter, Market capitalization,
+                    EBITDA, PE ratio, PEG ratio, Book value, Dividend per share, Dividend yield, EPS,
+                    Revenue per share TTM, Profit margin, Operating margin TTM, Return on assets TTM,
+                    Return on equity TTM, Revenue TTM, Gross profit TTM, Diluted EPS TTM, Quarterly
+                    earnings growth YOY, Quarterly revenue growth YOY, Analyst target price, Trailing PE,
+                    Forward PE, Price to sales ratio TTM, Price to book ratio, EV to revenue, EV to EBITDA,
+                    Beta, 52 week high, 52 week low, 50 day moving average, 200 day moving average, Shares
+                    outstanding, Shares float, Shares short, Shares short prior month, Short ratio, Short
+                    percent outstanding, Short percent float, Percent insiders, Percent institutions,
+                    Forward annual dividend rate, Forward annual dividend yield, Payout ratio, Dividend
+                    date, Ex dividend date, Last split factor, and Last split date. Also, the C i k field
+                    corresponds to Central Index Key, which can be used to search a company on
+                    https://www.sec.gov/edgar/searchedgar/cik.htm [Source: Alpha Vantage]
+                """,
+            )
+            self._PARSERS["overview"] = parser
         ns_parser = parse_known_args_and_warn(
             parser, other_args, EXPORT_ONLY_RAW_DATA_ALLOWED
         )
         if ns_parser:
+            # pylint: disable=import-outside-toplevel
+            from gamestonk_terminal.stocks.fundamental_analysis import av_view
+
             av_view.display_overview(self.ticker)
 
     @try_except
     def call_key(self, other_args: List[str]):
         """Process overview command."""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="key",
-            description="""
-                Gives main key metrics about the company (it's a subset of the Overview data from Alpha
-                Vantage API). The following fields are expected: Market capitalization, EBITDA, EPS, PE
-                ratio, PEG ratio, Price to book ratio, Return on equity TTM, Payout ratio, Price to
-                sales ratio TTM, Dividend yield, 50 day moving average, Analyst target price, Beta
-                [Source: Alpha Vantage API]
-            """,
-        )
+        parser = self._PARSERS.get("key")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="key",
+                description="""
+                    Gives main key metrics about the company (it's a subset of the Overview data from Alpha
+                    Vantage API). The following fields are expected: Market capitalization, EBITDA, EPS, PE
+                    ratio, PEG ratio, Price to book ratio, Return on equity TTM, Payout ratio, Price to
+                    sales ratio TTM, Dividend yield, 50 day moving average, Analyst target price, Beta
+                    [Source: Alpha Vantage API]
+                """,
+            )
+            self._PARSERS["key"] = parser
         ns_parser = parse_known_args_and_warn(
             parser, other_args, EXPORT_ONLY_RAW_DATA_ALLOWED
         )
         if ns_parser:
+            # pylint: disable=import-outside-toplevel
+            from gamestonk_terminal.stocks.fundamental_analysis import av_view
+
             av_view.display_key(self.ticker)
 
     @try_except
     def call_income(self, other_args: List[str]):
         """Process income command."""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="income",
-            description="""
-                Prints a complete income statement over time. This can be either quarterly or annually.
-                The following fields are expected: Accepted date, Cost and expenses, Cost of revenue,
-                Depreciation and amortization, Ebitda, Ebitda Ratio, Eps, EPS Diluted, Filling date,
-                Final link, General and administrative expenses, Gross profit, Gross profit ratio,
-                Income before tax, Income before tax ratio, Income tax expense, Interest expense, Link,
-                Net income, Net income ratio, Operating expenses, Operating income, Operating income
-                ratio, Other expenses, Period, Research and development expenses, Revenue, Selling and
-                marketing expenses, Total other income expenses net, Weighted average shs out, Weighted
-                average shs out dil [Source: Alpha Vantage]""",
-        )
-        parser.add_argument(
-            "-l",
-            "--limit",
-            action="store",
-            dest="limit",
-            type=check_positive,
-            default=1,
-            help="Number of latest years/quarters.",
-        )
-        parser.add_argument(
-            "-q",
-            "--quarter",
-            action="store_true",
-            default=False,
-            dest="b_quarter",
-            help="Quarter fundamental data flag.",
-        )
+        parser = self._PARSERS.get("income")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="income",
+                description="""
+                    Prints a complete income statement over time. This can be either quarterly or annually.
+                    The following fields are expected: Accepted date, Cost and expenses, Cost of revenue,
+                    Depreciation and amortization, Ebitda, Ebitda Ratio, Eps, EPS Diluted, Filling date,
+                    Final link, General and administrative expenses, Gross profit, Gross profit ratio,
+                    Income before tax, Income before tax ratio, Income tax expense, Interest expense, Link,
+                    Net income, Net income ratio, Operating expenses, Operating income, Operating income
+                    ratio, Other expenses, Period, Research and development expenses, Revenue, Selling and
+                    marketing expenses, Total other income expenses net, Weighted average shs out, Weighted
+                    average shs out dil [Source: Alpha Vantage]""",
+            )
+            parser.add_argument(
+                "-l",
+                "--limit",
+                action="store",
+                dest="limit",
+                type=check_positive,
+                default=1,
+                help="Number of latest years/quarters.",
+            )
+            parser.add_argument(
+                "-q",
+                "--quarter",
+                action="store_true",
+                default=False,
+                dest="b_quarter",
+                help="Quarter fundamental data flag.",
+            )
+            self._PARSERS["income"] = parser
         ns_parser = parse_known_args_and_warn(
             parser, other_args, export_allowed=EXPORT_ONLY_RAW_DATA_ALLOWED
         )
         if ns_parser:
+            # pylint: disable=import-outside-toplevel
+            from gamestonk_terminal.stocks.fundamental_analysis import av_view
+
             av_view.display_income_statement(
                 ticker=self.ticker,
                 limit=ns_parser.limit,
@@ -675,48 +907,54 @@ Other Sources:
     @try_except
     def call_balance(self, other_args: List[str]):
         """Process balance command."""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="balance",
-            description="""
-                Prints a complete balance sheet statement over time. This can be either quarterly or
-                annually. The following fields are expected: Accepted date, Account payables,
-                Accumulated other comprehensive income loss, Cash and cash equivalents, Cash and short
-                term investments, Common stock, Deferred revenue, Deferred revenue non current,
-                Deferred tax liabilities non current, Filling date, Final link, Goodwill,
-                Goodwill and intangible assets, Intangible assets, Inventory, Link, Long term debt,
-                Long term investments, Net debt, Net receivables, Other assets, Other current assets,
-                Other current liabilities, Other liabilities, Other non current assets, Other non
-                current liabilities, Othertotal stockholders equity, Period, Property plant equipment
-                net, Retained earnings, Short term debt, Short term investments, Tax assets, Tax
-                payables, Total assets, Total current assets, Total current liabilities, Total debt,
-                Total investments, Total liabilities, Total liabilities and stockholders equity, Total
-                non current assets, Total non current liabilities, and Total stockholders equity.
-                [Source: Alpha Vantage]
-            """,
-        )
-        parser.add_argument(
-            "-l",
-            "--limit",
-            action="store",
-            dest="limit",
-            type=check_positive,
-            default=1,
-            help="Number of latest years/quarters.",
-        )
-        parser.add_argument(
-            "-q",
-            "--quarter",
-            action="store_true",
-            default=False,
-            dest="b_quarter",
-            help="Quarter fundamental data flag.",
-        )
+        parser = self._PARSERS.get("balance")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="balance",
+                description="""
+                    Prints a complete balance sheet statement over time. This can be either quarterly or
+                    annually. The following fields are expected: Accepted date, Account payables,
+                    Accumulated other comprehensive income loss, Cash and cash equivalents, Cash and short
+                    term investments, Common stock, Deferred revenue, Deferred revenue non current,
+                    Deferred tax liabilities non current, Filling date, Final link, Goodwill,
+                    Goodwill and intangible assets, Intangible assets, Inventory, Link, Long term debt,
+                    Long term investments, Net debt, Net receivables, Other assets, Other current assets,
+                    Other current liabilities, Other liabilities, Other non current assets, Other non
+                    current liabilities, Othertotal stockholders equity, Period, Property plant equipment
+                    net, Retained earnings, Short term debt, Short term investments, Tax assets, Tax
+                    payables, Total assets, Total current assets, Total current liabilities, Total debt,
+                    Total investments, Total liabilities, Total liabilities and stockholders equity, Total
+                    non current assets, Total non current liabilities, and Total stockholders equity.
+                    [Source: Alpha Vantage]
+                """,
+            )
+            parser.add_argument(
+                "-l",
+                "--limit",
+                action="store",
+                dest="limit",
+                type=check_positive,
+                default=1,
+                help="Number of latest years/quarters.",
+            )
+            parser.add_argument(
+                "-q",
+                "--quarter",
+                action="store_true",
+                default=False,
+                dest="b_quarter",
+                help="Quarter fundamental data flag.",
+            )
+            self._PARSERS["balance"] = parser
         ns_parser = parse_known_args_and_warn(
             parser, other_args, export_allowed=EXPORT_ONLY_RAW_DATA_ALLOWED
         )
         if ns_parser:
+            # pylint: disable=import-outside-toplevel
+            from gamestonk_terminal.stocks.fundamental_analysis import av_view
+
             av_view.display_balance_sheet(
                 ticker=self.ticker,
                 limit=ns_parser.limit,
@@ -724,210 +962,374 @@ Other Sources:
                 export=ns_parser.export,
             )
 
-    @try_except
     def call_cash(self, other_args: List[str]):
         """Process cash command."""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="cash",
-            description="""
-                Prints a complete cash flow statement over time. This can be either quarterly or
-                annually. The following fields are expected: Accepted date, Accounts payables, Accounts
-                receivables, Acquisitions net, Capital expenditure, Cash at beginning of period, Cash
-                at end of period, Change in working capital, Common stock issued, Common stock
-                repurchased, Debt repayment, Deferred income tax, Depreciation and amortization,
-                Dividends paid, Effect of forex changes on cash, Filling date, Final link, Free cash
-                flow, Inventory, Investments in property plant and equipment, Link, Net cash provided
-                by operating activities, Net cash used for investing activities, Net cash used provided
-                by financing activities, Net change in cash, Net income, Operating cash flow, Other
-                financing activities, Other investing activities, Other non cash items, Other working
-                capital, Period, Purchases of investments, Sales maturities of investments, Stock based
-                compensation. [Source: Alpha Vantage]
-            """,
-        )
-        parser.add_argument(
-            "-l",
-            "--limit",
-            action="store",
-            dest="limit",
-            type=check_positive,
-            default=1,
-            help="Number of latest years/quarters.",
-        )
-        parser.add_argument(
-            "-q",
-            "--quarter",
-            action="store_true",
-            default=False,
-            dest="b_quarter",
-            help="Quarter fundamental data flag.",
-        )
-        ns_parser = parse_known_args_and_warn(
-            parser, other_args, export_allowed=EXPORT_ONLY_RAW_DATA_ALLOWED
-        )
-        if ns_parser:
-            av_view.display_cash_flow(
-                ticker=self.ticker,
-                limit=ns_parser.limit,
-                quarterly=ns_parser.b_quarter,
-                export=ns_parser.export,
+        ns_parser = _fast_parse(other_args, _CASH_SPEC)
+        parser = self._PARSERS.get("cash")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="cash",
+                description="""
+                    Prints a complete cash flow statement over time. This can be either quarterly or
+                    annually. The following fields are expected: Accepted date, Accounts payables, Accounts
+                    receivables, Acquisitions net, Capital expenditure, Cash at beginning of period, Cash
+                    at end of period, Change in working capital, Common stock issued, Common stock
+                    repurchased, Debt repayment, Deferred income tax, Depreciation and amortization,
+                    Dividends paid, Effect of forex changes on cash, Filling date, Final link, Free cash
+                    flow, Inventory, Investments in property plant and equipment, Link, Net cash provided
+                    by operating activities, Net cash used for investing activities, Net cash used provided
+                    by financing activities, Net change in cash, Net income, Operating cash flow, Other
+                    financing activities, Other investing activities, Other non cash items, Other working
+                    capital, Period, Purchases of investments, Sales maturities of investments, Stock based
+                    compensation. [Source: Alpha Vantage]
+                """,
+            )
+            parser.add_argument(
+                "-l",
+                "--limit",
+                action="store",
+                dest="limit",
+                type=check_positive,
+                default=1,
+                help="Number of latest years/quarters.",
+            )
+            parser.add_argument(
+                "-q",
+                "--quarter",
+                action="store_true",
+                default=False,
+                dest="b_quarter",
+                help="Quarter fundamental data flag.",
+            )
+            self._PARSERS["cash"] = parser
+        if ns_parser is None:
+            ns_parser = parse_known_args_and_warn(
+                parser, other_args, export_allowed=EXPORT_ONLY_RAW_DATA_ALLOWED
             )
+        if ns_parser:
+            # pylint: disable=import-outside-toplevel
+            from gamestonk_terminal.stocks.fundamental_analysis import av_view
+
+            try:
+                av_view.display_cash_flow(
+                    ticker=self.ticker,
+                    limit=ns_parser.limit,
+                    quarterly=ns_parser.b_quarter,
+                    export=ns_parser.export,
+                )
+            except Exception as e:  # pylint: disable=broad-except
+                if config_terminal.DEBUG_MODE:
+                    raise
+                logger.exception("%s", type(e).__name__)
 
-    @try_except
     def call_earnings(self, other_args: List[str]):
         """Process earnings command."""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="earnings",
-            description="""
-                Print earnings dates and reported EPS of the company. The following fields are
-                expected: Fiscal Date Ending and Reported EPS. [Source: Alpha Vantage]
-            """,
-        )
-        parser.add_argument(
-            "-q",
-            "--quarter",
-            action="store_true",
-            default=False,
-            dest="b_quarter",
-            help="Quarter fundamental data flag.",
-        )
-        parser.add_argument(
-            "-l",
-            "--limit",
-            action="store",
-            dest="limit",
-            type=check_positive,
-            default=5,
-            help="Number of latest info",
-        )
-        ns_parser = parse_known_args_and_warn(
-            parser, other_args, EXPORT_ONLY_RAW_DATA_ALLOWED
-        )
-        if ns_parser:
-            av_view.display_earnings(
-                ticker=self.ticker,
-                limit=ns_parser.limit,
-                quarterly=ns_parser.b_quarter,
+        ns_parser = _fast_parse(other_args, _EARNINGS_SPEC)
+        parser = self._PARSERS.get("earnings")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="earnings",
+                description="""
+                    Print earnings dates and reported EPS of the company. The following fields are
+                    expected: Fiscal Date Ending and Reported EPS. [Source: Alpha Vantage]
+                """,
+            )
+            parser.add_argument(
+                "-q",
+                "--quarter",
+                action="store_true",
+                default=False,
+                dest="b_quarter",
+                help="Quarter fundamental data flag.",
+            )
+            parser.add_argument(
+                "-l",
+                "--limit",
+                action="store",
+                dest="limit",
+                type=check_positive,
+                default=5,
+                help="Number of latest info",
+            )
+            self._PARSERS["earnings"] = parser
+        if ns_parser is None:
+            ns_parser = parse_known_args_and_warn(
+                parser, other_args, EXPORT_ONLY_RAW_DATA_ALLOWED
             )
+        if ns_parser:
+            # pylint: disable=import-outside-toplevel
+            from gamestonk_terminal.stocks.fundamental_analysis import av_view
+
+            try:
+                av_view.display_earnings(
+                    ticker=self.ticker,
+                    limit=ns_parser.limit,
+                    quarterly=ns_parser.b_quarter,
+                )
+            except Exception as e:  # pylint: disable=broad-except
+                if config_terminal.DEBUG_MODE:
+                    raise
+                logger.exception("%s", type(e).__name__)
 
-    @try_except
     def call_fraud(self, other_args: List[str]):
         """Process fraud command."""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.RawTextHelpFormatter,
-            prog="fraud",
-            description=(
-                "M-score:\n------------------------------------------------\n"
-                "The Beneish model is a statistical model that uses financial ratios calculated with"
-                " accounting data of a specific company in order to check if it is likely (high"
-                " probability) that the reported earnings of the company have been manipulated."
-                " A score of -5 to -2.22 indicated a low chance of fraud, a score of -2.22 to -1.78"
-                " indicates a moderate change of fraud, and a score above -1.78 indicated a high"
-                " chance of fraud.[Source: Wikipedia]\n\nDSRI:\nDays Sales in Receivables Index"
-                " gauges whether receivables and revenue are out of balance, a large number is"
-                " expected to be associated with a higher likelihood that revenues and earnings are"
-                " overstated.\n\nGMI:\nGross Margin Index shows if gross margins are deteriorating."
-                " Research suggests that firms with worsening gross margin are more likely to engage"
-                " in earnings management, therefore there should be a positive correlation between"
-                " GMI and probability of earnings management.\n\nAQI:\nAsset Quality Index measures"
-                " the proportion of assets where potential benefit is less certain. A positive"
-                " relation between AQI and earnings manipulation is expected.\n\nSGI:\nSales Growth"
-                " Index shows the amount of growth companies are having. Higher growth companies are"
-                " more likely to commit fraud so there should be a positive relation between SGI and"
-                " earnings management.\n\nDEPI:\nDepreciation Index is the ratio for the rate of"
-                " depreciation. A DEPI greater than 1 shows that the depreciation rate has slowed and"
-                " is positively correlated with earnings management.\n\nSGAI:\nSales General and"
-                " Administrative Expenses Index measures the change in SG&A over sales. There should"
-                " be a positive relationship between SGAI and earnings management.\n\nLVGI:\nLeverage"
-                " Index represents change in leverage. A LVGI greater than one indicates a lower"
-                " change of fraud.\n\nTATA: \nTotal Accruals to Total Assets is a proxy for the"
-                " extent that cash underlies earnings. A higher number is associated with a higher"
-                " likelihood of manipulation.\n\n\n"
-                "Z-score:\n------------------------------------------------\n"
-                "The Zmijewski Score is a bankruptcy model used to predict a firm's bankruptcy in two"
-                " years. The ratio uses in the Zmijewski score were determined by probit analysis ("
-                "think of probit as probability unit). In this case, scores less than .5 represent a"
-                " higher probability of default. One of the criticisms that Zmijewski made was that"
-                " other bankruptcy scoring models oversampled distressed firms and favored situations"
-                " with more complete data.[Source: YCharts]"
-            ),
-        )
-        ns_parser = parse_known_args_and_warn(
-            parser, other_args, EXPORT_ONLY_RAW_DATA_ALLOWED
-        )
+        ns_parser = _fast_parse(other_args, _FRAUD_SPEC)
+        parser = self._PARSERS.get("fraud")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.RawTextHelpFormatter,
+                prog="fraud",
+                description=_FRAUD_DESCRIPTION,
+            )
+            self._PARSERS["fraud"] = parser
+        if ns_parser is None:
+            ns_parser = parse_known_args_and_warn(
+                parser, other_args, EXPORT_ONLY_RAW_DATA_ALLOWED
+            )
         if ns_parser:
-            av_view.display_fraud(self.ticker)
+            # pylint: disable=import-outside-toplevel
+            from gamestonk_terminal.stocks.fundamental_analysis import av_view
+
+            try:
+                av_view.display_fraud(self.ticker)
+            except Exception as e:  # pylint: disable=broad-except
+                if config_terminal.DEBUG_MODE:
+                    raise
+                logger.exception("%s", type(e).__name__)
 
-    @try_except
     def call_dcf(self, other_args: List[str]):
         """Process dcf command."""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="dcf",
-            description="""
-                Generates a discounted cash flow statement. The statement uses machine
-                learning to predict the future financial statement, and then predicts the future
-                value of the stock based on the predicted financials.""",
-        )
-        parser.add_argument(
-            "-a",
-            "--audit",
-            action="store_true",
-            dest="audit",
-            default=False,
-            help="Confirms that the numbers provided are accurate.",
-        )
-        ns_parser = parse_known_args_and_warn(
-            parser, other_args, EXPORT_ONLY_RAW_DATA_ALLOWED
-        )
+        ns_parser = _fast_parse(other_args, _DCF_SPEC)
+        parser = self._PARSERS.get("dcf")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="dcf",
+                description="""
+                    Generates a discounted cash flow statement. The statement uses machine
+                    learning to predict the future financial statement, and then predicts the future
+                    value of the stock based on the predicted financials.""",
+            )
+            parser.add_argument(
+                "-a",
+                "--audit",
+                action="store_true",
+                dest="audit",
+                default=False,
+                help="Confirms that the numbers provided are accurate.",
+            )
+            self._PARSERS["dcf"] = parser
+        if ns_parser is None:
+            ns_parser = parse_known_args_and_warn(
+                parser, other_args, EXPORT_ONLY_RAW_DATA_ALLOWED
+            )
 
         # TODO: This does not work for the following example tickers: AA, TSLA
         if ns_parser:
-            dcf = dcf_view.CreateExcelFA(self.ticker, ns_parser.audit)
-            dcf.create_workbook()
+            # pylint: disable=import-outside-toplevel
+            from gamestonk_terminal.stocks.fundamental_analysis import dcf_view
+
+            try:
+                dcf = dcf_view.CreateExcelFA(self.ticker, ns_parser.audit)
+                dcf.create_workbook()
+            except Exception as e:  # pylint: disable=broad-except
+                if config_terminal.DEBUG_MODE:
+                    raise
+                logger.exception("%s", type(e).__name__)
 
-    @try_except
     def call_warnings(self, other_args: List[str]):
         """Process warnings command."""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            prog="warnings",
-            description="""
-                Sean Seah warnings. Check: Consistent historical earnings per share;
-                Consistently high return on equity; Consistently high return on assets; 5x Net
-                Income > Long-Term Debt; and Interest coverage ratio more than 3. See
-                https://www.drwealth.com/gone-fishing-with-buffett-by-sean-seah/comment-page-1/
-                [Source: Market Watch]
-            """,
-        )
-        parser.add_argument(
-            "-d",
-            "--debug",
-            action="store_true",
-            default=False,
-            dest="b_debug",
-            help="print insights into warnings calculation.",
-        )
+        ns_parser = _fast_parse(other_args, _WARNINGS_SPEC)
+        parser = self._PARSERS.get("warnings")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                prog="warnings",
+                description="""
+                    Sean Seah warnings. Check: Consistent historical earnings per share;
+                    Consistently high return on equity; Consistently high return on assets; 5x Net
+                    Income > Long-Term Debt; and Interest coverage ratio more than 3. See
+                    https://www.drwealth.com/gone-fishing-with-buffett-by-sean-seah/comment-page-1/
+                    [Source: Market Watch]
+                """,
+            )
+            parser.add_argument(
+                "-d",
+                "--debug",
+                action="store_true",
+                default=False,
+                dest="b_debug",
+                help="print insights into warnings calculation.",
+            )
+            self._PARSERS["warnings"] = parser
+        if ns_parser is None:
+            ns_parser = parse_known_args_and_warn(
+                parser, other_args, EXPORT_ONLY_RAW_DATA_ALLOWED
+            )
+        if ns_parser:
+            # pylint: disable=import-outside-toplevel
+            from gamestonk_terminal.stocks.fundamental_analysis import market_watch_view
+
+            try:
+                market_watch_view.display_sean_seah_warnings(
+                    ticker=self.ticker, debug=ns_parser.b_debug
+                )
+            except Exception as e:  # pylint: disable=broad-except
+                if config_terminal.DEBUG_MODE:
+                    raise
+                logger.exception("%s", type(e).__name__)
+
+    @try_except
+    def call_all(self, other_args: List[str]):
+        """Process all command."""
+        parser = self._PARSERS.get("all")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="all",
+                description="""
+                    Runs the cash, earnings and fraud commands for the loaded ticker. The
+                    three Alpha Vantage requests are independent, so they are issued in
+                    parallel and the overall latency is that of the slowest request rather
+                    than their sum. [Source: Alpha Vantage]
+                """,
+            )
+            parser.add_argument(
+                "-l",
+                "--limit",
+                action="store",
+                dest="limit",
+                type=check_positive,
+                default=1,
+                help="Number of latest years/quarters.",
+            )
+            parser.add_argument(
+                "-q",
+                "--quarter",
+                action="store_true",
+                default=False,
+                dest="b_quarter",
+                help="Quarter fundamental data flag.",
+            )
+            self._PARSERS["all"] = parser
         ns_parser = parse_known_args_and_warn(
-            parser, other_args, EXPORT_ONLY_RAW_DATA_ALLOWED
+            parser, other_args, export_allowed=EXPORT_ONLY_RAW_DATA_ALLOWED
         )
         if ns_parser:
-            market_watch_view.display_sean_seah_warnings(
-                ticker=self.ticker, debug=ns_parser.b_debug
-            )
+            # pylint: disable=import-outside-toplevel
+            from concurrent.futures import ThreadPoolExecutor, as_completed
+
+            from gamestonk_terminal.stocks.fundamental_analysis import av_view
+
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                futures = [
+                    executor.submit(
+                        av_view.display_cash_flow,
+                        ticker=self.ticker,
+                        limit=ns_parser.limit,
+                        quarterly=ns_parser.b_quarter,
+                        export=ns_parser.export,
+                    ),
+                    executor.submit(
+                        av_view.display_earnings,
+                        ticker=self.ticker,
+                        limit=ns_parser.limit,
+                        quarterly=ns_parser.b_quarter,
+                    ),
+                    executor.submit(av_view.display_fraud, self.ticker),
+                ]
+                # Surface the first failure instead of swallowing it
+                for future in as_completed(futures):
+                    future.result()
 
     def call_fmp(self, _):
         """Process fmp command."""
-        self.queue = fmp_controller.menu(
-            self.ticker, self.start, self.interval, self.queue
+        # pylint: disable=import-outside-toplevel
+        from gamestonk_terminal.stocks.fundamental_analysis.financial_modeling_prep import (
+            fmp_controller,
+        )
+
+        # The sub-menu works on a plain list, so convert on the way in and out
+        self.queue = deque(
+            fmp_controller.menu(
+                self.ticker, self.start, self.interval, list(self.queue)
+            )
         )
 
 
+FundamentalAnalysisController._DISPATCH = {
+    name: getattr(FundamentalAnalysisController, "call_" + name)
+    for name in FundamentalAnalysisController.CHOICES
+    if hasattr(FundamentalAnalysisController, "call_" + name)
+}
+
+
+# Frozen once so repeated typos can share memoized suggestions below
+_CHOICES_TUPLE = tuple(FundamentalAnalysisController.CHOICES)
+
+# Frozen for O(1) membership checks in the menu hot loop
+_COMMANDS_SET = frozenset(FundamentalAnalysisController.CHOICES_COMMANDS)
+
+# Tokens that pop this menu, hoisted so the loop does not rebuild a tuple
+_QUIT_TOKENS = frozenset({"q", "..", "quit"})
+
+
+@functools.lru_cache(maxsize=256)
+def _suggest(token: str, choices: tuple) -> tuple:
+    """Return the closest known command for a mistyped token.
+
+    Memoized because users tend to repeat the same typo, turning the
+    SequenceMatcher scan over every choice into a dict lookup.
+
+    Parameters
+    ----------
+    token : str
+        First word of the unknown input
+    choices : tuple
+        Commands to match against
+
+    Returns
+    -------
+    tuple
+        Closest match, empty when nothing clears the cutoff
+    """
+    # Only the unknown-command path pays the import cost
+    import difflib  # pylint: disable=import-outside-toplevel
+
+    return tuple(difflib.get_close_matches(token, choices, n=1, cutoff=0.7))
+
+
+# The controller choices never change at runtime, so one completer is built
+# at import time and shared by every controller instance
+_COMPLETER: Union[None, NestedCompleter] = None
+if session and gtff.USE_PROMPT_TOOLKIT:
+    _choices: dict = {c: {} for c in FundamentalAnalysisController.CHOICES}
+    _choices["load"]["-i"] = {c: {} for c in stocks_helper.INTERVALS}
+    _choices["load"]["-s"] = {c: {} for c in stocks_helper.SOURCES}
+    _COMPLETER = NestedCompleter.from_nested_dict(_choices)
+
+
+@functools.lru_cache(maxsize=1)
+def _key_metrics_text() -> str:
+    """Read the static key metrics explanation file once.
+
+    Returns
+    -------
+    str
+        File contents with trailing whitespace stripped per line
+    """
+    filepath = "fundamental_analysis/key_metrics_explained.txt"
+    with open(filepath) as fp:
+        return "\n".join(line.rstrip() for line in fp)
+
+
 @try_except
 def key_metrics_explained(other_args: List[str]):
     """Key metrics explained.
@@ -937,6 +1339,11 @@ def key_metrics_explained(other_args: List[str]):
     other_args : List[str]
         argparse other args
     """
+    # The common REPL case passes no arguments and needs no argparse work
+    if not other_args:
+        print(_key_metrics_text())
+        print("")
+        return
     parser = argparse.ArgumentParser(
         add_help=False,
         formatter_class=argparse.ArgumentDefaultsHelpFormatter,
@@ -950,13 +1357,8 @@ def key_metrics_explained(other_args: List[str]):
         parser, other_args, EXPORT_ONLY_RAW_DATA_ALLOWED
     )
     if ns_parser:
-        filepath = "fundamental_analysis/key_metrics_explained.txt"
-        with open(filepath) as fp:
-            line = fp.readline()
-            while line:
-                print(f"{line.strip()}")
-                line = fp.readline()
-            print("")
+        print(_key_metrics_text())
+        print("")
 
 
 def menu(
@@ -968,22 +1370,33 @@ def menu(
     )
     an_input = "HELP_ME"
 
+    # Flair and prompt keywords never change within this menu, so bind them
+    # once instead of rebuilding them on every loop iteration
+    flair = get_flair()
+    bound_prompt = (
+        functools.partial(
+            session.prompt,
+            completer=fa_controller.completer,
+            search_ignore_case=True,
+        )
+        if session and gtff.USE_PROMPT_TOOLKIT and fa_controller.completer
+        else None
+    )
+
     while True:
         # There is a command in the queue
         if fa_controller.queue and len(fa_controller.queue) > 0:
             # If the command is quitting the menu we want to return in here
-            if fa_controller.queue[0] in ("q", "..", "quit"):
-                if len(fa_controller.queue) > 1:
-                    return fa_controller.queue[1:]
-                return []
+            if fa_controller.queue[0] in _QUIT_TOKENS:
+                fa_controller.queue.popleft()
+                return list(fa_controller.queue)
 
             # Consume 1 element from the queue
-            an_input = fa_controller.queue[0]
-            fa_controller.queue = fa_controller.queue[1:]
+            an_input = fa_controller.queue.popleft()
 
             # Print the current location because this was an instruction and we want user to know what was the action
-            if an_input and an_input.split(" ")[0] in fa_controller.CHOICES_COMMANDS:
-                print(f"{get_flair()} /stocks/fa/ $ {an_input}")
+            if an_input and an_input.partition(" ")[0] in _COMMANDS_SET:
+                print(f"{flair} /stocks/fa/ $ {an_input}")
 
         # Get input command from user
         else:
@@ -992,15 +1405,11 @@ def menu(
                 fa_controller.print_help()
 
             # Get input from user using auto-completion
-            if session and gtff.USE_PROMPT_TOOLKIT and fa_controller.completer:
-                an_input = session.prompt(
-                    f"{get_flair()} /stocks/fa/ $ ",
-                    completer=fa_controller.completer,
-                    search_ignore_case=True,
-                )
+            if bound_prompt:
+                an_input = bound_prompt(f"{flair} /stocks/fa/ $ ")
             # Get input from user without auto-completion
             else:
-                an_input = input(f"{get_flair()} /stocks/fa/ $ ")
+                an_input = input(f"{flair} /stocks/fa/ $ ")
 
         try:
             # Process the input command
@@ -1011,29 +1420,22 @@ def menu(
                 f"\nThe command '{an_input}' doesn't exist on the /stocks/fa menu.",
                 end="",
             )
-            similar_cmd = difflib.get_close_matches(
-                an_input.split(" ")[0] if " " in an_input else an_input,
-                fa_controller.CHOICES,
-                n=1,
-                cutoff=0.7,
-            )
+            # Split once: head feeds the suggestion lookup, tail rebuilds the
+            # candidate command
+            head, _, tail = an_input.partition(" ")
+            similar_cmd = _suggest(head, _CHOICES_TUPLE)
             if similar_cmd:
-                if " " in an_input:
-                    candidate_input = (
-                        f"{similar_cmd[0]} {' '.join(an_input.split(' ')[1:])}"
-                    )
-                else:
-                    candidate_input = similar_cmd[0]
+                candidate_input = f"{similar_cmd[0]} {tail}" if tail else similar_cmd[0]
 
                 if candidate_input == an_input:
                     an_input = ""
-                    fa_controller.queue = []
+                    fa_controller.queue.clear()
                     print("\n")
                     continue
 
                 print(f" Replacing by '{an_input}'.")
-                fa_controller.queue.insert(0, an_input)
+                fa_controller.queue.appendleft(an_input)
             else:
                 print("\n")
                 an_input = ""
-                fa_controller.queue = []
+                fa_controller.queue.clear()
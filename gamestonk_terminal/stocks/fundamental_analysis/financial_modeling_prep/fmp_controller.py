@@ -2,13 +2,12 @@
 __docformat__ = "numpy"
 
 import argparse
-import difflib
-from typing import List, Union
+import bisect
+import sys
+from collections import deque
+from typing import Callable, Dict, List, Union
 from prompt_toolkit.completion import NestedCompleter
 
-from gamestonk_terminal.stocks.fundamental_analysis.financial_modeling_prep import (
-    fmp_view,
-)
 from gamestonk_terminal import feature_flags as gtff
 from gamestonk_terminal.helper_funcs import (
     get_flair,
@@ -20,25 +19,148 @@ from gamestonk_terminal.helper_funcs import (
 )
 from gamestonk_terminal.menu import session
 
+# Shorthand inputs normalized to their full command in a single lookup
+_ALIASES = {
+    "..": "quit",
+    "q": "quit",
+    "?": "help",
+    "h": "help",
+    "r": "reset",
+}
+
+
+# Long parser descriptions hoisted out of the call_* bytecode; referenced by
+# the cached parser builds below
+_DESCRIPTIONS: Dict[str, str] = {
+    "profile": """
+                    Prints information about, among other things, the industry, sector exchange and company
+                    description. The following fields are expected: Address, Beta, Ceo, Changes, Cik, City
+                    Company name, Country, Currency, Cusip, Dcf, Dcf diff, Default image, Description,
+                    Exchange, Exchange short name, Full time employees, Image, Industry, Ipo date, Isin,
+                    Last div, Mkt cap, Phone, Price, Range, Sector, State, Symbol, Vol avg, Website, Zip.
+                    [Source: Financial Modeling Prep]
+                """,
+    "quote": """
+                    Prints actual information about the company which is, among other things, the day high,
+                    market cap, open and close price and price-to-equity ratio. The following fields are
+                    expected: Avg volume, Change, Changes percentage, Day high, Day low, Earnings
+                    announcement, Eps, Exchange, Market cap, Name, Open, Pe, Previous close, Price, Price
+                    avg200, Price avg50, Shares outstanding, Symbol, Timestamp, Volume, Year high, and Year
+                    low. [Source: Financial Modeling Prep]
+                """,
+    "enterprise": """
+                    Prints stock price, number of shares, market capitalization and
+                    enterprise value over time. The following fields are expected: Add total debt,
+                    Enterprise value, Market capitalization, Minus cash and cash equivalents, Number
+                    of shares, Stock price, and Symbol. [Source: Financial Modeling Prep]
+                """,
+    "dcf": """
+                    Prints the discounted cash flow of a company over time including the DCF of today. The
+                    following fields are expected: DCF, Stock price, and Date. [Source: Financial Modeling
+                    Prep]
+                """,
+    "income": """
+                    Prints a complete income statement over time. This can be either quarterly or annually.
+                    The following fields are expected: Accepted date, Cost and expenses, Cost of
+                    revenue, Depreciation and amortization, Ebitda, Ebitdaratio, Eps, Epsdiluted, Filling
+                    date, Final link, General and administrative expenses, Gross profit, Gross profit
+                    ratio, Income before tax, Income before tax ratio, Income tax expense, Interest
+                    expense, Link, Net income, Net income ratio, Operating expenses, Operating income,
+                    Operating income ratio, Other expenses, Period, Research and development expenses,
+                    Revenue, Selling and marketing expenses, Total other income expenses net, Weighted
+                    average shs out, Weighted average shs out dil [Source: Financial Modeling Prep]
+                """,
+    "balance": """
+                    Prints a complete balance sheet statement over time. This can be
+                    either quarterly or annually. The following fields are expected: Accepted date,
+                    Account payables, Accumulated other comprehensive income loss, Cash and cash
+                    equivalents, Cash and short term investments, Common stock, Deferred revenue,
+                    Deferred revenue non current, Deferred tax liabilities non current, Filling date,
+                    Final link, Goodwill, Goodwill and intangible assets, Intangible assets, Inventory,
+                    Link, Long term debt, Long term investments, Net debt, Net receivables, Other assets,
+                    Other current assets, Other current liabilities, Other liabilities, Other non current
+                    assets, Other non current liabilities, Othertotal stockholders equity, Period, Property
+                    plant equipment net, Retained earnings, Short term debt, Short term investments, Tax
+                    assets, Tax payables, Total assets, Total current assets, Total current liabilities,
+                    Total debt, Total investments, Total liabilities, Total liabilities and stockholders
+                    equity, Total non current assets, Total non current liabilities, and Total stockholders
+                    equity. [Source: Financial Modeling Prep]
+                """,
+    "cash": """
+                    Prints a complete cash flow statement over time. This can be either
+                    quarterly or annually. The following fields are expected: Accepted date, Accounts
+                    payables, Accounts receivables, Acquisitions net, Capital expenditure, Cash at
+                    beginning of period, Cash at end of period, Change in working capital, Common stock
+                    issued, Common stock repurchased, Debt repayment, Deferred income tax, Depreciation and
+                    amortization, Dividends paid, Effect of forex changes on cash, Filling date, Final
+                    link, Free cash flow, Inventory, Investments in property plant and equipment, Link, Net
+                    cash provided by operating activities, Net cash used for investing activities, Net cash
+                    used provided by financing activities, Net change in cash, Net income, Operating cash
+                    flow, Other financing activities, Other investing activities, Other non cash items,
+                    Other working capital, Period, Purchases of investments, Sales maturities of
+                    investments, Stock based compensation. [Source: Financial Modeling Prep]
+                """,
+    "metrics": """
+                    Prints a list of the key metrics of a company over time. This can be either
+                    quarterly or annually. This includes, among other things, Return on Equity (ROE),
+                    Working Capital, Current Ratio and Debt to Assets. The following fields are expected:
+                    Average inventory, Average payables, Average receivables, Book value per share, Capex
+                    per share, Capex to depreciation, Capex to operating cash flow, Capex to revenue, Cash
+                    per share, Current ratio, Days of inventory on hand, Days payables outstanding, Days
+                    sales outstanding, Debt to assets, Debt to equity, Dividend yield, Earnings yield,
+                    Enterprise value, Enterprise value over EBITDA, Ev to free cash flow, Ev to operating
+                    cash flow, Ev to sales, Free cash flow per share, Free cash flow yield, Graham net net,
+                    Graham number, Income quality, Intangibles to total assets, Interest debt per share,
+                    Inventory turnover, Market cap, Net current asset value, Net debt to EBITDA, Net income
+                    per share, Operating cash flow per share, Payables turnover, Payout ratio, Pb ratio, Pe
+                    ratio, Pfcf ratio, Pocfratio, Price to sales ratio, Ptb ratio, Receivables turnover,
+                    Research and development to revenue, Return on tangible assets, Revenue per share,
+                    Roe, Roic, Sales general and administrative to revenue, Shareholders equity per
+                    share, Stock based compensation to revenue, Tangible book value per share, and Working
+                    capital. [Source: Financial Modeling Prep]
+                """,
+    "ratios": """
+                    Prints in-depth ratios of a company over time. This can be either quarterly or
+                    annually. This contains, among other things, Price-to-Book Ratio, Payout Ratio and
+                    Operating Cycle. The following fields are expected: Asset turnover, Capital expenditure
+                    coverage ratio, Cash conversion cycle, Cash flow coverage ratios, Cash flow to debt
+                    ratio, Cash per share, Cash ratio, Company equity multiplier, Current ratio, Days of
+                    inventory outstanding, Days of payables outstanding, Days of sales outstanding, Debt
+                    equity ratio, Debt ratio, Dividend paid and capex coverage ratio, Dividend payout ratio,
+                    Dividend yield, Ebit per revenue, Ebt per ebit, Effective tax rate, Enterprise value
+                    multiple, Fixed asset turnover, Free cash flow operating cash flow ratio, Free cash
+                    flow per share, Gross profit margin, Inventory turnover, Long term debt to
+                    capitalization, Net income per EBT, Net profit margin, Operating cash flow per share,
+                    Operating cash flow sales ratio, Operating cycle, Operating profit margin, Payables
+                    turnover, Payout ratio, Pretax profit margin, Price book value ratio, Price cash flow
+                    ratio, Price earnings ratio, Price earnings to growth ratio, Price fair value,
+                    Price sales ratio, Price to book ratio, Price to free cash flows ratio, Price to
+                    operating cash flows ratio, Price to sales ratio, Quick ratio, Receivables turnover,
+                    Return on assets, Return on capital employed, Return on equity, Short term coverage
+                    ratios, and Total debt to capitalization. [Source: Financial Modeling Prep]
+                """,
+    "growth": """ Prints the growth of several financial statement items and ratios over
+                time. This can be either annually and quarterly. These are, among other things, Revenue
+                Growth (3, 5 and 10 years), inventory growth and operating cash flow growth (3, 5 and 10
+                years). The following fields are expected: Asset growth, Book valueper share growth, Debt
+                growth, Dividendsper share growth, Ebitgrowth, Epsdiluted growth, Epsgrowth, Five y
+                dividendper share growth per share, Five y net income growth per share, Five y operating c
+                f growth per share, Five y revenue growth per share, Five y shareholders equity growth per
+                share, Free cash flow growth, Gross profit growth, Inventory growth, Net income growth,
+                Operating cash flow growth, Operating income growth, Rdexpense growth, Receivables growth,
+                Revenue growth, Sgaexpenses growth, Ten y dividendper share growth per share, Ten y net
+                income growth per share, Ten y operating c f growth per share, Ten y revenue growth per
+                share, Ten y shareholders equity growth per share, Three y dividendper share growth per
+                share, Three y net income growth per share, Three y operating c f growth per share, Three y
+                revenue growth per share, Three y shareholders equity growth per share, Weighted average
+                shares diluted growth, and Weighted average shares growth [Source: Financial Modeling Prep]
+                """,
+}
+
 
 class FinancialModelingPrepController:
     """Financial Modeling Prep Controller"""
 
-    # Command choices
-    CHOICES = [
-        "cls",
-        "home",
-        "h",
-        "?",
-        "help",
-        "q",
-        "quit",
-        "..",
-        "exit",
-        "r",
-        "reset",
-    ]
-
     CHOICES_COMMANDS = [
         "profile",
         "quote",
@@ -51,7 +173,31 @@ class FinancialModelingPrepController:
         "ratios",
         "growth",
     ]
-    CHOICES += CHOICES_COMMANDS
+
+    # Frozen so the switch fast path and menu loop get O(1) membership
+    CHOICES = frozenset(
+        (
+            "cls",
+            "home",
+            "h",
+            "?",
+            "help",
+            "q",
+            "quit",
+            "..",
+            "exit",
+            "r",
+            "reset",
+            *CHOICES_COMMANDS,
+        )
+    )
+
+    # Command parsers are configuration-only, so they are built once on first
+    # use and shared across instances instead of rebuilt per invocation
+    _PARSERS: Dict[str, argparse.ArgumentParser] = {}
+
+    # Command name -> unbound call_* method, populated after the class body
+    _DISPATCH: Dict[str, Callable] = {}
 
     def __init__(
         self,
@@ -80,15 +226,11 @@ class FinancialModelingPrepController:
             "cmd",
             choices=self.CHOICES,
         )
-        self.completer: Union[None, NestedCompleter] = None
-        if session and gtff.USE_PROMPT_TOOLKIT:
-            choices: dict = {c: {} for c in self.CHOICES}
-            self.completer = NestedCompleter.from_nested_dict(choices)
+        self.completer = _COMPLETER
 
-        if queue:
-            self.queue = queue
-        else:
-            self.queue = list()
+        # deque so the menu loop consumes commands with O(1) popleft instead
+        # of re-slicing a list
+        self.queue = deque(queue) if queue else deque()
 
     def print_help(self):
         """Print help"""
@@ -139,38 +281,41 @@ Ticker: {self.ticker}
                 an_input = actions[0]
 
             # Add all instructions to the queue
-            for cmd in actions[1:][::-1]:
-                if cmd:
-                    self.queue.insert(0, cmd)
+            self.queue.extendleft(cmd for cmd in reversed(actions[1:]) if cmd)
 
-        (known_args, other_args) = self.fmp_parser.parse_known_args(an_input.split())
+        # A single known command without arguments does not need argparse
+        head, _, rest = an_input.partition(" ")
+        if not rest and head in self.CHOICES:
+            cmd = head
+            other_args: List[str] = []
+        else:
+            # Reuse the partition above rather than re-splitting the full
+            # string; rest keeps any argument tokens
+            (known_args, other_args) = self.fmp_parser.parse_known_args(
+                [head, *rest.split()] if rest else [head]
+            )
+            cmd = known_args.cmd
 
         # Redirect commands to their correct functions
-        if known_args.cmd:
-            if known_args.cmd in ("..", "q"):
-                known_args.cmd = "quit"
-            elif known_args.cmd in ("?", "h"):
-                known_args.cmd = "help"
-            elif known_args.cmd == "r":
-                known_args.cmd = "reset"
-
-        getattr(
-            self,
-            "call_" + known_args.cmd,
-            lambda _: "Command not recognized!",
-        )(other_args)
+        if cmd:
+            cmd = _ALIASES.get(cmd, cmd)
+
+        self._DISPATCH.get(cmd, FinancialModelingPrepController._unknown)(
+            self, other_args
+        )
 
         return self.queue
 
+    def _unknown(self, _):
+        """Process commands that are not recognized."""
+
     def call_cls(self, _):
         """Process cls command"""
         system_clear()
 
     def call_home(self, _):
         """Process home command"""
-        self.queue.insert(0, "quit")
-        self.queue.insert(0, "quit")
-        self.queue.insert(0, "quit")
+        self.queue.extendleft(("quit", "quit", "quit"))
 
     def call_help(self, _):
         """Process help command"""
@@ -178,102 +323,109 @@ Ticker: {self.ticker}
 
     def call_quit(self, _):
         """Process quit menu command"""
-        self.queue.insert(0, "quit")
+        self.queue.appendleft("quit")
 
     def call_exit(self, _):
         """Process exit terminal command"""
-        self.queue.insert(0, "quit")
-        self.queue.insert(0, "quit")
-        self.queue.insert(0, "quit")
-        self.queue.insert(0, "quit")
+        self.queue.extendleft(("quit", "quit", "quit", "quit"))
 
     def call_reset(self, _):
         """Process reset command"""
-        self.queue.insert(0, "fmp")
-        self.queue.insert(0, "fa")
-        if self.ticker:
-            self.queue.insert(0, f"load {self.ticker}")
-        self.queue.insert(0, "stocks")
-        self.queue.insert(0, "reset")
-        self.queue.insert(0, "quit")
-        self.queue.insert(0, "quit")
-        self.queue.insert(0, "quit")
+        self.queue.extendleft(
+            reversed(
+                [
+                    "quit",
+                    "quit",
+                    "quit",
+                    "reset",
+                    "stocks",
+                    *([f"load {self.ticker}"] if self.ticker else []),
+                    "fa",
+                    "fmp",
+                ]
+            )
+        )
 
     @try_except
     def call_profile(self, other_args: List[str]):
         """Process profile command"""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="profile",
-            description="""
-                Prints information about, among other things, the industry, sector exchange and company
-                description. The following fields are expected: Address, Beta, Ceo, Changes, Cik, City
-                Company name, Country, Currency, Cusip, Dcf, Dcf diff, Default image, Description,
-                Exchange, Exchange short name, Full time employees, Image, Industry, Ipo date, Isin,
-                Last div, Mkt cap, Phone, Price, Range, Sector, State, Symbol, Vol avg, Website, Zip.
-                [Source: Financial Modeling Prep]
-            """,
-        )
+        parser = self._PARSERS.get("profile")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="profile",
+                description=_DESCRIPTIONS["profile"],
+            )
+            self._PARSERS["profile"] = parser
         ns_parser = parse_known_args_and_warn(parser, other_args)
         if ns_parser:
+            # pylint: disable=import-outside-toplevel
+            from gamestonk_terminal.stocks.fundamental_analysis.financial_modeling_prep import (  # noqa: E501
+                fmp_view,
+            )
+
             fmp_view.display_profile(self.ticker)
 
     @try_except
     def call_quote(self, other_args: List[str]):
         """Process quote command"""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="quote",
-            description="""
-                Prints actual information about the company which is, among other things, the day high,
-                market cap, open and close price and price-to-equity ratio. The following fields are
-                expected: Avg volume, Change, Changes percentage, Day high, Day low, Earnings
-                announcement, Eps, Exchange, Market cap, Name, Open, Pe, Previous close, Price, Price
-                avg200, Price avg50, Shares outstanding, Symbol, Timestamp, Volume, Year high, and Year
-                low. [Source: Financial Modeling Prep]
-            """,
-        )
+        parser = self._PARSERS.get("quote")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="quote",
+                description=_DESCRIPTIONS["quote"],
+            )
+            self._PARSERS["quote"] = parser
         ns_parser = parse_known_args_and_warn(parser, other_args)
         if ns_parser:
+            # pylint: disable=import-outside-toplevel
+            from gamestonk_terminal.stocks.fundamental_analysis.financial_modeling_prep import (  # noqa: E501
+                fmp_view,
+            )
+
             fmp_view.display_quote(self.ticker)
 
     @try_except
     def call_enterprise(self, other_args: List[str]):
         """Process income command"""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="enterprise",
-            description="""
-                Prints stock price, number of shares, market capitalization and
-                enterprise value over time. The following fields are expected: Add total debt,
-                Enterprise value, Market capitalization, Minus cash and cash equivalents, Number
-                of shares, Stock price, and Symbol. [Source: Financial Modeling Prep]
-            """,
-        )
-        parser.add_argument(
-            "-l",
-            "--limit",
-            action="store",
-            dest="limit",
-            type=check_positive,
-            default=1,
-            help="Limit of latest years/quarters.",
-        )
-        parser.add_argument(
-            "-q",
-            "--quarter",
-            action="store_true",
-            default=False,
-            dest="b_quarter",
-            help="Quarter fundamental data flag.",
-        )
+        parser = self._PARSERS.get("enterprise")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="enterprise",
+                description=_DESCRIPTIONS["enterprise"],
+            )
+            parser.add_argument(
+                "-l",
+                "--limit",
+                action="store",
+                dest="limit",
+                type=check_positive,
+                default=1,
+                help="Limit of latest years/quarters.",
+            )
+            parser.add_argument(
+                "-q",
+                "--quarter",
+                action="store_true",
+                default=False,
+                dest="b_quarter",
+                help="Quarter fundamental data flag.",
+            )
+            self._PARSERS["enterprise"] = parser
         ns_parser = parse_known_args_and_warn(
             parser, other_args, export_allowed=EXPORT_ONLY_RAW_DATA_ALLOWED
         )
         if ns_parser:
+            # pylint: disable=import-outside-toplevel
+            from gamestonk_terminal.stocks.fundamental_analysis.financial_modeling_prep import (  # noqa: E501
+                fmp_view,
+            )
+
             fmp_view.display_enterprise(
                 ticker=self.ticker,
                 number=ns_parser.limit,
@@ -284,37 +436,41 @@ Ticker: {self.ticker}
     @try_except
     def call_dcf(self, other_args: List[str]):
         """Process dcf command"""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="dcf",
-            description="""
-                Prints the discounted cash flow of a company over time including the DCF of today. The
-                following fields are expected: DCF, Stock price, and Date. [Source: Financial Modeling
-                Prep]
-            """,
-        )
-        parser.add_argument(
-            "-l",
-            "--limit",
-            action="store",
-            dest="limit",
-            type=check_positive,
-            default=1,
-            help="Limit of latest years/quarters.",
-        )
-        parser.add_argument(
-            "-q",
-            "--quarter",
-            action="store_true",
-            default=False,
-            dest="b_quarter",
-            help="Quarter fundamental data flag.",
-        )
+        parser = self._PARSERS.get("dcf")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="dcf",
+                description=_DESCRIPTIONS["dcf"],
+            )
+            parser.add_argument(
+                "-l",
+                "--limit",
+                action="store",
+                dest="limit",
+                type=check_positive,
+                default=1,
+                help="Limit of latest years/quarters.",
+            )
+            parser.add_argument(
+                "-q",
+                "--quarter",
+                action="store_true",
+                default=False,
+                dest="b_quarter",
+                help="Quarter fundamental data flag.",
+            )
+            self._PARSERS["dcf"] = parser
         ns_parser = parse_known_args_and_warn(
             parser, other_args, export_allowed=EXPORT_ONLY_RAW_DATA_ALLOWED
         )
         if ns_parser:
+            # pylint: disable=import-outside-toplevel
+            from gamestonk_terminal.stocks.fundamental_analysis.financial_modeling_prep import (  # noqa: E501
+                fmp_view,
+            )
+
             fmp_view.display_discounted_cash_flow(
                 ticker=self.ticker,
                 number=ns_parser.limit,
@@ -325,43 +481,41 @@ Ticker: {self.ticker}
     @try_except
     def call_income(self, other_args: List[str]):
         """Process income command"""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="inc",
-            description="""
-                Prints a complete income statement over time. This can be either quarterly or annually.
-                The following fields are expected: Accepted date, Cost and expenses, Cost of
-                revenue, Depreciation and amortization, Ebitda, Ebitdaratio, Eps, Epsdiluted, Filling
-                date, Final link, General and administrative expenses, Gross profit, Gross profit
-                ratio, Income before tax, Income before tax ratio, Income tax expense, Interest
-                expense, Link, Net income, Net income ratio, Operating expenses, Operating income,
-                Operating income ratio, Other expenses, Period, Research and development expenses,
-                Revenue, Selling and marketing expenses, Total other income expenses net, Weighted
-                average shs out, Weighted average shs out dil [Source: Financial Modeling Prep]
-            """,
-        )
-        parser.add_argument(
-            "-l",
-            "--limit",
-            action="store",
-            dest="limit",
-            type=check_positive,
-            default=1,
-            help="Limit of latest years/quarters.",
-        )
-        parser.add_argument(
-            "-q",
-            "--quarter",
-            action="store_true",
-            default=False,
-            dest="b_quarter",
-            help="Quarter fundamental data flag.",
-        )
+        parser = self._PARSERS.get("income")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="inc",
+                description=_DESCRIPTIONS["income"],
+            )
+            parser.add_argument(
+                "-l",
+                "--limit",
+                action="store",
+                dest="limit",
+                type=check_positive,
+                default=1,
+                help="Limit of latest years/quarters.",
+            )
+            parser.add_argument(
+                "-q",
+                "--quarter",
+                action="store_true",
+                default=False,
+                dest="b_quarter",
+                help="Quarter fundamental data flag.",
+            )
+            self._PARSERS["income"] = parser
         ns_parser = parse_known_args_and_warn(
             parser, other_args, export_allowed=EXPORT_ONLY_RAW_DATA_ALLOWED
         )
         if ns_parser:
+            # pylint: disable=import-outside-toplevel
+            from gamestonk_terminal.stocks.fundamental_analysis.financial_modeling_prep import (  # noqa: E501
+                fmp_view,
+            )
+
             fmp_view.display_income_statement(
                 ticker=self.ticker,
                 number=ns_parser.limit,
@@ -372,48 +526,41 @@ Ticker: {self.ticker}
     @try_except
     def call_balance(self, other_args: List[str]):
         """Process balance command"""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="bal",
-            description="""
-                Prints a complete balance sheet statement over time. This can be
-                either quarterly or annually. The following fields are expected: Accepted date,
-                Account payables, Accumulated other comprehensive income loss, Cash and cash
-                equivalents, Cash and short term investments, Common stock, Deferred revenue,
-                Deferred revenue non current, Deferred tax liabilities non current, Filling date,
-                Final link, Goodwill, Goodwill and intangible assets, Intangible assets, Inventory,
-                Link, Long term debt, Long term investments, Net debt, Net receivables, Other assets,
-                Other current assets, Other current liabilities, Other liabilities, Other non current
-                assets, Other non current liabilities, Othertotal stockholders equity, Period, Property
-                plant equipment net, Retained earnings, Short term debt, Short term investments, Tax
-                assets, Tax payables, Total assets, Total current assets, Total current liabilities,
-                Total debt, Total investments, Total liabilities, Total liabilities and stockholders
-                equity, Total non current assets, Total non current liabilities, and Total stockholders
-                equity. [Source: Financial Modeling Prep]
-            """,
-        )
-        parser.add_argument(
-            "-l",
-            "--limit",
-            action="store",
-            dest="limit",
-            type=check_positive,
-            default=1,
-            help="Limit of latest years/quarters.",
-        )
-        parser.add_argument(
-            "-q",
-            "--quarter",
-            action="store_true",
-            default=False,
-            dest="b_quarter",
-            help="Quarter fundamental data flag.",
-        )
+        parser = self._PARSERS.get("balance")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="bal",
+                description=_DESCRIPTIONS["balance"],
+            )
+            parser.add_argument(
+                "-l",
+                "--limit",
+                action="store",
+                dest="limit",
+                type=check_positive,
+                default=1,
+                help="Limit of latest years/quarters.",
+            )
+            parser.add_argument(
+                "-q",
+                "--quarter",
+                action="store_true",
+                default=False,
+                dest="b_quarter",
+                help="Quarter fundamental data flag.",
+            )
+            self._PARSERS["balance"] = parser
         ns_parser = parse_known_args_and_warn(
             parser, other_args, export_allowed=EXPORT_ONLY_RAW_DATA_ALLOWED
         )
         if ns_parser:
+            # pylint: disable=import-outside-toplevel
+            from gamestonk_terminal.stocks.fundamental_analysis.financial_modeling_prep import (  # noqa: E501
+                fmp_view,
+            )
+
             fmp_view.display_balance_sheet(
                 ticker=self.ticker,
                 number=ns_parser.limit,
@@ -424,46 +571,41 @@ Ticker: {self.ticker}
     @try_except
     def call_cash(self, other_args: List[str]):
         """Process cash command"""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="cash",
-            description="""
-                Prints a complete cash flow statement over time. This can be either
-                quarterly or annually. The following fields are expected: Accepted date, Accounts
-                payables, Accounts receivables, Acquisitions net, Capital expenditure, Cash at
-                beginning of period, Cash at end of period, Change in working capital, Common stock
-                issued, Common stock repurchased, Debt repayment, Deferred income tax, Depreciation and
-                amortization, Dividends paid, Effect of forex changes on cash, Filling date, Final
-                link, Free cash flow, Inventory, Investments in property plant and equipment, Link, Net
-                cash provided by operating activities, Net cash used for investing activities, Net cash
-                used provided by financing activities, Net change in cash, Net income, Operating cash
-                flow, Other financing activities, Other investing activities, Other non cash items,
-                Other working capital, Period, Purchases of investments, Sales maturities of
-                investments, Stock based compensation. [Source: Financial Modeling Prep]
-            """,
-        )
-        parser.add_argument(
-            "-l",
-            "--limit",
-            action="store",
-            dest="limit",
-            type=check_positive,
-            default=1,
-            help="Limit of latest years/quarters.",
-        )
-        parser.add_argument(
-            "-q",
-            "--quarter",
-            action="store_true",
-            default=False,
-            dest="b_quarter",
-            help="Quarter fundamental data flag.",
-        )
+        parser = self._PARSERS.get("cash")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="cash",
+                description=_DESCRIPTIONS["cash"],
+            )
+            parser.add_argument(
+                "-l",
+                "--limit",
+                action="store",
+                dest="limit",
+                type=check_positive,
+                default=1,
+                help="Limit of latest years/quarters.",
+            )
+            parser.add_argument(
+                "-q",
+                "--quarter",
+                action="store_true",
+                default=False,
+                dest="b_quarter",
+                help="Quarter fundamental data flag.",
+            )
+            self._PARSERS["cash"] = parser
         ns_parser = parse_known_args_and_warn(
             parser, other_args, export_allowed=EXPORT_ONLY_RAW_DATA_ALLOWED
         )
         if ns_parser:
+            # pylint: disable=import-outside-toplevel
+            from gamestonk_terminal.stocks.fundamental_analysis.financial_modeling_prep import (  # noqa: E501
+                fmp_view,
+            )
+
             fmp_view.display_cash_flow(
                 ticker=self.ticker,
                 number=ns_parser.limit,
@@ -474,51 +616,41 @@ Ticker: {self.ticker}
     @try_except
     def call_metrics(self, other_args: List[str]):
         """Process metrics command"""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="metrics",
-            description="""
-                Prints a list of the key metrics of a company over time. This can be either
-                quarterly or annually. This includes, among other things, Return on Equity (ROE),
-                Working Capital, Current Ratio and Debt to Assets. The following fields are expected:
-                Average inventory, Average payables, Average receivables, Book value per share, Capex
-                per share, Capex to depreciation, Capex to operating cash flow, Capex to revenue, Cash
-                per share, Current ratio, Days of inventory on hand, Days payables outstanding, Days
-                sales outstanding, Debt to assets, Debt to equity, Dividend yield, Earnings yield,
-                Enterprise value, Enterprise value over EBITDA, Ev to free cash flow, Ev to operating
-                cash flow, Ev to sales, Free cash flow per share, Free cash flow yield, Graham net net,
-                Graham number, Income quality, Intangibles to total assets, Interest debt per share,
-                Inventory turnover, Market cap, Net current asset value, Net debt to EBITDA, Net income
-                per share, Operating cash flow per share, Payables turnover, Payout ratio, Pb ratio, Pe
-                ratio, Pfcf ratio, Pocfratio, Price to sales ratio, Ptb ratio, Receivables turnover,
-                Research and development to revenue, Return on tangible assets, Revenue per share,
-                Roe, Roic, Sales general and administrative to revenue, Shareholders equity per
-                share, Stock based compensation to revenue, Tangible book value per share, and Working
-                capital. [Source: Financial Modeling Prep]
-            """,
-        )
-        parser.add_argument(
-            "-l",
-            "--limit",
-            action="store",
-            dest="limit",
-            type=check_positive,
-            default=1,
-            help="Limit of latest years/quarters.",
-        )
-        parser.add_argument(
-            "-q",
-            "--quarter",
-            action="store_true",
-            default=False,
-            dest="b_quarter",
-            help="Quarter fundamental data flag.",
-        )
+        parser = self._PARSERS.get("metrics")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="metrics",
+                description=_DESCRIPTIONS["metrics"],
+            )
+            parser.add_argument(
+                "-l",
+                "--limit",
+                action="store",
+                dest="limit",
+                type=check_positive,
+                default=1,
+                help="Limit of latest years/quarters.",
+            )
+            parser.add_argument(
+                "-q",
+                "--quarter",
+                action="store_true",
+                default=False,
+                dest="b_quarter",
+                help="Quarter fundamental data flag.",
+            )
+            self._PARSERS["metrics"] = parser
         ns_parser = parse_known_args_and_warn(
             parser, other_args, export_allowed=EXPORT_ONLY_RAW_DATA_ALLOWED
         )
         if ns_parser:
+            # pylint: disable=import-outside-toplevel
+            from gamestonk_terminal.stocks.fundamental_analysis.financial_modeling_prep import (  # noqa: E501
+                fmp_view,
+            )
+
             fmp_view.display_key_metrics(
                 ticker=self.ticker,
                 number=ns_parser.limit,
@@ -529,52 +661,41 @@ Ticker: {self.ticker}
     @try_except
     def call_ratios(self, other_args: List[str]):
         """Process cash command"""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="ratios",
-            description="""
-                Prints in-depth ratios of a company over time. This can be either quarterly or
-                annually. This contains, among other things, Price-to-Book Ratio, Payout Ratio and
-                Operating Cycle. The following fields are expected: Asset turnover, Capital expenditure
-                coverage ratio, Cash conversion cycle, Cash flow coverage ratios, Cash flow to debt
-                ratio, Cash per share, Cash ratio, Company equity multiplier, Current ratio, Days of
-                inventory outstanding, Days of payables outstanding, Days of sales outstanding, Debt
-                equity ratio, Debt ratio, Dividend paid and capex coverage ratio, Dividend payout ratio,
-                Dividend yield, Ebit per revenue, Ebt per ebit, Effective tax rate, Enterprise value
-                multiple, Fixed asset turnover, Free cash flow operating cash flow ratio, Free cash
-                flow per share, Gross profit margin, Inventory turnover, Long term debt to
-                capitalization, Net income per EBT, Net profit margin, Operating cash flow per share,
-                Operating cash flow sales ratio, Operating cycle, Operating profit margin, Payables
-                turnover, Payout ratio, Pretax profit margin, Price book value ratio, Price cash flow
-                ratio, Price earnings ratio, Price earnings to growth ratio, Price fair value,
-                Price sales ratio, Price to book ratio, Price to free cash flows ratio, Price to
-                operating cash flows ratio, Price to sales ratio, Quick ratio, Receivables turnover,
-                Return on assets, Return on capital employed, Return on equity, Short term coverage
-                ratios, and Total debt to capitalization. [Source: Financial Modeling Prep]
-            """,
-        )
-        parser.add_argument(
-            "-l",
-            "--limit",
-            action="store",
-            dest="limit",
-            type=check_positive,
-            default=1,
-            help="Limit of latest years/quarters.",
-        )
-        parser.add_argument(
-            "-q",
-            "--quarter",
-            action="store_true",
-            default=False,
-            dest="b_quarter",
-            help="Quarter fundamental data flag.",
-        )
+        parser = self._PARSERS.get("ratios")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="ratios",
+                description=_DESCRIPTIONS["ratios"],
+            )
+            parser.add_argument(
+                "-l",
+                "--limit",
+                action="store",
+                dest="limit",
+                type=check_positive,
+                default=1,
+                help="Limit of latest years/quarters.",
+            )
+            parser.add_argument(
+                "-q",
+                "--quarter",
+                action="store_true",
+                default=False,
+                dest="b_quarter",
+                help="Quarter fundamental data flag.",
+            )
+            self._PARSERS["ratios"] = parser
         ns_parser = parse_known_args_and_warn(
             parser, other_args, export_allowed=EXPORT_ONLY_RAW_DATA_ALLOWED
         )
         if ns_parser:
+            # pylint: disable=import-outside-toplevel
+            from gamestonk_terminal.stocks.fundamental_analysis.financial_modeling_prep import (  # noqa: E501
+                fmp_view,
+            )
+
             fmp_view.display_financial_ratios(
                 ticker=self.ticker,
                 number=ns_parser.limit,
@@ -585,48 +706,41 @@ Ticker: {self.ticker}
     @try_except
     def call_growth(self, other_args: List[str]):
         """Process cash command"""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="growth",
-            description=""" Prints the growth of several financial statement items and ratios over
-            time. This can be either annually and quarterly. These are, among other things, Revenue
-            Growth (3, 5 and 10 years), inventory growth and operating cash flow growth (3, 5 and 10
-            years). The following fields are expected: Asset growth, Book valueper share growth, Debt
-            growth, Dividendsper share growth, Ebitgrowth, Epsdiluted growth, Epsgrowth, Five y
-            dividendper share growth per share, Five y net income growth per share, Five y operating c
-            f growth per share, Five y revenue growth per share, Five y shareholders equity growth per
-            share, Free cash flow growth, Gross profit growth, Inventory growth, Net income growth,
-            Operating cash flow growth, Operating income growth, Rdexpense growth, Receivables growth,
-            Revenue growth, Sgaexpenses growth, Ten y dividendper share growth per share, Ten y net
-            income growth per share, Ten y operating c f growth per share, Ten y revenue growth per
-            share, Ten y shareholders equity growth per share, Three y dividendper share growth per
-            share, Three y net income growth per share, Three y operating c f growth per share, Three y
-            revenue growth per share, Three y shareholders equity growth per share, Weighted average
-            shares diluted growth, and Weighted average shares growth [Source: Financial Modeling Prep]
-            """,
-        )
-        parser.add_argument(
-            "-l",
-            "--limit",
-            action="store",
-            dest="limit",
-            type=check_positive,
-            default=1,
-            help="Limit of latest years/quarters.",
-        )
-        parser.add_argument(
-            "-q",
-            "--quarter",
-            action="store_true",
-            default=False,
-            dest="b_quarter",
-            help="Quarter fundamental data flag.",
-        )
+        parser = self._PARSERS.get("growth")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="growth",
+                description=_DESCRIPTIONS["growth"],
+            )
+            parser.add_argument(
+                "-l",
+                "--limit",
+                action="store",
+                dest="limit",
+                type=check_positive,
+                default=1,
+                help="Limit of latest years/quarters.",
+            )
+            parser.add_argument(
+                "-q",
+                "--quarter",
+                action="store_true",
+                default=False,
+                dest="b_quarter",
+                help="Quarter fundamental data flag.",
+            )
+            self._PARSERS["growth"] = parser
         ns_parser = parse_known_args_and_warn(
             parser, other_args, export_allowed=EXPORT_ONLY_RAW_DATA_ALLOWED
         )
         if ns_parser:
+            # pylint: disable=import-outside-toplevel
+            from gamestonk_terminal.stocks.fundamental_analysis.financial_modeling_prep import (  # noqa: E501
+                fmp_view,
+            )
+
             fmp_view.display_financial_statement_growth(
                 ticker=self.ticker,
                 number=ns_parser.limit,
@@ -635,6 +749,70 @@ Ticker: {self.ticker}
             )
 
 
+FinancialModelingPrepController._DISPATCH = {
+    name: getattr(FinancialModelingPrepController, "call_" + name)
+    for name in FinancialModelingPrepController.CHOICES
+    if hasattr(FinancialModelingPrepController, "call_" + name)
+}
+
+
+# Frozen for O(1) membership checks in the menu hot loop
+_COMMANDS_SET = frozenset(FinancialModelingPrepController.CHOICES_COMMANDS)
+
+
+# The controller choices never change at runtime, so one completer is built
+# at import time and shared by every controller instance
+_COMPLETER: Union[None, NestedCompleter] = None
+if session and gtff.USE_PROMPT_TOOLKIT:
+    _COMPLETER = NestedCompleter.from_nested_dict(
+        {c: {} for c in FinancialModelingPrepController.CHOICES}
+    )
+
+
+# Static suggestion index: CHOICES never changes, so a sorted tuple (for
+# prefix lookups) and per-choice bigram sets (for fuzzy fallback) are built
+# once instead of running SequenceMatcher over every choice per typo
+_CHOICES_SORTED = tuple(sorted(FinancialModelingPrepController.CHOICES))
+_CHOICES_BIGRAMS = {
+    c: frozenset(c[i : i + 2] for i in range(max(len(c) - 1, 1)))
+    for c in _CHOICES_SORTED
+}
+
+
+def _suggest(token: str) -> List[str]:
+    """Find the closest known command for a mistyped token.
+
+    Tries a sorted prefix match first, then falls back to Jaccard similarity
+    over bigram sets. Bigrams rather than trigrams because the command names
+    are short, and a 0.4 cutoff tracks what difflib at 0.7 used to accept.
+
+    Parameters
+    ----------
+    token : str
+        First word of the unknown input
+
+    Returns
+    -------
+    List[str]
+        Closest command, empty when nothing is similar enough
+    """
+    if not token:
+        return []
+    idx = bisect.bisect_left(_CHOICES_SORTED, token)
+    if idx < len(_CHOICES_SORTED) and _CHOICES_SORTED[idx].startswith(token):
+        return [_CHOICES_SORTED[idx]]
+    grams = frozenset(token[i : i + 2] for i in range(max(len(token) - 1, 1)))
+    best = None
+    best_score = 0.0
+    for choice, choice_grams in _CHOICES_BIGRAMS.items():
+        union = len(grams | choice_grams)
+        score = len(grams & choice_grams) / union if union else 0.0
+        if score > best_score:
+            best = choice
+            best_score = score
+    return [best] if best_score >= 0.4 else []
+
+
 def menu(
     ticker: str,
     start: str,
@@ -661,16 +839,14 @@ def menu(
         if fmp_controller.queue and len(fmp_controller.queue) > 0:
             # If the command is quitting the menu we want to return in here
             if fmp_controller.queue[0] in ("q", "..", "quit"):
-                if len(fmp_controller.queue) > 1:
-                    return fmp_controller.queue[1:]
-                return []
+                fmp_controller.queue.popleft()
+                return list(fmp_controller.queue)
 
             # Consume 1 element from the queue
-            an_input = fmp_controller.queue[0]
-            fmp_controller.queue = fmp_controller.queue[1:]
+            an_input = fmp_controller.queue.popleft()
 
             # Print the current location because this was an instruction and we want user to know what was the action
-            if an_input and an_input.split(" ")[0] in fmp_controller.CHOICES_COMMANDS:
+            if an_input and an_input.partition(" ")[0] in _COMMANDS_SET:
                 print(f"{get_flair()} /stocks/fa/fmp/ $ {an_input}")
 
         # Get input command from user
@@ -695,33 +871,29 @@ def menu(
             fmp_controller.queue = fmp_controller.switch(an_input)
 
         except SystemExit:
-            print(
-                f"\nThe command '{an_input}' doesn't exist on the /stocks/options menu.",
-                end="",
-            )
-            similar_cmd = difflib.get_close_matches(
-                an_input.split(" ")[0] if " " in an_input else an_input,
-                fmp_controller.CHOICES,
-                n=1,
-                cutoff=0.7,
-            )
+            # Collect the whole message and emit it with one write instead of
+            # a print per fragment
+            parts = [
+                f"\nThe command '{an_input}' doesn't exist on the /stocks/fa/fmp menu."
+            ]
+            head, _, tail = an_input.partition(" ")
+            similar_cmd = _suggest(head)
             if similar_cmd:
-                if " " in an_input:
-                    candidate_input = (
-                        f"{similar_cmd[0]} {' '.join(an_input.split(' ')[1:])}"
-                    )
-                else:
-                    candidate_input = similar_cmd[0]
+                candidate_input = f"{similar_cmd[0]} {tail}" if tail else similar_cmd[0]
 
                 if candidate_input == an_input:
                     an_input = ""
-                    fmp_controller.queue = []
-                    print("\n")
+                    fmp_controller.queue.clear()
+                    parts.append("\n\n")
+                    sys.stdout.write("".join(parts))
+                    sys.stdout.flush()
                     continue
 
-                print(f" Replacing by '{an_input}'.")
-                fmp_controller.queue.insert(0, an_input)
+                parts.append(f" Replacing by '{an_input}'.\n")
+                fmp_controller.queue.appendleft(an_input)
             else:
-                print("\n")
+                parts.append("\n\n")
                 an_input = ""
-                fmp_controller.queue = []
+                fmp_controller.queue.clear()
+            sys.stdout.write("".join(parts))
+            sys.stdout.flush()
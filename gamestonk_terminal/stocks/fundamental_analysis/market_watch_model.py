@@ -9,6 +9,7 @@ import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 from gamestonk_terminal.helper_funcs import (
+    cache_to_file,
     clean_data_values_to_float,
     get_user_agent,
     int_or_round_float,
@@ -120,6 +121,7 @@ def prepare_df_financials(
     return df_financials
 
 
+@cache_to_file("mw_sean_seah")
 def get_sean_seah_warnings(
     ticker: str, debug: bool = False
 ) -> Tuple[pd.DataFrame, List[str], List[str]]:
@@ -4,11 +4,19 @@ __docformat__ = "numpy"
 
 import argparse
 import difflib
-from typing import List, Union
+import functools
+import sys
+from collections import deque
+from typing import Callable, Dict, List, Union
 from datetime import datetime, timedelta
 import pandas as pd
 import numpy as np
-from prompt_toolkit.completion import NestedCompleter
+from prompt_toolkit.completion import Completer, Completion, NestedCompleter
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:
+    process = None
 
 from gamestonk_terminal import feature_flags as gtff
 from gamestonk_terminal.helper_funcs import (
@@ -22,20 +30,98 @@ from gamestonk_terminal.helper_funcs import (
     system_clear,
 )
 from gamestonk_terminal.menu import session
-from gamestonk_terminal.common.prediction_techniques import (
-    arima_view,
-    arima_model,
-    ets_model,
-    mc_model,
-    ets_view,
-    knn_view,
-    neural_networks_view,
-    regression_view,
-    pred_helper,
-    mc_view,
-)
 from gamestonk_terminal.stocks import stocks_helper
 
+# The prediction views (and pred_helper) transitively pull in TensorFlow,
+# statsmodels and sklearn, so they are imported lazily inside the handlers
+# to keep `import pred_controller` cheap for users who never run a model.
+
+# Tokens that quit the current menu when consumed from the queue
+_QUIT_TOKENS = frozenset({"q", "..", "quit"})
+
+# Shortcut commands mapped to the handler they share
+_ALIASES = {
+    "..": "quit",
+    "q": "quit",
+    "?": "help",
+    "h": "help",
+    "r": "reset",
+}
+
+
+def require_loaded(fn: Callable) -> Callable:
+    """Decorator that short-circuits a command when no stock data is loaded,
+    before any argparse work or model import happens.
+
+    Parameters
+    ----------
+    fn : Callable
+        Controller handler to wrap
+
+    Returns
+    -------
+    Callable
+        Handler that early-returns on an empty stock
+    """
+
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        if self.stock is None or self.stock.empty:
+            print("No ticker loaded. Use 'load' first.\n")
+            return None
+        return fn(self, *args, **kwargs)
+
+    return wrapper
+
+
+class _CachedFuzzyCompleter(Completer):
+    """Completer with precomputed lowercase metadata for the first token.
+
+    NestedCompleter re-normalizes the full choice list on every keystroke;
+    here the (original, lowercased) pairs are built once and the top-level
+    match is a substring check against the cached strings. Anything past the
+    first token still delegates to the wrapped NestedCompleter so per-option
+    value completion keeps working.
+    """
+
+    def __init__(self, words: List[str], nested: NestedCompleter):
+        self._words = [(w, w.lower()) for w in words]
+        self._nested = nested
+
+    def get_completions(self, document, complete_event):
+        text = document.text_before_cursor.lstrip()
+        if " " in text:
+            yield from self._nested.get_completions(document, complete_event)
+            return
+        needle = text.lower()
+        for word, word_lower in self._words:
+            if needle in word_lower:
+                yield Completion(word, start_position=-len(text))
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_next_market_days(start_ts_ns: int, n_next_days: int) -> list:
+    """Memoized market-day calendar lookup for the backtesting checks.
+
+    Keyed on the raw int64 timestamp so arguments stay hashable; repeated
+    backtest validations on the same loaded history skip the calendar walk.
+
+    Parameters
+    ----------
+    start_ts_ns : int
+        First index timestamp of the loaded stock as nanoseconds since epoch
+    n_next_days : int
+        Number of market days to look ahead
+
+    Returns
+    -------
+    list
+        Next n_next_days market days after the given timestamp
+    """
+    return get_next_stock_market_days(
+        last_stock_day=pd.Timestamp(start_ts_ns), n_next_days=n_next_days
+    )
+
 
 class PredictionTechniquesController:
     """Prediction Techniques Controller class"""
@@ -69,6 +155,40 @@ class PredictionTechniquesController:
         "mc",
     ]
     CHOICES += CHOICES_COMMANDS
+    # Interned so dispatch-dict lookups hit the pointer-equality fast path
+    CHOICES = [sys.intern(c) for c in CHOICES]
+    _CHOICES_SET = frozenset(CHOICES)
+    _COMMANDS_SET = frozenset(CHOICES_COMMANDS)
+
+    # Parsers are expensive to build, so they are constructed on first use and
+    # reused for the rest of the session. pick is excluded: its -t choices
+    # depend on the loaded stock's columns.
+    _PARSERS: Dict[str, argparse.ArgumentParser] = {}
+
+    # Command name -> bound handler, filled in once after the class body
+    _DISPATCH: Dict[str, Callable] = {}
+
+    # Parsed once at class creation; print_help only fills the dynamic fields
+    _HELP_TEMPLATE = """
+Prediction Techniques Menu:
+
+    load        load new ticker
+    pick        pick new target variable
+
+Ticker Loaded: {stock_info}
+Target Column: {target}
+
+Models:
+    ets         exponential smoothing (e.g. Holt-Winters)
+    knn         k-Nearest Neighbors
+    regression  polynomial regression
+    arima       autoregressive integrated moving average
+    mlp         MultiLayer Perceptron
+    rnn         Recurrent Neural Network
+    lstm        Long-Short Term Memory
+    conv1d      1D Convolutional Neural Network
+    mc          Monte-Carlo simulations
+        """
 
     def __init__(
         self,
@@ -79,18 +199,16 @@ class PredictionTechniquesController:
         queue: List[str] = None,
     ):
         """Constructor"""
-        stock["Returns"] = stock["Adj Close"].pct_change()
-        stock["LogRet"] = np.log(stock["Adj Close"]) - np.log(
-            stock["Adj Close"].shift(1)
-        )
-        stock = stock.rename(columns={"Adj Close": "AdjClose"})
-        stock = stock.dropna()
-
-        self.stock = stock
+        # The caller (e.g. the stocks menu) keeps using this frame, so the
+        # in-place preparation must run on our own copy
+        self.stock = self._prepare_stock(stock.copy())
+        # Cached so the backtesting checks skip a pandas indexer per command
+        self._index_first = self.stock.index[0]
         self.ticker = ticker
         self.start = start
         self.interval = interval
         self.target = "AdjClose"
+        self._refresh_target()
         self.pred_parser = argparse.ArgumentParser(add_help=False, prog="pred")
         self.pred_parser.add_argument(
             "cmd",
@@ -98,49 +216,20 @@ class PredictionTechniquesController:
         )
         self.completer: Union[None, NestedCompleter] = None
         if session and gtff.USE_PROMPT_TOOLKIT:
-            choices: dict = {c: {} for c in self.CHOICES}
-            choices["load"]["-r"] = {c: {} for c in stocks_helper.INTERVALS}
-            choices["pick"] = {c: {} for c in self.stock.columns}
-            choices["ets"]["-t"] = {c: {} for c in ets_model.TRENDS}
-            choices["ets"]["-s"] = {c: {} for c in ets_model.SEASONS}
-            choices["arima"]["-i"] = {c: {} for c in arima_model.ICS}
-            choices["mc"]["--dist"] = {c: {} for c in mc_model.DISTRIBUTIONS}
-            self.completer = NestedCompleter.from_nested_dict(choices)
-
-        if queue:
-            self.queue = queue
-        else:
-            self.queue = list()
+            self._rebuild_completer()
+
+        self.queue = deque(queue) if queue else deque()
 
     def print_help(self):
         """Print help"""
-        s_intraday = (f"Intraday {self.interval}", "Daily")[self.interval == "1440min"]
+        s_intraday = (
+            "Daily" if self.interval == "1440min" else f"Intraday {self.interval}"
+        )
+        stock_info = f"{s_intraday} Stock: {self.ticker}"
         if self.start:
-            stock_info = f"{s_intraday} Stock: {self.ticker} (from {self.start.strftime('%Y-%m-%d')})"
-        else:
-            stock_info = "{s_intraday} Stock: {self.ticker}"
+            stock_info += f" (from {self.start.strftime('%Y-%m-%d')})"
 
-        help_string = f"""
-Prediction Techniques Menu:
-
-    load        load new ticker
-    pick        pick new target variable
-
-Ticker Loaded: {stock_info}
-Target Column: {self.target}
-
-Models:
-    ets         exponential smoothing (e.g. Holt-Winters)
-    knn         k-Nearest Neighbors
-    regression  polynomial regression
-    arima       autoregressive integrated moving average
-    mlp         MultiLayer Perceptron
-    rnn         Recurrent Neural Network
-    lstm        Long-Short Term Memory
-    conv1d      1D Convolutional Neural Network
-    mc          Monte-Carlo simulations
-        """
-        print(help_string)
+        print(_rendered_help(stock_info, self.target))
 
     def switch(self, an_input: str):
         """Process and dispatch input
@@ -171,37 +260,143 @@ Models:
                 an_input = actions[0]
 
             # Add all instructions to the queue
-            for cmd in actions[1:][::-1]:
-                if cmd:
-                    self.queue.insert(0, cmd)
-
-        (known_args, other_args) = self.pred_parser.parse_known_args(an_input.split())
+            self.queue.extendleft(cmd for cmd in reversed(actions[1:]) if cmd)
+
+        # Bare known commands (the common interactive case) skip argparse;
+        # anything with arguments or an unknown head keeps full validation
+        head, _, rest = an_input.partition(" ")
+        if not rest and head in self._CHOICES_SET:
+            cmd = head
+            other_args: List[str] = []
+        else:
+            # Reuse the partition above; rest only gets tokenized when the
+            # command actually carries arguments
+            (known_args, other_args) = self.pred_parser.parse_known_args(
+                [head, *rest.split()] if rest else [head]
+            )
+            cmd = known_args.cmd
 
         # Redirect commands to their correct functions
-        if known_args.cmd:
-            if known_args.cmd in ("..", "q"):
-                known_args.cmd = "quit"
-            elif known_args.cmd in ("?", "h"):
-                known_args.cmd = "help"
-            elif known_args.cmd == "r":
-                known_args.cmd = "reset"
-
-        getattr(
-            self,
-            "call_" + known_args.cmd,
-            lambda _: "Command not recognized!",
-        )(other_args)
+        cmd = _ALIASES.get(cmd, cmd)
+        self._DISPATCH.get(cmd, PredictionTechniquesController._unknown)(
+            self, other_args
+        )
 
         return self.queue
 
+    def _unknown(self, _):
+        """Fallback when the command has no handler"""
+
+    @staticmethod
+    def _prepare_stock(df: pd.DataFrame) -> pd.DataFrame:
+        """Add the Returns/LogRet columns and normalize a loaded history.
+
+        Single pass over Adj Close: one log, an in-place diff, and Returns
+        derived from LogRet via expm1 instead of a separate pct_change scan.
+        Mutates the frame in place and returns it, so only pass frames this
+        controller owns (call_load's candidate, or a copy).
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Raw loaded history with an "Adj Close" column
+
+        Returns
+        -------
+        pd.DataFrame
+            The prepared frame with AdjClose renamed and NaN rows dropped
+        """
+        adj = df["Adj Close"].to_numpy(dtype=np.float64, copy=False)
+        log_adj = np.log(adj)
+        logret = np.empty_like(adj)
+        logret[0] = np.nan
+        np.subtract(log_adj[1:], log_adj[:-1], out=logret[1:])
+        df["LogRet"] = logret
+        df["Returns"] = np.expm1(logret)
+        df.rename(columns={"Adj Close": "AdjClose"}, inplace=True)
+        df.dropna(inplace=True)
+        return df
+
+    # Completion sub-dicts that depend only on module constants; built once on
+    # the first _rebuild_completer call and shared across rebuilds
+    _STATIC_CHOICES: Union[None, dict] = None
+
+    def _rebuild_completer(self):
+        """(Re)build the completer so pick completion tracks the loaded
+        stock's columns. Rebuilds only touch the pick entry; everything else
+        is reused from _STATIC_CHOICES."""
+        from gamestonk_terminal.common.prediction_techniques import (  # pylint: disable=import-outside-toplevel
+            arima_model,
+            ets_model,
+            mc_model,
+        )
+
+        cls = PredictionTechniquesController
+        if cls._STATIC_CHOICES is None:
+            # NestedCompleter treats None as a leaf, so dict.fromkeys avoids
+            # allocating a throwaway empty dict per choice
+            cls._STATIC_CHOICES = {
+                "load": {"-r": dict.fromkeys(stocks_helper.INTERVALS, None)},
+                "ets": {
+                    "-t": dict.fromkeys(ets_model.TRENDS, None),
+                    "-s": dict.fromkeys(ets_model.SEASONS, None),
+                },
+                "arima": {"-i": dict.fromkeys(arima_model.ICS, None)},
+                "mc": {"--dist": dict.fromkeys(mc_model.DISTRIBUTIONS, None)},
+            }
+
+        choices: dict = dict.fromkeys(self.CHOICES, None)
+        choices.update(cls._STATIC_CHOICES)
+        choices["pick"] = dict.fromkeys(self.stock.columns, None)
+        self.completer = _CachedFuzzyCompleter(
+            list(choices), NestedCompleter.from_nested_dict(choices)
+        )
+
+    def _refresh_target(self):
+        """Cache the target column as a Series plus a contiguous float64 array.
+
+        Runs whenever self.stock or self.target changes, so the model
+        commands reuse the same objects instead of re-selecting the column
+        (and re-extracting its values) on every invocation.
+        """
+        self._target_series = self.stock[self.target]
+        self._target_array = self._target_series.to_numpy(
+            dtype=np.float64, copy=False
+        )
+
+    def _validate_backtest_end_date(self, s_end_date, n_days: int):
+        """Warn when a backtesting end date cannot be honoured.
+
+        Parameters
+        ----------
+        s_end_date : datetime
+            Backtesting end date selected by the user
+        n_days : int
+            Number of prediction days requested
+        """
+        # Compare as numpy.datetime64 (a single int64 compare) instead of
+        # dispatching through Timestamp rich comparison
+        end_ts = pd.Timestamp(s_end_date).to_datetime64()
+        if end_ts < self._index_first.to_datetime64():
+            print(
+                "Backtesting not allowed, since End Date is older than Start Date of historical data\n"
+            )
+
+        cutoff = pd.Timestamp(
+            _cached_next_market_days(self._index_first.value, 5 + n_days)[-1]
+        ).to_datetime64()
+        if end_ts < cutoff:
+            print(
+                "Backtesting not allowed, since End Date is too close to Start Date to train model\n"
+            )
+
     def call_cls(self, _):
         """Process cls command"""
         system_clear()
 
     def call_home(self, _):
         """Process home command"""
-        self.queue.insert(0, "quit")
-        self.queue.insert(0, "quit")
+        self.queue.extendleft(("quit", "quit"))
 
     def call_help(self, _):
         """Process help command"""
@@ -210,84 +405,82 @@ Models:
     def call_quit(self, _):
         """Process quit menu command"""
         print("")
-        self.queue.insert(0, "quit")
+        self.queue.appendleft("quit")
 
     def call_exit(self, _):
         """Process exit terminal command"""
-        self.queue.insert(0, "quit")
-        self.queue.insert(0, "quit")
-        self.queue.insert(0, "quit")
+        self.queue.extendleft(("quit", "quit", "quit"))
 
     def call_reset(self, _):
         """Process reset command"""
-        self.queue.insert(0, "pred")
+        commands = ["quit", "quit", "reset", "stocks"]
         if self.ticker:
-            self.queue.insert(0, f"load {self.ticker}")
-        self.queue.insert(0, "stocks")
-        self.queue.insert(0, "reset")
-        self.queue.insert(0, "quit")
-        self.queue.insert(0, "quit")
+            commands.append(f"load {self.ticker}")
+        commands.append("pred")
+        self.queue.extendleft(reversed(commands))
 
     def call_load(self, other_args: List[str]):
         """Process load command"""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="load",
-            description="Load stock ticker to perform analysis on. When the data source is 'yf', an Indian ticker can be"
-            " loaded by using '.NS' at the end, e.g. 'SBIN.NS'. See available market in"
-            " https://help.yahoo.com/kb/exchanges-data-providers-yahoo-finance-sln2310.html.",
-        )
-        parser.add_argument(
-            "-t",
-            "--ticker",
-            action="store",
-            dest="ticker",
-            required="-h" not in other_args,
-            help="Stock ticker",
-        )
-        parser.add_argument(
-            "-s",
-            "--start",
-            type=valid_date,
-            default=(datetime.now() - timedelta(days=366)).strftime("%Y-%m-%d"),
-            dest="start",
-            help="The starting date (format YYYY-MM-DD) of the stock",
-        )
-        parser.add_argument(
-            "-e",
-            "--end",
-            type=valid_date,
-            default=datetime.now().strftime("%Y-%m-%d"),
-            dest="end",
-            help="The ending date (format YYYY-MM-DD) of the stock",
-        )
-        parser.add_argument(
-            "-i",
-            "--interval",
-            action="store",
-            dest="interval",
-            type=int,
-            default=1440,
-            choices=stocks_helper.INTERVALS,
-            help="Intraday stock minutes",
-        )
-        parser.add_argument(
-            "--source",
-            action="store",
-            dest="source",
-            choices=stocks_helper.SOURCES,
-            default="yf",
-            help="Source of historical data.",
-        )
-        parser.add_argument(
-            "-p",
-            "--prepost",
-            action="store_true",
-            default=False,
-            dest="prepost",
-            help="Pre/After market hours. Only works for 'yf' source, and intraday data",
-        )
+        parser = self._PARSERS.get("load")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="load",
+                description="Load stock ticker to perform analysis on. When the data source is 'yf', an Indian ticker can be"
+                " loaded by using '.NS' at the end, e.g. 'SBIN.NS'. See available market in"
+                " https://help.yahoo.com/kb/exchanges-data-providers-yahoo-finance-sln2310.html.",
+            )
+            parser.add_argument(
+                "-t",
+                "--ticker",
+                action="store",
+                dest="ticker",
+                help="Stock ticker",
+            )
+            parser.add_argument(
+                "-s",
+                "--start",
+                type=valid_date,
+                default=None,
+                dest="start",
+                help="The starting date (format YYYY-MM-DD) of the stock",
+            )
+            parser.add_argument(
+                "-e",
+                "--end",
+                type=valid_date,
+                default=None,
+                dest="end",
+                help="The ending date (format YYYY-MM-DD) of the stock",
+            )
+            parser.add_argument(
+                "-i",
+                "--interval",
+                action="store",
+                dest="interval",
+                type=int,
+                default=1440,
+                choices=stocks_helper.INTERVALS,
+                help="Intraday stock minutes",
+            )
+            parser.add_argument(
+                "--source",
+                action="store",
+                dest="source",
+                choices=stocks_helper.SOURCES,
+                default="yf",
+                help="Source of historical data.",
+            )
+            parser.add_argument(
+                "-p",
+                "--prepost",
+                action="store_true",
+                default=False,
+                dest="prepost",
+                help="Pre/After market hours. Only works for 'yf' source, and intraday data",
+            )
+            self._PARSERS["load"] = parser
 
         # For the case where a user uses: 'load BB'
         if other_args and "-t" not in other_args and "-h" not in other_args:
@@ -297,32 +490,41 @@ Models:
             parser, other_args, EXPORT_ONLY_FIGURES_ALLOWED
         )
         if ns_parser:
+            if not ns_parser.ticker:
+                print("A ticker is required, e.g. 'load TSLA'\n")
+                return
+            # The date defaults cannot live on the cached parser as they
+            # would freeze at the first call
+            start = ns_parser.start or valid_date(
+                (datetime.now() - timedelta(days=366)).strftime("%Y-%m-%d")
+            )
+            end = ns_parser.end or valid_date(datetime.now().strftime("%Y-%m-%d"))
+
             df_stock_candidate = stocks_helper.load(
                 ns_parser.ticker,
-                ns_parser.start,
+                start,
                 ns_parser.interval,
-                ns_parser.end,
+                end,
                 ns_parser.prepost,
                 ns_parser.source,
             )
 
             if not df_stock_candidate.empty:
-                self.stock = df_stock_candidate
                 if "." in ns_parser.ticker:
                     self.ticker = ns_parser.ticker.upper().split(".")[0]
                 else:
                     self.ticker = ns_parser.ticker.upper()
 
-                self.start = ns_parser.start
+                self.start = start
                 self.interval = str(ns_parser.interval) + "min"
 
-                self.stock["Returns"] = self.stock["Adj Close"].pct_change()
-                self.stock["LogRet"] = np.log(self.stock["Adj Close"]) - np.log(
-                    self.stock["Adj Close"].shift(1)
-                )
-                self.stock = self.stock.rename(columns={"Adj Close": "AdjClose"})
-                self.stock = self.stock.dropna()
+                self.stock = self._prepare_stock(df_stock_candidate)
+                self._index_first = self.stock.index[0]
+                self._refresh_target()
+                if session and gtff.USE_PROMPT_TOOLKIT:
+                    self._rebuild_completer()
 
+    @require_loaded
     @try_except
     def call_pick(self, other_args: List[str]):
         """Process pick command"""
@@ -349,99 +551,100 @@ Models:
         )
         if ns_parser:
             self.target = ns_parser.target
+            self._refresh_target()
             print("")
 
+    @require_loaded
     @try_except
     def call_ets(self, other_args: List[str]):
         """Process ets command"""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="ets",
-            description="""
-                Exponential Smoothing, see https://otexts.com/fpp2/taxonomy.html
-
-                Trend='N',  Seasonal='N': Simple Exponential Smoothing
-                Trend='N',  Seasonal='A': Exponential Smoothing
-                Trend='N',  Seasonal='M': Exponential Smoothing
-                Trend='A',  Seasonal='N': Holt’s linear method
-                Trend='A',  Seasonal='A': Additive Holt-Winters’ method
-                Trend='A',  Seasonal='M': Multiplicative Holt-Winters’ method
-                Trend='Ad', Seasonal='N': Additive damped trend method
-                Trend='Ad', Seasonal='A': Exponential Smoothing
-                Trend='Ad', Seasonal='M': Holt-Winters’ damped method
-                Trend component: N: None, A: Additive, Ad: Additive Damped
-                Seasonality component: N: None, A: Additive, M: Multiplicative
-            """,
-        )
-        parser.add_argument(
-            "-d",
-            "--days",
-            action="store",
-            dest="n_days",
-            type=check_positive,
-            default=5,
-            help="prediction days.",
-        )
-        parser.add_argument(
-            "-t",
-            "--trend",
-            action="store",
-            dest="trend",
-            choices=ets_model.TRENDS,
-            default="N",
-            help="Trend component: N: None, A: Additive, Ad: Additive Damped.",
-        )
-        parser.add_argument(
-            "-s",
-            "--seasonal",
-            action="store",
-            dest="seasonal",
-            choices=ets_model.SEASONS,
-            default="N",
-            help="Seasonality component: N: None, A: Additive, M: Multiplicative.",
-        )
-        parser.add_argument(
-            "-p",
-            "--periods",
-            action="store",
-            dest="seasonal_periods",
-            type=check_positive,
-            default=5,
-            help="Seasonal periods.",
-        )
-        parser.add_argument(
-            "-e",
-            "--end",
-            action="store",
-            type=valid_date,
-            dest="s_end_date",
-            default=None,
-            help="The end date (format YYYY-MM-DD) to select - Backtesting",
-        )
+        parser = self._PARSERS.get("ets")
+        if parser is None:
+            from gamestonk_terminal.common.prediction_techniques import (  # pylint: disable=import-outside-toplevel
+                ets_model,
+            )
+
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="ets",
+                description="""
+                    Exponential Smoothing, see https://otexts.com/fpp2/taxonomy.html
+
+                    Trend='N',  Seasonal='N': Simple Exponential Smoothing
+                    Trend='N',  Seasonal='A': Exponential Smoothing
+                    Trend='N',  Seasonal='M': Exponential Smoothing
+                    Trend='A',  Seasonal='N': Holt’s linear method
+                    Trend='A',  Seasonal='A': Additive Holt-Winters’ method
+                    Trend='A',  Seasonal='M': Multiplicative Holt-Winters’ method
+                    Trend='Ad', Seasonal='N': Additive damped trend method
+                    Trend='Ad', Seasonal='A': Exponential Smoothing
+                    Trend='Ad', Seasonal='M': Holt-Winters’ damped method
+                    Trend component: N: None, A: Additive, Ad: Additive Damped
+                    Seasonality component: N: None, A: Additive, M: Multiplicative
+                """,
+            )
+            parser.add_argument(
+                "-d",
+                "--days",
+                action="store",
+                dest="n_days",
+                type=check_positive,
+                default=5,
+                help="prediction days.",
+            )
+            parser.add_argument(
+                "-t",
+                "--trend",
+                action="store",
+                dest="trend",
+                choices=ets_model.TRENDS,
+                default="N",
+                help="Trend component: N: None, A: Additive, Ad: Additive Damped.",
+            )
+            parser.add_argument(
+                "-s",
+                "--seasonal",
+                action="store",
+                dest="seasonal",
+                choices=ets_model.SEASONS,
+                default="N",
+                help="Seasonality component: N: None, A: Additive, M: Multiplicative.",
+            )
+            parser.add_argument(
+                "-p",
+                "--periods",
+                action="store",
+                dest="seasonal_periods",
+                type=check_positive,
+                default=5,
+                help="Seasonal periods.",
+            )
+            parser.add_argument(
+                "-e",
+                "--end",
+                action="store",
+                type=valid_date,
+                dest="s_end_date",
+                default=None,
+                help="The end date (format YYYY-MM-DD) to select - Backtesting",
+            )
+            self._PARSERS["ets"] = parser
         ns_parser = parse_known_args_and_warn(
             parser, other_args, export_allowed=EXPORT_ONLY_FIGURES_ALLOWED
         )
         if ns_parser:
 
             if ns_parser.s_end_date:
+                self._validate_backtest_end_date(ns_parser.s_end_date, ns_parser.n_days)
 
-                if ns_parser.s_end_date < self.stock.index[0]:
-                    print(
-                        "Backtesting not allowed, since End Date is older than Start Date of historical data\n"
-                    )
-
-                if ns_parser.s_end_date < get_next_stock_market_days(
-                    last_stock_day=self.stock.index[0],
-                    n_next_days=5 + ns_parser.n_days,
-                )[-1]:
-                    print(
-                        "Backtesting not allowed, since End Date is too close to Start Date to train model\n"
-                    )
+            from gamestonk_terminal.common.prediction_techniques import (  # pylint: disable=import-outside-toplevel
+                ets_view,
+            )
 
             ets_view.display_exponential_smoothing(
                 ticker=self.ticker,
-                values=self.stock[self.target],
+                values=self._target_series,
                 n_predict=ns_parser.n_days,
                 trend=ns_parser.trend,
                 seasonal=ns_parser.seasonal,
@@ -450,86 +653,94 @@ Models:
                 export=ns_parser.export,
             )
 
+    @require_loaded
     @try_except
     def call_knn(self, other_args: List[str]):
         """Process knn command"""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="knn",
-            description="""
-                K nearest neighbors is a simple algorithm that stores all
-                available cases and predict the numerical target based on a similarity measure
-                (e.g. distance functions).
-            """,
-        )
-        parser.add_argument(
-            "-i",
-            "--input",
-            action="store",
-            dest="n_inputs",
-            type=check_positive,
-            default=40,
-            help="number of days to use as input for prediction.",
-        )
-        parser.add_argument(
-            "-d",
-            "--days",
-            action="store",
-            dest="n_days",
-            type=check_positive,
-            default=5,
-            help="prediction days.",
-        )
-        parser.add_argument(
-            "-j",
-            "--jumps",
-            action="store",
-            dest="n_jumps",
-            type=check_positive,
-            default=1,
-            help="number of jumps in training data.",
-        )
-        parser.add_argument(
-            "-n",
-            "--neighbors",
-            action="store",
-            dest="n_neighbors",
-            type=check_positive,
-            default=20,
-            help="number of neighbors to use on the algorithm.",
-        )
-        parser.add_argument(
-            "-e",
-            "--end",
-            action="store",
-            type=valid_date,
-            dest="s_end_date",
-            default=None,
-            help="The end date (format YYYY-MM-DD) to select for testing",
-        )
-        parser.add_argument(
-            "-t",
-            "--test_size",
-            default=0.2,
-            dest="valid_split",
-            type=float,
-            help="Percentage of data to validate in sample",
-        )
-        parser.add_argument(
-            "--no_shuffle",
-            action="store_false",
-            dest="no_shuffle",
-            default=True,
-            help="Specify if shuffling validation inputs.",
-        )
+        parser = self._PARSERS.get("knn")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="knn",
+                description="""
+                    K nearest neighbors is a simple algorithm that stores all
+                    available cases and predict the numerical target based on a similarity measure
+                    (e.g. distance functions).
+                """,
+            )
+            parser.add_argument(
+                "-i",
+                "--input",
+                action="store",
+                dest="n_inputs",
+                type=check_positive,
+                default=40,
+                help="number of days to use as input for prediction.",
+            )
+            parser.add_argument(
+                "-d",
+                "--days",
+                action="store",
+                dest="n_days",
+                type=check_positive,
+                default=5,
+                help="prediction days.",
+            )
+            parser.add_argument(
+                "-j",
+                "--jumps",
+                action="store",
+                dest="n_jumps",
+                type=check_positive,
+                default=1,
+                help="number of jumps in training data.",
+            )
+            parser.add_argument(
+                "-n",
+                "--neighbors",
+                action="store",
+                dest="n_neighbors",
+                type=check_positive,
+                default=20,
+                help="number of neighbors to use on the algorithm.",
+            )
+            parser.add_argument(
+                "-e",
+                "--end",
+                action="store",
+                type=valid_date,
+                dest="s_end_date",
+                default=None,
+                help="The end date (format YYYY-MM-DD) to select for testing",
+            )
+            parser.add_argument(
+                "-t",
+                "--test_size",
+                default=0.2,
+                dest="valid_split",
+                type=float,
+                help="Percentage of data to validate in sample",
+            )
+            parser.add_argument(
+                "--no_shuffle",
+                action="store_false",
+                dest="no_shuffle",
+                default=True,
+                help="Specify if shuffling validation inputs.",
+            )
+            self._PARSERS["knn"] = parser
         ns_parser = parse_known_args_and_warn(
             parser, other_args, EXPORT_ONLY_FIGURES_ALLOWED
         )
         if ns_parser:
+            from gamestonk_terminal.common.prediction_techniques import (  # pylint: disable=import-outside-toplevel
+                knn_view,
+            )
+
             knn_view.display_k_nearest_neighbors(
                 ticker=self.ticker,
-                data=self.stock[self.target],
+                data=self._target_series,
                 n_neighbors=ns_parser.n_neighbors,
                 n_input_days=ns_parser.n_inputs,
                 n_predict_days=ns_parser.n_days,
@@ -538,65 +749,69 @@ Models:
                 no_shuffle=ns_parser.no_shuffle,
             )
 
+    @require_loaded
     @try_except
     def call_regression(self, other_args: List[str]):
         """Process linear command"""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            prog="regression",
-            description="""
-                Regression attempts to model the relationship between
-                two variables by fitting a linear/quadratic/cubic/other equation to
-                observed data. One variable is considered to be an explanatory variable,
-                and the other is considered to be a dependent variable.
-            """,
-        )
+        parser = self._PARSERS.get("regression")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                prog="regression",
+                description="""
+                    Regression attempts to model the relationship between
+                    two variables by fitting a linear/quadratic/cubic/other equation to
+                    observed data. One variable is considered to be an explanatory variable,
+                    and the other is considered to be a dependent variable.
+                """,
+            )
 
-        parser.add_argument(
-            "-i",
-            "--input",
-            action="store",
-            dest="n_inputs",
-            type=check_positive,
-            default=40,
-            help="number of days to use for prediction.",
-        )
-        parser.add_argument(
-            "-d",
-            "--days",
-            action="store",
-            dest="n_days",
-            type=check_positive,
-            default=5,
-            help="prediction days.",
-        )
-        parser.add_argument(
-            "-j",
-            "--jumps",
-            action="store",
-            dest="n_jumps",
-            type=check_positive,
-            default=1,
-            help="number of jumps in training data.",
-        )
-        parser.add_argument(
-            "-e",
-            "--end",
-            action="store",
-            type=valid_date,
-            dest="s_end_date",
-            default=None,
-            help="The end date (format YYYY-MM-DD) to select - Backtesting",
-        )
-        parser.add_argument(
-            "-p",
-            "--polynomial",
-            action="store",
-            dest="n_polynomial",
-            type=check_positive,
-            default=1,
-            help="polynomial associated with regression.",
-        )
+            parser.add_argument(
+                "-i",
+                "--input",
+                action="store",
+                dest="n_inputs",
+                type=check_positive,
+                default=40,
+                help="number of days to use for prediction.",
+            )
+            parser.add_argument(
+                "-d",
+                "--days",
+                action="store",
+                dest="n_days",
+                type=check_positive,
+                default=5,
+                help="prediction days.",
+            )
+            parser.add_argument(
+                "-j",
+                "--jumps",
+                action="store",
+                dest="n_jumps",
+                type=check_positive,
+                default=1,
+                help="number of jumps in training data.",
+            )
+            parser.add_argument(
+                "-e",
+                "--end",
+                action="store",
+                type=valid_date,
+                dest="s_end_date",
+                default=None,
+                help="The end date (format YYYY-MM-DD) to select - Backtesting",
+            )
+            parser.add_argument(
+                "-p",
+                "--polynomial",
+                action="store",
+                dest="n_polynomial",
+                type=check_positive,
+                default=1,
+                help="polynomial associated with regression.",
+            )
+            self._PARSERS["regression"] = parser
         if (
             other_args
             and "-h" not in other_args
@@ -609,22 +824,15 @@ Models:
         if ns_parser:
             # BACKTESTING CHECK
             if ns_parser.s_end_date:
-                if ns_parser.s_end_date < self.stock.index[0]:
-                    print(
-                        "Backtesting not allowed, since End Date is older than Start Date of historical data\n"
-                    )
-
-                if ns_parser.s_end_date < get_next_stock_market_days(
-                    last_stock_day=self.stock.index[0],
-                    n_next_days=5 + ns_parser.n_days,
-                )[-1]:
-                    print(
-                        "Backtesting not allowed, since End Date is too close to Start Date to train model\n"
-                    )
+                self._validate_backtest_end_date(ns_parser.s_end_date, ns_parser.n_days)
+
+            from gamestonk_terminal.common.prediction_techniques import (  # pylint: disable=import-outside-toplevel
+                regression_view,
+            )
 
             regression_view.display_regression(
                 dataset=self.ticker,
-                values=self.stock[self.target],
+                values=self._target_series,
                 poly_order=ns_parser.n_polynomial,
                 n_input=ns_parser.n_inputs,
                 n_predict=ns_parser.n_days,
@@ -633,100 +841,100 @@ Models:
                 export=ns_parser.export,
             )
 
+    @require_loaded
     @try_except
     def call_arima(self, other_args: List[str]):
         """Process arima command"""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="arima",
-            description="""
-                In statistics and econometrics, and in particular in time series analysis, an
-                autoregressive integrated moving average (ARIMA) model is a generalization of an
-                autoregressive moving average (ARMA) model. Both of these models are fitted to time
-                series data either to better understand the data or to predict future points in the
-                series (forecasting). ARIMA(p,d,q) where parameters p, d, and q are non-negative
-                integers, p is the order (number of time lags) of the autoregressive model, d is the
-                degree of differencing (the number of times the data have had past values subtracted),
-                and q is the order of the moving-average model.
-            """,
-        )
-        parser.add_argument(
-            "-d",
-            "--days",
-            action="store",
-            dest="n_days",
-            type=check_positive,
-            default=5,
-            help="prediction days.",
-        )
-        parser.add_argument(
-            "-i",
-            "--ic",
-            action="store",
-            dest="s_ic",
-            type=str,
-            default="aic",
-            choices=arima_model.ICS,
-            help="information criteria.",
-        )
-        parser.add_argument(
-            "-s",
-            "--seasonal",
-            action="store_true",
-            default=False,
-            dest="b_seasonal",
-            help="Use weekly seasonal data.",
-        )
-        parser.add_argument(
-            "-o",
-            "--order",
-            action="store",
-            dest="s_order",
-            default="",
-            type=str,
-            help="arima model order (p,d,q) in format: p,d,q.",
-        )
-        parser.add_argument(
-            "-r",
-            "--results",
-            action="store_true",
-            dest="b_results",
-            default=False,
-            help="results about ARIMA summary flag.",
-        )
-        parser.add_argument(
-            "-e",
-            "--end",
-            action="store",
-            type=valid_date,
-            dest="s_end_date",
-            default=None,
-            help="The end date (format YYYY-MM-DD) to select - Backtesting",
-        )
+        parser = self._PARSERS.get("arima")
+        if parser is None:
+            from gamestonk_terminal.common.prediction_techniques import (  # pylint: disable=import-outside-toplevel
+                arima_model,
+            )
+
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="arima",
+                description="""
+                    In statistics and econometrics, and in particular in time series analysis, an
+                    autoregressive integrated moving average (ARIMA) model is a generalization of an
+                    autoregressive moving average (ARMA) model. Both of these models are fitted to time
+                    series data either to better understand the data or to predict future points in the
+                    series (forecasting). ARIMA(p,d,q) where parameters p, d, and q are non-negative
+                    integers, p is the order (number of time lags) of the autoregressive model, d is the
+                    degree of differencing (the number of times the data have had past values subtracted),
+                    and q is the order of the moving-average model.
+                """,
+            )
+            parser.add_argument(
+                "-d",
+                "--days",
+                action="store",
+                dest="n_days",
+                type=check_positive,
+                default=5,
+                help="prediction days.",
+            )
+            parser.add_argument(
+                "-i",
+                "--ic",
+                action="store",
+                dest="s_ic",
+                type=str,
+                default="aic",
+                choices=arima_model.ICS,
+                help="information criteria.",
+            )
+            parser.add_argument(
+                "-s",
+                "--seasonal",
+                action="store_true",
+                default=False,
+                dest="b_seasonal",
+                help="Use weekly seasonal data.",
+            )
+            parser.add_argument(
+                "-o",
+                "--order",
+                action="store",
+                dest="s_order",
+                default="",
+                type=str,
+                help="arima model order (p,d,q) in format: p,d,q.",
+            )
+            parser.add_argument(
+                "-r",
+                "--results",
+                action="store_true",
+                dest="b_results",
+                default=False,
+                help="results about ARIMA summary flag.",
+            )
+            parser.add_argument(
+                "-e",
+                "--end",
+                action="store",
+                type=valid_date,
+                dest="s_end_date",
+                default=None,
+                help="The end date (format YYYY-MM-DD) to select - Backtesting",
+            )
+            self._PARSERS["arima"] = parser
         ns_parser = parse_known_args_and_warn(
             parser, other_args, export_allowed=EXPORT_ONLY_FIGURES_ALLOWED
         )
         if ns_parser:
             # BACKTESTING CHECK
             if ns_parser.s_end_date:
+                self._validate_backtest_end_date(ns_parser.s_end_date, ns_parser.n_days)
 
-                if ns_parser.s_end_date < self.stock.index[0]:
-                    print(
-                        "Backtesting not allowed, since End Date is older than Start Date of historical data\n"
-                    )
-
-                if ns_parser.s_end_date < get_next_stock_market_days(
-                    last_stock_day=self.stock.index[0],
-                    n_next_days=5 + ns_parser.n_days,
-                )[-1]:
-                    print(
-                        "Backtesting not allowed, since End Date is too close to Start Date to train model\n"
-                    )
+            from gamestonk_terminal.common.prediction_techniques import (  # pylint: disable=import-outside-toplevel
+                arima_view,
+            )
 
             arima_view.display_arima(
                 dataset=self.ticker,
-                values=self.stock[self.target],
+                values=self._target_series,
                 arima_order=ns_parser.s_order,
                 n_predict=ns_parser.n_days,
                 seasonal=ns_parser.b_seasonal,
@@ -736,19 +944,41 @@ Models:
                 export=ns_parser.export,
             )
 
-    @try_except
-    def call_mlp(self, other_args: List[str]):
-        """Process mlp command"""
+    # Neural-net command -> (view function name, parser description); the
+    # view module itself is resolved lazily inside _call_nn
+    _NN_METHODS = {
+        "mlp": ("display_mlp", """Multi-Layered-Perceptron. """),
+        "rnn": ("display_rnn", """Recurrent Neural Network. """),
+        "lstm": ("display_lstm", """Long-Short Term Memory. """),
+        "conv1d": ("display_conv1d", """1D CNN."""),
+    }
+
+    def _call_nn(self, name: str, other_args: List[str]):
+        """Shared handler for the neural network commands.
+
+        Parameters
+        ----------
+        name : str
+            Command name, key into _NN_METHODS
+        other_args : List[str]
+            Command line arguments after the command itself
+        """
+        from gamestonk_terminal.common.prediction_techniques import (  # pylint: disable=import-outside-toplevel
+            neural_networks_view,
+            pred_helper,
+        )
+
+        display_name, description = self._NN_METHODS[name]
         try:
             ns_parser = pred_helper.parse_args(
-                prog="mlp",
-                description="""Multi-Layered-Perceptron. """,
+                prog=name,
+                description=description,
                 other_args=other_args,
             )
             if ns_parser:
-                neural_networks_view.display_mlp(
+                getattr(neural_networks_view, display_name)(
                     dataset=self.ticker,
-                    data=self.stock[self.target],
+                    data=self._target_series,
                     n_input_days=ns_parser.n_inputs,
                     n_predict_days=ns_parser.n_days,
                     learning_rate=ns_parser.lr,
@@ -764,123 +994,68 @@ Models:
         finally:
             pred_helper.restore_env()
 
+    @require_loaded
+    @try_except
+    def call_mlp(self, other_args: List[str]):
+        """Process mlp command"""
+        self._call_nn("mlp", other_args)
+
+    @require_loaded
     def call_rnn(self, other_args: List[str]):
         """Process rnn command"""
-        try:
-            ns_parser = pred_helper.parse_args(
-                prog="rnn",
-                description="""Recurrent Neural Network. """,
-                other_args=other_args,
-            )
-            if ns_parser:
-                neural_networks_view.display_rnn(
-                    dataset=self.ticker,
-                    data=self.stock[self.target],
-                    n_input_days=ns_parser.n_inputs,
-                    n_predict_days=ns_parser.n_days,
-                    learning_rate=ns_parser.lr,
-                    epochs=ns_parser.n_epochs,
-                    batch_size=ns_parser.n_batch_size,
-                    test_size=ns_parser.valid_split,
-                    n_loops=ns_parser.n_loops,
-                    no_shuffle=ns_parser.no_shuffle,
-                )
-
-        except Exception as e:
-            print(e, "\n")
-
-        finally:
-            pred_helper.restore_env()
+        self._call_nn("rnn", other_args)
 
+    @require_loaded
     def call_lstm(self, other_args: List[str]):
         """Process lstm command"""
-        try:
-            ns_parser = pred_helper.parse_args(
-                prog="lstm",
-                description="""Long-Short Term Memory. """,
-                other_args=other_args,
-            )
-            if ns_parser:
-                neural_networks_view.display_lstm(
-                    dataset=self.ticker,
-                    data=self.stock[self.target],
-                    n_input_days=ns_parser.n_inputs,
-                    n_predict_days=ns_parser.n_days,
-                    learning_rate=ns_parser.lr,
-                    epochs=ns_parser.n_epochs,
-                    batch_size=ns_parser.n_batch_size,
-                    test_size=ns_parser.valid_split,
-                    n_loops=ns_parser.n_loops,
-                    no_shuffle=ns_parser.no_shuffle,
-                )
-
-        except Exception as e:
-            print(e, "\n")
-
-        finally:
-            pred_helper.restore_env()
+        self._call_nn("lstm", other_args)
 
+    @require_loaded
     def call_conv1d(self, other_args: List[str]):
         """Process conv1d command"""
-        try:
-            ns_parser = pred_helper.parse_args(
-                prog="conv1d",
-                description="""1D CNN.""",
-                other_args=other_args,
-            )
-            if ns_parser:
-                neural_networks_view.display_conv1d(
-                    dataset=self.ticker,
-                    data=self.stock[self.target],
-                    n_input_days=ns_parser.n_inputs,
-                    n_predict_days=ns_parser.n_days,
-                    learning_rate=ns_parser.lr,
-                    epochs=ns_parser.n_epochs,
-                    batch_size=ns_parser.n_batch_size,
-                    test_size=ns_parser.valid_split,
-                    n_loops=ns_parser.n_loops,
-                    no_shuffle=ns_parser.no_shuffle,
-                )
-
-        except Exception as e:
-            print(e, "\n")
-
-        finally:
-            pred_helper.restore_env()
+        self._call_nn("conv1d", other_args)
 
+    @require_loaded
     @try_except
     def call_mc(self, other_args: List[str]):
         """Process mc command"""
-        parser = argparse.ArgumentParser(
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            add_help=False,
-            prog="mc",
-            description="""
-                Perform Monte Carlo forecasting
-            """,
-        )
-        parser.add_argument(
-            "-d",
-            "--days",
-            help="Days to predict",
-            dest="n_days",
-            type=check_positive,
-            default=30,
-        )
-        parser.add_argument(
-            "-n",
-            "--num",
-            help="Number of simulations to perform",
-            dest="n_sims",
-            default=100,
-        )
-        parser.add_argument(
-            "--dist",
-            choices=mc_model.DISTRIBUTIONS,
-            default="lognormal",
-            dest="dist",
-            help="Whether to model returns or log returns",
-        )
+        parser = self._PARSERS.get("mc")
+        if parser is None:
+            from gamestonk_terminal.common.prediction_techniques import (  # pylint: disable=import-outside-toplevel
+                mc_model,
+            )
+
+            parser = argparse.ArgumentParser(
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                add_help=False,
+                prog="mc",
+                description="""
+                    Perform Monte Carlo forecasting
+                """,
+            )
+            parser.add_argument(
+                "-d",
+                "--days",
+                help="Days to predict",
+                dest="n_days",
+                type=check_positive,
+                default=30,
+            )
+            parser.add_argument(
+                "-n",
+                "--num",
+                help="Number of simulations to perform",
+                dest="n_sims",
+                default=100,
+            )
+            parser.add_argument(
+                "--dist",
+                choices=mc_model.DISTRIBUTIONS,
+                default="lognormal",
+                dest="dist",
+                help="Whether to model returns or log returns",
+            )
+            self._PARSERS["mc"] = parser
 
         ns_parser = parse_known_args_and_warn(
             parser, other_args, export_allowed=EXPORT_ONLY_FIGURES_ALLOWED
@@ -889,8 +1064,12 @@ Models:
             if self.target != "AdjClose":
                 print("MC Prediction designed for AdjClose prices\n")
 
+            from gamestonk_terminal.common.prediction_techniques import (  # pylint: disable=import-outside-toplevel
+                mc_view,
+            )
+
             mc_view.display_mc_forecast(
-                data=self.stock[self.target],
+                data=self._target_series,
                 n_future=ns_parser.n_days,
                 n_sims=ns_parser.n_sims,
                 use_log=ns_parser.dist == "lognormal",
@@ -898,6 +1077,81 @@ Models:
             )
 
 
+# Resolve handlers once so switch() avoids per-call getattr machinery
+PredictionTechniquesController._DISPATCH = {
+    name: getattr(PredictionTechniquesController, "call_" + name)
+    for name in PredictionTechniquesController.CHOICES
+    if hasattr(PredictionTechniquesController, "call_" + name)
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _rendered_help(stock_info: str, target: str) -> str:
+    """Cached fill of the static help template for the given dynamic fields.
+
+    Keyed on the fields themselves rather than cached per instance, so the
+    text never goes stale after a load or pick while repeat help calls for
+    the same state cost a dict lookup.
+
+    Parameters
+    ----------
+    stock_info : str
+        Rendered "Ticker Loaded" line
+    target : str
+        Current target column
+
+    Returns
+    -------
+    str
+        Fully rendered help text
+    """
+    return PredictionTechniquesController._HELP_TEMPLATE.format(
+        stock_info=stock_info, target=target
+    )
+
+
+_CHOICES_TUPLE = tuple(PredictionTechniquesController.CHOICES)
+# Lowercased parallel tuple so "LOAD" still suggests "load" without paying
+# for a per-call lower() of the whole choice list
+_CHOICES_NORM = tuple(c.lower() for c in _CHOICES_TUPLE)
+# Two-char prefixes of every command; a miss here means no 0.7-cutoff match
+# is plausible, so the fuzzy scan can be skipped outright
+_CHOICE_PREFIXES = {c[:2] for c in _CHOICES_NORM}
+
+
+@functools.lru_cache(maxsize=256)
+def _find_similar(token: str) -> tuple:
+    """Find the closest command name for a mistyped token.
+
+    Uses rapidfuzz's C implementation when available (it ships with the
+    terminal's requirements) and falls back to difflib otherwise. Memoized,
+    since users tend to retype the same mistake; a repeat miss becomes a
+    dict lookup instead of a similarity sweep over the command list.
+
+    Parameters
+    ----------
+    token : str
+        First token of the unrecognized input
+
+    Returns
+    -------
+    tuple
+        Best matching command in a one-element tuple, or an empty tuple
+    """
+    token_norm = token.lower()
+    if token_norm[:2] not in _CHOICE_PREFIXES:
+        return ()
+    if process is not None:
+        match = process.extractOne(
+            token_norm, _CHOICES_NORM, scorer=fuzz.WRatio, score_cutoff=70
+        )
+        return (_CHOICES_TUPLE[match[2]],) if match else ()
+    matches = difflib.get_close_matches(token_norm, _CHOICES_NORM, n=1, cutoff=0.7)
+    if matches:
+        return (_CHOICES_TUPLE[_CHOICES_NORM.index(matches[0])],)
+    return ()
+
+
 def menu(
     ticker: str,
     start: datetime,
@@ -913,21 +1167,23 @@ def menu(
     an_input = "HELP_ME"
 
     while True:
-        # There is a command in the queue
-        if pred_controller.queue and len(pred_controller.queue) > 0:
-            # If the command is quitting the menu we want to return in here
-            if pred_controller.queue[0] in ("q", "..", "quit"):
-                if len(pred_controller.queue) > 1:
-                    return pred_controller.queue[1:]
-                return []
+        # get_flair reads feature flags; once per iteration is enough
+        flair = get_flair()
 
-            # Consume 1 element from the queue
-            an_input = pred_controller.queue[0]
-            pred_controller.queue = pred_controller.queue[1:]
+        # There is a command in the queue
+        if pred_controller.queue:
+            # Consume 1 element from the queue; if it quits the menu, hand
+            # the remainder back to the caller
+            an_input = pred_controller.queue.popleft()
+            if an_input in _QUIT_TOKENS:
+                return list(pred_controller.queue)
 
             # Print the current location because this was an instruction and we want user to know what was the action
-            if an_input and an_input.split(" ")[0] in pred_controller.CHOICES_COMMANDS:
-                print(f"{get_flair()} /stocks/pred/ $ {an_input}")
+            if (
+                an_input
+                and an_input.partition(" ")[0] in pred_controller._COMMANDS_SET
+            ):
+                print(f"{flair} /stocks/pred/ $ {an_input}")
 
         # Get input command from user
         else:
@@ -938,13 +1194,13 @@ def menu(
             # Get input from user using auto-completion
             if session and gtff.USE_PROMPT_TOOLKIT and pred_controller.completer:
                 an_input = session.prompt(
-                    f"{get_flair()} /stocks/pred/ $ ",
+                    f"{flair} /stocks/pred/ $ ",
                     completer=pred_controller.completer,
                     search_ignore_case=True,
                 )
             # Get input from user without auto-completion
             else:
-                an_input = input(f"{get_flair()} /stocks/pred/ $ ")
+                an_input = input(f"{flair} /stocks/pred/ $ ")
 
         try:
             # Process the input command
@@ -955,29 +1211,29 @@ def menu(
                 f"\nThe command '{an_input}' doesn't exist on the /stocks/options menu.",
                 end="",
             )
-            similar_cmd = difflib.get_close_matches(
-                an_input.split(" ")[0] if " " in an_input else an_input,
-                pred_controller.CHOICES,
-                n=1,
-                cutoff=0.7,
-            )
+            # Tokenize once and reuse for the suggestion and the rebuild;
+            # partition does a single scan and allocates no list
+            head, sep, tail = an_input.partition(" ")
+
+            # A known command that raised (or a single character) gets no
+            # fuzzy pass: the former is a distance-0 hit, the latter cannot
+            # clear the cutoff anyway
+            if head in pred_controller._CHOICES_SET or len(head) <= 1:
+                similar_cmd = ()
+            else:
+                similar_cmd = _find_similar(head)
             if similar_cmd:
-                if " " in an_input:
-                    candidate_input = (
-                        f"{similar_cmd[0]} {' '.join(an_input.split(' ')[1:])}"
-                    )
-                else:
-                    candidate_input = similar_cmd[0]
+                candidate_input = f"{similar_cmd[0]} {tail}" if sep else similar_cmd[0]
 
                 if candidate_input == an_input:
                     an_input = ""
-                    pred_controller.queue = []
+                    pred_controller.queue.clear()
                     print("\n")
                     continue
 
-                print(f" Replacing by '{an_input}'.")
-                pred_controller.queue.insert(0, an_input)
+                print(f" Replacing by '{candidate_input}'.")
+                pred_controller.queue.appendleft(candidate_input)
             else:
                 print("\n")
                 an_input = ""
-                pred_controller.queue = []
+                pred_controller.queue.clear()
@@ -2,14 +2,20 @@
 __docformat__ = "numpy"
 
 import argparse
-import difflib
-from typing import List, Union
+import functools
+import sys
+from typing import Callable, Dict, List, Optional, Union
 from datetime import datetime, timedelta
 
 import numpy as np
 import pandas as pd
 
 from prompt_toolkit.completion import NestedCompleter
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:
+    process = None
 from gamestonk_terminal.common.quantitative_analysis import (
     qa_view,
     rolling_view,
@@ -29,6 +35,10 @@ from gamestonk_terminal.helper_funcs import (
 from gamestonk_terminal.menu import session
 from gamestonk_terminal.stocks.quantitative_analysis.factors_view import capm_view
 
+# Completers keyed by dataframe columns, so reloading the same ticker (or
+# re-entering the menu) reuses the already-built trie
+_COMPLETER_CACHE: Dict[tuple, NestedCompleter] = {}
+
 
 class QaController:
     """Quantitative Analysis Controller class"""
@@ -73,10 +83,30 @@ class QaController:
     ]
 
     CHOICES += CHOICES_COMMANDS
+    CHOICES_SET = frozenset(CHOICES)
 
     stock_interval = [1, 5, 15, 30, 60]
     stock_sources = ["yf", "av", "iex"]
 
+    # argparse parsers are expensive to build, so each one is created on
+    # first use and cached here, keyed by command.  call_pick and call_cusum
+    # are excluded: their choices/defaults depend on the loaded data.
+    _PARSERS: Dict[str, argparse.ArgumentParser] = {}
+
+    # Command name -> handler, filled in once the class body is complete
+    _DISPATCH: Dict[str, Callable] = {}
+
+    # Completer choices that never change are built once at class load; only
+    # the 'pick' sub-dict depends on the loaded dataframe and is filled per
+    # instance (the 'load' and 'pick' keys are replaced outright, so the
+    # shared empty sub-dicts below are never mutated)
+    _BASE_CHOICES = {c: {} for c in CHOICES}
+    _LOAD_SUB = {
+        "-i": {c: None for c in stock_interval},
+        "--interval": {c: None for c in stock_interval},
+        "--source": {c: None for c in stock_sources},
+    }
+
     def __init__(
         self,
         ticker: str,
@@ -86,18 +116,14 @@ class QaController:
         queue: List[str] = None,
     ):
         """Constructor"""
-        stock["Returns"] = stock["Adj Close"].pct_change()
-        stock["LogRet"] = np.log(stock["Adj Close"]) - np.log(
-            stock["Adj Close"].shift(1)
-        )
-        stock = stock.rename(columns={"Adj Close": "AdjClose"})
-        stock = stock.dropna()
+        stock = self._prepare_stock(stock)
         self.stock = stock
         self.ticker = ticker
         self.start = start
         self.interval = interval
         self.target = "Returns"
-        self.df_columns = list(stock.columns)
+        self.df_columns = tuple(stock.columns)
+        self._refresh_target_array()
         self.qa_parser = argparse.ArgumentParser(add_help=False, prog="qa")
         self.qa_parser.add_argument(
             "cmd",
@@ -106,19 +132,71 @@ class QaController:
         self.completer: Union[None, NestedCompleter] = None
 
         if session and gtff.USE_PROMPT_TOOLKIT:
-            choices: dict = {c: {} for c in self.CHOICES}
-            choices["pick"]["-t"] = {c: None for c in self.df_columns}
-            choices["pick"]["--target"] = {c: None for c in self.df_columns}
-            choices["load"]["-i"] = {c: None for c in self.stock_interval}
-            choices["load"]["--interval"] = {c: None for c in self.stock_interval}
-            choices["load"]["--source"] = {c: None for c in self.stock_sources}
-            self.completer = NestedCompleter.from_nested_dict(choices)
+            self._update_completer()
 
         if queue:
             self.queue = queue
         else:
             self.queue = list()
 
+    def _refresh_target_array(self):
+        """Cache the target column as a float64 ndarray for the views"""
+        self._target_array = self.stock[self.target].to_numpy(
+            dtype=np.float64, copy=False
+        )
+
+    def _update_completer(self):
+        """Set the completer for the current dataframe columns, building and
+        caching it if these columns have not been seen before"""
+        completer = _COMPLETER_CACHE.get(self.df_columns)
+        if completer is None:
+            choices: dict = dict(self._BASE_CHOICES)
+            choices["load"] = self._LOAD_SUB
+            choices["pick"] = {
+                "-t": {c: None for c in self.df_columns},
+                "--target": {c: None for c in self.df_columns},
+            }
+            completer = NestedCompleter.from_nested_dict(choices)
+            _COMPLETER_CACHE[self.df_columns] = completer
+        self.completer = completer
+
+    @staticmethod
+    def _prepare_stock(stock: pd.DataFrame) -> pd.DataFrame:
+        """Add Returns and LogRet columns with a single pass over Adj Close
+
+        Parameters
+        ----------
+        stock : pd.DataFrame
+            Raw dataframe of stock prices with an 'Adj Close' column
+
+        Returns
+        -------
+        pd.DataFrame
+            Dataframe with Returns and LogRet columns and NaN rows dropped
+        """
+        adj_close = stock["Adj Close"].to_numpy(dtype=np.float64)
+        returns = np.empty_like(adj_close)
+        returns[0] = np.nan
+        np.divide(adj_close[1:], adj_close[:-1], out=returns[1:])
+        # log(x_t / x_{t-1}) == log(1 + r_t), so one np.log pass covers both
+        log_returns = np.log(returns)
+        returns[1:] -= 1.0
+        stock["Returns"] = returns
+        stock["LogRet"] = log_returns
+        stock = stock.rename(columns={"Adj Close": "AdjClose"})
+        # Only the leading rows are NaN (row 0 by construction, more only if
+        # the source data itself started with gaps), so slice instead of
+        # paying dropna's full-frame NaN scan and copy
+        stock = stock.loc[stock["Returns"].first_valid_index() :]
+        # Data sources can hand back strided or non-float64 columns; pin the
+        # analytic ones to contiguous float64 so downstream kernels never
+        # fall onto a slow strided path
+        for column in ("AdjClose", "Returns", "LogRet"):
+            stock[column] = np.ascontiguousarray(
+                stock[column].to_numpy(dtype=np.float64)
+            )
+        return stock
+
     def print_help(self):
         """Print help"""
         s_intraday = (f"Intraday {self.interval}", "Daily")[self.interval == "1440min"]
@@ -168,21 +246,22 @@ Other:
             print("")
             return self.queue
 
-        # Navigation slash is being used
-        if "/" in an_input:
-            actions = an_input.split("/")
-
-            # Absolute path is specified
-            if not actions[0]:
-                an_input = "home"
-            # Relative path so execute first instruction
-            else:
-                an_input = actions[0]
-
-            # Add all instructions to the queue
-            for cmd in actions[1:][::-1]:
+        # Navigation slash is being used; a single partition both detects the
+        # slash and splits off the first instruction, so slash-free inputs
+        # (the common case) pay for one scan only
+        head, slash, rest = an_input.partition("/")
+        if slash:
+            # An absolute path starts with the slash, i.e. an empty head
+            an_input = head if head else "home"
+
+            # Add the remaining instructions to the queue in one prepend
+            commands = []
+            while rest:
+                cmd, _, rest = rest.partition("/")
                 if cmd:
-                    self.queue.insert(0, cmd)
+                    commands.append(cmd)
+            if commands:
+                self.queue = commands + self.queue
 
         (known_args, other_args) = self.qa_parser.parse_known_args(an_input.split())
 
@@ -195,11 +274,11 @@ Other:
             elif known_args.cmd == "r":
                 known_args.cmd = "reset"
 
-        getattr(
-            self,
-            "call_" + known_args.cmd,
-            lambda _: "Command not recognized!",
-        )(other_args)
+        handler = self._DISPATCH.get(known_args.cmd)
+        if handler is not None:
+            handler(self, other_args)
+        else:
+            _unknown_cmd(known_args.cmd)
 
         return self.queue
 
@@ -209,8 +288,7 @@ Other:
 
     def call_home(self, _):
         """Process home command"""
-        self.queue.insert(0, "quit")
-        self.queue.insert(0, "quit")
+        self.queue = ["quit", "quit"] + self.queue
 
     def call_help(self, _):
         """Process help command"""
@@ -219,84 +297,82 @@ Other:
     def call_quit(self, _):
         """Process quit menu command"""
         print("")
-        self.queue.insert(0, "quit")
+        self.queue = ["quit"] + self.queue
 
     def call_exit(self, _):
         """Process exit terminal command"""
-        self.queue.insert(0, "quit")
-        self.queue.insert(0, "quit")
-        self.queue.insert(0, "quit")
+        self.queue = ["quit", "quit", "quit"] + self.queue
 
     def call_reset(self, _):
         """Process reset command"""
-        self.queue.insert(0, "qa")
+        commands = ["quit", "quit", "reset", "stocks"]
         if self.ticker:
-            self.queue.insert(0, f"load {self.ticker}")
-        self.queue.insert(0, "stocks")
-        self.queue.insert(0, "reset")
-        self.queue.insert(0, "quit")
-        self.queue.insert(0, "quit")
+            commands.append(f"load {self.ticker}")
+        commands.append("qa")
+        self.queue = commands + self.queue
 
     def call_load(self, other_args: List[str]):
         """Process load command"""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="load",
-            description="Load stock ticker to perform analysis on. When the data source is 'yf', an Indian ticker can be"
-            " loaded by using '.NS' at the end, e.g. 'SBIN.NS'. See available market in"
-            " https://help.yahoo.com/kb/exchanges-data-providers-yahoo-finance-sln2310.html.",
-        )
-        parser.add_argument(
-            "-t",
-            "--ticker",
-            action="store",
-            dest="ticker",
-            required="-h" not in other_args,
-            help="Stock ticker",
-        )
-        parser.add_argument(
-            "-s",
-            "--start",
-            type=valid_date,
-            default=(datetime.now() - timedelta(days=366)).strftime("%Y-%m-%d"),
-            dest="start",
-            help="The starting date (format YYYY-MM-DD) of the stock",
-        )
-        parser.add_argument(
-            "-e",
-            "--end",
-            type=valid_date,
-            default=datetime.now().strftime("%Y-%m-%d"),
-            dest="end",
-            help="The ending date (format YYYY-MM-DD) of the stock",
-        )
-        parser.add_argument(
-            "-i",
-            "--interval",
-            action="store",
-            dest="interval",
-            type=int,
-            default=1440,
-            choices=self.stock_interval,
-            help="Intraday stock minutes",
-        )
-        parser.add_argument(
-            "--source",
-            action="store",
-            dest="source",
-            choices=self.stock_sources,
-            default="yf",
-            help="Source of historical data.",
-        )
-        parser.add_argument(
-            "-p",
-            "--prepost",
-            action="store_true",
-            default=False,
-            dest="prepost",
-            help="Pre/After market hours. Only works for 'yf' source, and intraday data",
-        )
+        parser = self._PARSERS.get("load")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="load",
+                description="Load stock ticker to perform analysis on. When the data source is 'yf', an Indian ticker can be"
+                " loaded by using '.NS' at the end, e.g. 'SBIN.NS'. See available market in"
+                " https://help.yahoo.com/kb/exchanges-data-providers-yahoo-finance-sln2310.html.",
+            )
+            parser.add_argument(
+                "-t",
+                "--ticker",
+                action="store",
+                dest="ticker",
+                help="Stock ticker",
+            )
+            parser.add_argument(
+                "-s",
+                "--start",
+                type=valid_date,
+                default=None,
+                dest="start",
+                help="The starting date (format YYYY-MM-DD) of the stock",
+            )
+            parser.add_argument(
+                "-e",
+                "--end",
+                type=valid_date,
+                default=None,
+                dest="end",
+                help="The ending date (format YYYY-MM-DD) of the stock",
+            )
+            parser.add_argument(
+                "-i",
+                "--interval",
+                action="store",
+                dest="interval",
+                type=int,
+                default=1440,
+                choices=self.stock_interval,
+                help="Intraday stock minutes",
+            )
+            parser.add_argument(
+                "--source",
+                action="store",
+                dest="source",
+                choices=self.stock_sources,
+                default="yf",
+                help="Source of historical data.",
+            )
+            parser.add_argument(
+                "-p",
+                "--prepost",
+                action="store_true",
+                default=False,
+                dest="prepost",
+                help="Pre/After market hours. Only works for 'yf' source, and intraday data",
+            )
+            self._PARSERS["load"] = parser
 
         # For the case where a user uses: 'load BB'
         if other_args and "-t" not in other_args and "-h" not in other_args:
@@ -304,32 +380,39 @@ Other:
 
         ns_parser = parse_known_args_and_warn(parser, other_args)
         if ns_parser:
+            if not ns_parser.ticker:
+                print("A ticker is required, e.g. 'load TSLA'\n")
+                return
+            # The date defaults cannot live on the cached parser as they
+            # would freeze at the first call
+            start = ns_parser.start or valid_date(
+                (datetime.now() - timedelta(days=366)).strftime("%Y-%m-%d")
+            )
+            end = ns_parser.end or valid_date(datetime.now().strftime("%Y-%m-%d"))
 
             df_stock_candidate = stocks_helper.load(
                 ns_parser.ticker,
-                ns_parser.start,
+                start,
                 ns_parser.interval,
-                ns_parser.end,
+                end,
                 ns_parser.prepost,
                 ns_parser.source,
             )
 
             if not df_stock_candidate.empty:
-                self.stock = df_stock_candidate
                 if "." in ns_parser.ticker:
                     self.ticker = ns_parser.ticker.upper().split(".")[0]
                 else:
                     self.ticker = ns_parser.ticker.upper()
 
-                self.start = ns_parser.start
+                self.start = start
                 self.interval = str(ns_parser.interval) + "min"
 
-                self.stock["Returns"] = self.stock["Adj Close"].pct_change()
-                self.stock["LogRet"] = np.log(self.stock["Adj Close"]) - np.log(
-                    self.stock["Adj Close"].shift(1)
-                )
-                self.stock = self.stock.rename(columns={"Adj Close": "AdjClose"})
-                self.stock = self.stock.dropna()
+                self.stock = self._prepare_stock(df_stock_candidate)
+                self.df_columns = tuple(self.stock.columns)
+                self._refresh_target_array()
+                if session and gtff.USE_PROMPT_TOOLKIT:
+                    self._update_completer()
 
     @try_except
     def call_pick(self, other_args: List[str]):
@@ -346,7 +429,7 @@ Other:
             "-t",
             "--target",
             dest="target",
-            choices=list(self.stock.columns),
+            choices=self.df_columns,
             help="Select variable to analyze",
         )
         if other_args and "-t" not in other_args and "-h" not in other_args:
@@ -355,34 +438,38 @@ Other:
         ns_parser = parse_known_args_and_warn(parser, other_args)
         if ns_parser:
             self.target = ns_parser.target
+            self._refresh_target_array()
         print("")
 
     @try_except
     def call_raw(self, other_args: List[str]):
-        parser = argparse.ArgumentParser(
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            add_help=False,
-            prog="raw",
-            description="""
-                Print raw data to console
-            """,
-        )
-        parser.add_argument(
-            "-n",
-            "--num",
-            help="Number to show",
-            type=check_positive,
-            default=20,
-            dest="num",
-        )
-        parser.add_argument(
-            "-d",
-            "--descend",
-            action="store_true",
-            default=False,
-            dest="descend",
-            help="Sort in descending order",
-        )
+        parser = self._PARSERS.get("raw")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                add_help=False,
+                prog="raw",
+                description="""
+                    Print raw data to console
+                """,
+            )
+            parser.add_argument(
+                "-n",
+                "--num",
+                help="Number to show",
+                type=check_positive,
+                default=20,
+                dest="num",
+            )
+            parser.add_argument(
+                "-d",
+                "--descend",
+                action="store_true",
+                default=False,
+                dest="descend",
+                help="Sort in descending order",
+            )
+            self._PARSERS["raw"] = parser
 
         ns_parser = parse_known_args_and_warn(
             parser, other_args, export_allowed=EXPORT_ONLY_RAW_DATA_ALLOWED
@@ -399,14 +486,17 @@ Other:
     @try_except
     def call_summary(self, other_args: List[str]):
         """Process summary command"""
-        parser = argparse.ArgumentParser(
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            add_help=False,
-            prog="summary",
-            description="""
-                Summary statistics
-            """,
-        )
+        parser = self._PARSERS.get("summary")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                add_help=False,
+                prog="summary",
+                description="""
+                    Summary statistics
+                """,
+            )
+            self._PARSERS["summary"] = parser
         ns_parser = parse_known_args_and_warn(
             parser, other_args, export_allowed=EXPORT_ONLY_RAW_DATA_ALLOWED
         )
@@ -416,17 +506,20 @@ Other:
     @try_except
     def call_hist(self, other_args: List[str]):
         """Process hist command"""
-        parser = argparse.ArgumentParser(
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            add_help=False,
-            prog="hist",
-            description="""
-                Histogram with density and rug
-            """,
-        )
-        parser.add_argument(
-            "-b", "--bins", type=check_positive, default=15, dest="n_bins"
-        )
+        parser = self._PARSERS.get("hist")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                add_help=False,
+                prog="hist",
+                description="""
+                    Histogram with density and rug
+                """,
+            )
+            parser.add_argument(
+                "-b", "--bins", type=check_positive, default=15, dest="n_bins"
+            )
+            self._PARSERS["hist"] = parser
         ns_parser = parse_known_args_and_warn(parser, other_args)
         if ns_parser:
             qa_view.display_hist(
@@ -439,14 +532,17 @@ Other:
     @try_except
     def call_cdf(self, other_args: List[str]):
         """Process cdf command"""
-        parser = argparse.ArgumentParser(
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            add_help=False,
-            prog="cdf",
-            description="""
-                Cumulative distribution function
-            """,
-        )
+        parser = self._PARSERS.get("cdf")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                add_help=False,
+                prog="cdf",
+                description="""
+                    Cumulative distribution function
+                """,
+            )
+            self._PARSERS["cdf"] = parser
         ns_parser = parse_known_args_and_warn(
             parser, other_args, export_allowed=EXPORT_ONLY_RAW_DATA_ALLOWED
         )
@@ -461,22 +557,25 @@ Other:
     @try_except
     def call_bw(self, other_args: List[str]):
         """Process bwy command"""
-        parser = argparse.ArgumentParser(
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            add_help=False,
-            prog="bw",
-            description="""
-                Box and Whisker plot
-            """,
-        )
-        parser.add_argument(
-            "-y",
-            "--yearly",
-            action="store_true",
-            default=False,
-            dest="year",
-            help="Flag to show yearly bw plot",
-        )
+        parser = self._PARSERS.get("bw")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                add_help=False,
+                prog="bw",
+                description="""
+                    Box and Whisker plot
+                """,
+            )
+            parser.add_argument(
+                "-y",
+                "--yearly",
+                action="store_true",
+                default=False,
+                dest="year",
+                help="Flag to show yearly bw plot",
+            )
+            self._PARSERS["bw"] = parser
         ns_parser = parse_known_args_and_warn(parser, other_args)
         if ns_parser:
             qa_view.display_bw(
@@ -489,24 +588,27 @@ Other:
     @try_except
     def call_decompose(self, other_args: List[str]):
         """Process decompose command"""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="decompose",
-            description="""
-                Decompose time series as:
-                - Additive Time Series = Level + CyclicTrend + Residual + Seasonality
-                - Multiplicative Time Series = Level * CyclicTrend * Residual * Seasonality
-            """,
-        )
-        parser.add_argument(
-            "-m",
-            "--multiplicative",
-            action="store_true",
-            default=False,
-            dest="multiplicative",
-            help="decompose using multiplicative model instead of additive",
-        )
+        parser = self._PARSERS.get("decompose")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="decompose",
+                description="""
+                    Decompose time series as:
+                    - Additive Time Series = Level + CyclicTrend + Residual + Seasonality
+                    - Multiplicative Time Series = Level * CyclicTrend * Residual * Seasonality
+                """,
+            )
+            parser.add_argument(
+                "-m",
+                "--multiplicative",
+                action="store_true",
+                default=False,
+                dest="multiplicative",
+                help="decompose using multiplicative model instead of additive",
+            )
+            self._PARSERS["decompose"] = parser
         ns_parser = parse_known_args_and_warn(
             parser, other_args, export_allowed=EXPORT_ONLY_RAW_DATA_ALLOWED
         )
@@ -522,6 +624,8 @@ Other:
     @try_except
     def call_cusum(self, other_args: List[str]):
         """Process cusum command"""
+        target_values = self._target_array
+        target_range = float(target_values.max() - target_values.min())
         parser = argparse.ArgumentParser(
             add_help=False,
             formatter_class=argparse.ArgumentDefaultsHelpFormatter,
@@ -535,11 +639,7 @@ Other:
             "--threshold",
             dest="threshold",
             type=float,
-            default=(
-                max(self.stock[self.target].values)
-                - min(self.stock[self.target].values)
-            )
-            / 40,
+            default=target_range / 40,
             help="threshold",
         )
         parser.add_argument(
@@ -547,18 +647,13 @@ Other:
             "--drift",
             dest="drift",
             type=float,
-            default=(
-                max(self.stock[self.target].values)
-                - min(self.stock[self.target].values)
-            )
-            / 80,
+            default=target_range / 80,
             help="drift",
         )
         ns_parser = parse_known_args_and_warn(parser, other_args)
         if ns_parser:
             qa_view.display_cusum(
-                df=self.stock,
-                target=self.target,
+                data=self._target_array,
                 threshold=ns_parser.threshold,
                 drift=ns_parser.drift,
             )
@@ -566,22 +661,25 @@ Other:
     @try_except
     def call_acf(self, other_args: List[str]):
         """Process acf command"""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="acf",
-            description="""
-                Auto-Correlation and Partial Auto-Correlation Functions for diff and diff diff stock data
-            """,
-        )
-        parser.add_argument(
-            "-l",
-            "--lags",
-            dest="lags",
-            type=check_positive,
-            default=15,
-            help="maximum lags to display in plots",
-        )
+        parser = self._PARSERS.get("acf")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="acf",
+                description="""
+                    Auto-Correlation and Partial Auto-Correlation Functions for diff and diff diff stock data
+                """,
+            )
+            parser.add_argument(
+                "-l",
+                "--lags",
+                dest="lags",
+                type=check_positive,
+                default=15,
+                help="maximum lags to display in plots",
+            )
+            self._PARSERS["acf"] = parser
         ns_parser = parse_known_args_and_warn(parser, other_args)
         if ns_parser:
             if self.target != "AdjClose":
@@ -599,23 +697,26 @@ Other:
     @try_except
     def call_rolling(self, other_args: List[str]):
         """Process rolling command"""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="rolling",
-            description="""
-                Rolling mean and std deviation
-            """,
-        )
-        parser.add_argument(
-            "-l",
-            "--length",
-            action="store",
-            dest="n_length",
-            type=check_positive,
-            default=14,
-            help="Window length",
-        )
+        parser = self._PARSERS.get("rolling")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="rolling",
+                description="""
+                    Rolling mean and std deviation
+                """,
+            )
+            parser.add_argument(
+                "-l",
+                "--length",
+                action="store",
+                dest="n_length",
+                type=check_positive,
+                default=14,
+                help="Window length",
+            )
+            self._PARSERS["rolling"] = parser
         ns_parser = parse_known_args_and_warn(
             parser, other_args, export_allowed=EXPORT_ONLY_RAW_DATA_ALLOWED
         )
@@ -631,22 +732,25 @@ Other:
     @try_except
     def call_spread(self, other_args: List[str]):
         """Process spread command"""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="spread",
-            description="""Shows rolling spread measurement
-            """,
-        )
-        parser.add_argument(
-            "-l",
-            "--length",
-            action="store",
-            dest="n_length",
-            type=check_positive,
-            default=14,
-            help="Window length",
-        )
+        parser = self._PARSERS.get("spread")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="spread",
+                description="""Shows rolling spread measurement
+                """,
+            )
+            parser.add_argument(
+                "-l",
+                "--length",
+                action="store",
+                dest="n_length",
+                type=check_positive,
+                default=14,
+                help="Window length",
+            )
+            self._PARSERS["spread"] = parser
         ns_parser = parse_known_args_and_warn(
             parser, other_args, export_allowed=EXPORT_ONLY_RAW_DATA_ALLOWED
         )
@@ -662,39 +766,42 @@ Other:
     @try_except
     def call_quantile(self, other_args: List[str]):
         """Process quantile command"""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="quantile",
-            description="""
-                The quantiles are values which divide the distribution such that
-                there is a given proportion of observations below the quantile.
-                For example, the median is a quantile. The median is the central
-                value of the distribution, such that half the points are less than
-                or equal to it and half are greater than or equal to it.
-
-                By default, q is set at 0.5, which effectively is median. Change q to
-                get the desired quantile (0<q<1).
-            """,
-        )
-        parser.add_argument(
-            "-l",
-            "--length",
-            action="store",
-            dest="n_length",
-            type=check_positive,
-            default=14,
-            help="length",
-        )
-        parser.add_argument(
-            "-q",
-            "--quantile",
-            action="store",
-            dest="f_quantile",
-            type=check_proportion_range,
-            default=0.5,
-            help="quantile",
-        )
+        parser = self._PARSERS.get("quantile")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="quantile",
+                description="""
+                    The quantiles are values which divide the distribution such that
+                    there is a given proportion of observations below the quantile.
+                    For example, the median is a quantile. The median is the central
+                    value of the distribution, such that half the points are less than
+                    or equal to it and half are greater than or equal to it.
+
+                    By default, q is set at 0.5, which effectively is median. Change q to
+                    get the desired quantile (0<q<1).
+                """,
+            )
+            parser.add_argument(
+                "-l",
+                "--length",
+                action="store",
+                dest="n_length",
+                type=check_positive,
+                default=14,
+                help="length",
+            )
+            parser.add_argument(
+                "-q",
+                "--quantile",
+                action="store",
+                dest="f_quantile",
+                type=check_proportion_range,
+                default=0.5,
+                help="quantile",
+            )
+            self._PARSERS["quantile"] = parser
         ns_parser = parse_known_args_and_warn(
             parser, other_args, export_allowed=EXPORT_ONLY_RAW_DATA_ALLOWED
         )
@@ -711,28 +818,31 @@ Other:
     @try_except
     def call_skew(self, other_args: List[str]):
         """Process skew command"""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="skew",
-            description="""
-                Skewness is a measure of asymmetry or distortion of symmetric
-                distribution. It measures the deviation of the given distribution
-                of a random variable from a symmetric distribution, such as normal
-                distribution. A normal distribution is without any skewness, as it is
-                symmetrical on both sides. Hence, a curve is regarded as skewed if
-                it is shifted towards the right or the left.
-            """,
-        )
-        parser.add_argument(
-            "-l",
-            "--length",
-            action="store",
-            dest="n_length",
-            type=check_positive,
-            default=14,
-            help="length",
-        )
+        parser = self._PARSERS.get("skew")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="skew",
+                description="""
+                    Skewness is a measure of asymmetry or distortion of symmetric
+                    distribution. It measures the deviation of the given distribution
+                    of a random variable from a symmetric distribution, such as normal
+                    distribution. A normal distribution is without any skewness, as it is
+                    symmetrical on both sides. Hence, a curve is regarded as skewed if
+                    it is shifted towards the right or the left.
+                """,
+            )
+            parser.add_argument(
+                "-l",
+                "--length",
+                action="store",
+                dest="n_length",
+                type=check_positive,
+                default=14,
+                help="length",
+            )
+            self._PARSERS["skew"] = parser
         ns_parser = parse_known_args_and_warn(
             parser, other_args, export_allowed=EXPORT_ONLY_RAW_DATA_ALLOWED
         )
@@ -748,28 +858,31 @@ Other:
     @try_except
     def call_kurtosis(self, other_args: List[str]):
         """Process kurtosis command"""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="kurtosis",
-            description="""
-                Kurtosis is a measure of the "tailedness" of the probability distribution
-                of a real-valued random variable. Like skewness, kurtosis describes the shape
-                of a probability distribution and there are different ways of quantifying it
-                for a theoretical distribution and corresponding ways of estimating it from
-                a sample from a population. Different measures of kurtosis may have different
-                interpretations.
-            """,
-        )
-        parser.add_argument(
-            "-l",
-            "--length",
-            action="store",
-            dest="n_length",
-            type=check_positive,
-            default=14,
-            help="length",
-        )
+        parser = self._PARSERS.get("kurtosis")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="kurtosis",
+                description="""
+                    Kurtosis is a measure of the "tailedness" of the probability distribution
+                    of a real-valued random variable. Like skewness, kurtosis describes the shape
+                    of a probability distribution and there are different ways of quantifying it
+                    for a theoretical distribution and corresponding ways of estimating it from
+                    a sample from a population. Different measures of kurtosis may have different
+                    interpretations.
+                """,
+            )
+            parser.add_argument(
+                "-l",
+                "--length",
+                action="store",
+                dest="n_length",
+                type=check_positive,
+                default=14,
+                help="length",
+            )
+            self._PARSERS["kurtosis"] = parser
         ns_parser = parse_known_args_and_warn(
             parser, other_args, export_allowed=EXPORT_ONLY_RAW_DATA_ALLOWED
         )
@@ -785,73 +898,83 @@ Other:
     @try_except
     def call_normality(self, other_args: List[str]):
         """Process normality command"""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="normality",
-            description="""
-                Normality tests
-            """,
-        )
+        parser = self._PARSERS.get("normality")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="normality",
+                description="""
+                    Normality tests
+                """,
+            )
+            self._PARSERS["normality"] = parser
         ns_parser = parse_known_args_and_warn(
             parser, other_args, export_allowed=EXPORT_ONLY_RAW_DATA_ALLOWED
         )
         if ns_parser:
             qa_view.display_normality(
-                df=self.stock, target=self.target, export=ns_parser.export
+                data=self._target_array, export=ns_parser.export
             )
 
     @try_except
     def call_qqplot(self, other_args: List[str]):
         """Process qqplot command"""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="qqplot",
-            description="""
-                Display QQ plot vs normal quantiles
-            """,
-        )
+        parser = self._PARSERS.get("qqplot")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="qqplot",
+                description="""
+                    Display QQ plot vs normal quantiles
+                """,
+            )
+            self._PARSERS["qqplot"] = parser
         ns_parser = parse_known_args_and_warn(parser, other_args)
         if ns_parser:
-            qa_view.display_qqplot(name=self.ticker, df=self.stock, target=self.target)
+            qa_view.display_qqplot(
+                name=self.ticker, target=self.target, data=self._target_array
+            )
 
     @try_except
     def call_unitroot(self, other_args: List[str]):
         """Process unitroot command"""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="unitroot",
-            description="""
-                Unit root test / stationarity (ADF, KPSS)
-            """,
-        )
-        parser.add_argument(
-            "-r",
-            "--fuller_reg",
-            help="Type of regression.  Can be ‘c’,’ct’,’ctt’,’nc’ 'c' - Constant and t - trend order",
-            choices=["c", "ct", "ctt", "nc"],
-            default="c",
-            type=str,
-            dest="fuller_reg",
-        )
-        parser.add_argument(
-            "-k",
-            "--kps_reg",
-            help="Type of regression.  Can be ‘c’,’ct'",
-            choices=["c", "ct"],
-            type=str,
-            dest="kpss_reg",
-            default="c",
-        )
+        parser = self._PARSERS.get("unitroot")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="unitroot",
+                description="""
+                    Unit root test / stationarity (ADF, KPSS)
+                """,
+            )
+            parser.add_argument(
+                "-r",
+                "--fuller_reg",
+                help="Type of regression.  Can be ‘c’,’ct’,’ctt’,’nc’ 'c' - Constant and t - trend order",
+                choices=["c", "ct", "ctt", "nc"],
+                default="c",
+                type=str,
+                dest="fuller_reg",
+            )
+            parser.add_argument(
+                "-k",
+                "--kps_reg",
+                help="Type of regression.  Can be ‘c’,’ct'",
+                choices=["c", "ct"],
+                type=str,
+                dest="kpss_reg",
+                default="c",
+            )
+            self._PARSERS["unitroot"] = parser
         ns_parser = parse_known_args_and_warn(
             parser, other_args, export_allowed=EXPORT_ONLY_RAW_DATA_ALLOWED
         )
         if ns_parser:
             qa_view.display_unitroot(
-                df=self.stock,
-                target=self.target,
+                data=self._target_array,
                 fuller_reg=ns_parser.fuller_reg,
                 kpss_reg=ns_parser.kpss_reg,
                 export=ns_parser.export,
@@ -860,19 +983,126 @@ Other:
     @try_except
     def call_capm(self, other_args: List[str]):
         """Process capm command"""
-        parser = argparse.ArgumentParser(
-            add_help=False,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-            prog="capm",
-            description="""
-                Provides detailed information about a stock's risk compared to the market risk.
-            """,
-        )
+        parser = self._PARSERS.get("capm")
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                add_help=False,
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+                prog="capm",
+                description="""
+                    Provides detailed information about a stock's risk compared to the market risk.
+                """,
+            )
+            self._PARSERS["capm"] = parser
         ns_parser = parse_known_args_and_warn(parser, other_args)
         if ns_parser:
             capm_view(self.ticker)
 
 
+# Resolve the call_* handlers once instead of a getattr per dispatched input
+QaController._DISPATCH = {
+    name[len("call_") :]: getattr(QaController, name)
+    for name in vars(QaController)
+    if name.startswith("call_")
+}
+
+
+# CHOICES is fixed, so normalize case once here and only lower the query per
+# call, instead of letting the matcher re-normalize every pair
+_CHOICES_LOWER = [c.lower() for c in QaController.CHOICES]
+_LOWER_TO_CHOICE = dict(zip(_CHOICES_LOWER, QaController.CHOICES))
+
+# Two-character prefix buckets and bigram sets over CHOICES, so the menu can
+# resolve most typos without a full fuzzy-match scan
+_CHOICE_BIGRAMS = {c: set(zip(c, c[1:])) for c in _CHOICES_LOWER}
+_CHOICE_PREFIXES: Dict[str, List[str]] = {}
+for _choice in _CHOICES_LOWER:
+    _CHOICE_PREFIXES.setdefault(_choice[:2], []).append(_choice)
+
+
+def _best_match(head: str, choices: List[str], cutoff: float = 0.7) -> Optional[str]:
+    """Single best close match to head, or None if none clears the cutoff
+
+    get_close_matches scores every candidate even when its cheap upper
+    bounds already rule it out; with only the best match wanted, one
+    SequenceMatcher re-seeded per candidate lets real_quick_ratio and
+    quick_ratio skip most of the quadratic ratio() calls.
+    """
+    import difflib  # pylint: disable=import-outside-toplevel
+
+    # Command names are short, so the autojunk "popular character" heuristic
+    # is pure setup overhead here
+    matcher = difflib.SequenceMatcher(None, b=head, autojunk=False)
+    best = cutoff
+    best_choice = None
+    for choice in choices:
+        matcher.set_seq1(choice)
+        if matcher.real_quick_ratio() < best or matcher.quick_ratio() < best:
+            continue
+        ratio = matcher.ratio()
+        if ratio > best or (best_choice is None and ratio == best):
+            best = ratio
+            best_choice = choice
+    return best_choice
+
+
+@functools.lru_cache(maxsize=256)
+def _suggest(head: str) -> Optional[str]:
+    """Closest command name for a mistyped menu input, or None
+
+    Repeated typos are answered from the cache; fresh ones try a cheap
+    bigram-overlap match inside the prefix bucket before paying for a
+    fuzzy scan over all of CHOICES.
+    """
+    head = head.lower()
+    best = None
+    best_overlap = 0.0
+    head_bigrams = set(zip(head, head[1:]))
+    for choice in _CHOICE_PREFIXES.get(head[:2], []):
+        choice_bigrams = _CHOICE_BIGRAMS[choice]
+        overlap = len(head_bigrams & choice_bigrams) / max(
+            len(head_bigrams), len(choice_bigrams), 1
+        )
+        if overlap > best_overlap:
+            best_overlap = overlap
+            best = choice
+    if best_overlap >= 0.6:
+        return _LOWER_TO_CHOICE[best]
+    if process is not None:
+        # Both sides are already lowercase, so skip rapidfuzz's default
+        # full_process normalization pass over each pair
+        match = process.extractOne(
+            head,
+            _CHOICES_LOWER,
+            scorer=fuzz.ratio,
+            processor=None,
+            score_cutoff=70,
+        )
+        return QaController.CHOICES[match[2]] if match else None
+    matched = _best_match(head, _CHOICES_LOWER)
+    return _LOWER_TO_CHOICE[matched] if matched else None
+
+
+@functools.lru_cache(maxsize=256)
+def _find_similar(cmd: str) -> tuple:
+    """Closest command names to an unrecognized input, best match first"""
+    if process is not None:
+        matches = process.extract(
+            cmd, QaController.CHOICES, scorer=fuzz.WRatio, score_cutoff=70, limit=3
+        )
+        return tuple(match[0] for match in matches if match[0] != cmd)
+    import difflib  # pylint: disable=import-outside-toplevel
+
+    return tuple(difflib.get_close_matches(cmd, QaController.CHOICES, n=3, cutoff=0.7))
+
+
+def _unknown_cmd(cmd: str):
+    """Fallback for choices without a matching call_ handler"""
+    similar = _find_similar(cmd)
+    if similar:
+        print(f"'{cmd}' is not recognized.  Did you mean: {', '.join(similar)}?\n")
+
+
 def menu(
     ticker: str,
     start: datetime,
@@ -883,8 +1113,27 @@ def menu(
     """Quantitative Analysis Menu"""
     qa_controller = QaController(ticker, start, interval, stock, queue)
     an_input = "HELP_ME"
+    # Flair cannot change while inside this menu, so resolve the prompt once
+    # instead of calling get_flair() every iteration
+    prompt_str = f"{get_flair()} /stocks/qa/ $ "
 
     while True:
+        # Corrected typos are queued pre-tokenized; dispatch them straight to
+        # their handler instead of re-parsing the line through switch()
+        if qa_controller.queue and isinstance(qa_controller.queue[0], tuple):
+            cmd, cmd_args = qa_controller.queue[0]
+            qa_controller.queue = qa_controller.queue[1:]
+            an_input = " ".join([cmd] + cmd_args)
+            if cmd in qa_controller.CHOICES_COMMANDS:
+                print(f"{prompt_str}{an_input}")
+            try:
+                getattr(qa_controller, f"call_{cmd}")(cmd_args)
+            except SystemExit:
+                print(
+                    f"\nThe command '{an_input}' doesn't exist on the /stocks/qa menu.\n"
+                )
+            continue
+
         # There is a command in the queue
         if qa_controller.queue and len(qa_controller.queue) > 0:
             # If the command is quitting the menu we want to return in here
@@ -900,7 +1149,7 @@ def menu(
 
             # Print the current location because this was an instruction and we want user to know what was the action
             if an_input and an_input.split(" ")[0] in qa_controller.CHOICES_COMMANDS:
-                print(f"{get_flair()} /stocks/qa/ $ {an_input}")
+                print(f"{prompt_str}{an_input}")
 
         # Get input command from user
         else:
@@ -911,45 +1160,49 @@ def menu(
             # Get input from user using auto-completion
             if session and gtff.USE_PROMPT_TOOLKIT and qa_controller.completer:
                 an_input = session.prompt(
-                    f"{get_flair()} /stocks/qa/ $ ",
+                    prompt_str,
                     completer=qa_controller.completer,
                     search_ignore_case=True,
                 )
 
             # Get input from user without auto-completion
             else:
-                an_input = input(f"{get_flair()} /stocks/qa/ $ ")
+                an_input = input(prompt_str)
 
         try:
             # Process the input command
             qa_controller.queue = qa_controller.switch(an_input)
 
         except SystemExit:
-            print(
-                f"\nThe command '{an_input}' doesn't exist on the /stocks/qa menu.",
-                end="",
-            )
-            similar_cmd = difflib.get_close_matches(
-                an_input.split(" ")[0] if " " in an_input else an_input,
-                qa_controller.CHOICES,
-                n=1,
-                cutoff=0.7,
+            # The whole diagnostic goes out in one write instead of a print
+            # per fragment
+            msg = f"\nThe command '{an_input}' doesn't exist on the /stocks/qa menu."
+            head, sep, tail = an_input.partition(" ")
+            # A valid command that still raised failed on its own arguments,
+            # so suggesting a replacement would just replay the failure
+            similar_cmd = (
+                None if head in QaController.CHOICES_SET else _suggest(head)
             )
             if similar_cmd:
-                if " " in an_input:
-                    candidate_input = (
-                        f"{similar_cmd[0]} {' '.join(an_input.split(' ')[1:])}"
+                candidate_input = f"{similar_cmd} {tail}" if sep else similar_cmd
+                if candidate_input == an_input:
+                    an_input = ""
+                    qa_controller.queue = []
+                    sys.stdout.write(f"{msg}\n\n")
+                    sys.stdout.flush()
+                    continue
+                an_input = candidate_input
+
+                sys.stdout.write(f"{msg} Replacing by '{an_input}'.\n")
+                sys.stdout.flush()
+                # Queue the correction pre-tokenized where a handler exists;
+                # navigation aliases still go through switch()
+                if similar_cmd in QaController._DISPATCH:
+                    qa_controller.queue.insert(
+                        0, (similar_cmd, tail.split() if sep else [])
                     )
-                    if candidate_input == an_input:
-                        an_input = ""
-                        qa_controller.queue = []
-                        print("\n")
-                        continue
-                    an_input = candidate_input
                 else:
-                    an_input = similar_cmd[0]
-
-                print(f" Replacing by '{an_input}'.")
-                qa_controller.queue.insert(0, an_input)
+                    qa_controller.queue.insert(0, an_input)
             else:
-                print("\n")
+                sys.stdout.write(f"{msg}\n\n")
+                sys.stdout.flush()
@@ -16,6 +16,11 @@ from _pytest.fixtures import SubRequest
 from _pytest.mark.structures import Mark
 
 # IMPORTATION INTERNAL
+from gamestonk_terminal import feature_flags as gtff
+
+# The on-disk response cache would let entries persisted by one test run
+# bleed into later mocked/recorded runs, so it is always off under the suite
+gtff.USE_FILE_CACHE = False
 
 # pylint: disable=redefined-outer-name
 
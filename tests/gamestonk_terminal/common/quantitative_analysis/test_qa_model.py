@@ -0,0 +1,39 @@
+# IMPORTATION STANDARD
+
+# IMPORTATION THIRDPARTY
+import numpy as np
+import pandas as pd
+import pytest
+from statsmodels.tsa.seasonal import seasonal_decompose
+
+# IMPORTATION INTERNAL
+from gamestonk_terminal.common.quantitative_analysis import qa_model
+
+
+@pytest.fixture(name="series")
+def fixture_series():
+    rng = np.random.default_rng(seed=3)
+    index = pd.date_range("2020-01-01", periods=252, freq="B")
+    seasonal = np.tile([1.0, 0.4, -0.3, -0.6, -0.5], 51)[:252]
+    trend = np.linspace(50.0, 80.0, 252)
+    noise = 0.5 * rng.standard_normal(252)
+    return pd.Series(trend + 5.0 * seasonal + noise, index=index)
+
+
+@pytest.mark.parametrize("multiplicative", [False, True])
+def test_get_seasonal_decomposition_matches_statsmodels(series, multiplicative):
+    result, cycle, trend = qa_model.get_seasonal_decomposition(series, multiplicative)
+    expected = seasonal_decompose(
+        series,
+        model="multiplicative" if multiplicative else "additive",
+        period=5,
+    )
+
+    for component in ("trend", "seasonal", "resid"):
+        np.testing.assert_allclose(
+            getattr(result, component).to_numpy(),
+            getattr(expected, component).to_numpy(),
+            atol=1e-8,
+        )
+    assert not cycle.empty
+    assert not trend.empty
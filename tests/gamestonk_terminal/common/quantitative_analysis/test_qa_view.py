@@ -0,0 +1,96 @@
+# IMPORTATION STANDARD
+
+# IMPORTATION THIRDPARTY
+import numpy as np
+import pytest
+from detecta import detect_cusum
+from statsmodels.tsa.stattools import acf, pacf
+
+# IMPORTATION INTERNAL
+from gamestonk_terminal.common.quantitative_analysis import qa_view
+
+# pylint: disable=protected-access
+
+
+@pytest.fixture(name="series")
+def fixture_series():
+    rng = np.random.default_rng(seed=42)
+    x = rng.standard_normal(400)
+    # Inject level shifts so every parameter set raises some alarms
+    x[100:200] += 4.0
+    x[300:] -= 3.0
+    return x
+
+
+@pytest.mark.parametrize("lags", [5, 15, 40])
+def test_acf_fft_matches_statsmodels(series, lags):
+    result = qa_view._acf_fft(series, lags)
+    expected = acf(series, nlags=lags, fft=True)
+
+    np.testing.assert_allclose(result, expected, atol=1e-10)
+
+
+@pytest.mark.parametrize("lags", [5, 15])
+def test_pacf_durbin_levinson_matches_statsmodels(series, lags):
+    acf_values = qa_view._acf_fft(series, lags)
+    result = qa_view._pacf_durbin_levinson(acf_values)
+    expected = pacf(series, nlags=lags, method="ldb")
+
+    np.testing.assert_allclose(result, expected, atol=1e-8)
+
+
+@pytest.mark.parametrize(
+    "threshold, drift",
+    [
+        (1.0, 0.0),
+        (2.5, 0.5),
+        (4.0, 0.1),
+    ],
+)
+def test_detect_cusum_matches_detecta(series, threshold, drift):
+    ta, tai, taf, _, _ = qa_view._detect_cusum(series, threshold, drift)
+    expected_ta, expected_tai, expected_taf, _ = detect_cusum(
+        series, threshold=threshold, drift=drift, ending=True, show=False
+    )
+
+    np.testing.assert_array_equal(ta, expected_ta)
+    np.testing.assert_array_equal(tai, expected_tai)
+    np.testing.assert_array_equal(taf, expected_taf)
+
+
+@pytest.mark.parametrize(
+    "threshold, drift",
+    [
+        (1.0, 0.0),
+        (4.0, 0.1),
+    ],
+)
+def test_cusum_pass_matches_recurrence(series, threshold, drift):
+    ta, tai, gp, gn = qa_view._cusum_pass(series, threshold, drift)
+
+    # Straightforward transcription of the clipped recurrence the segmented
+    # closed form replaces
+    expected_gp = np.zeros(series.size)
+    expected_gn = np.zeros(series.size)
+    expected_ta = []
+    expected_tai = []
+    tap = tan = 0
+    for i in range(1, series.size):
+        s = series[i] - series[i - 1]
+        expected_gp[i] = expected_gp[i - 1] + s - drift
+        expected_gn[i] = expected_gn[i - 1] - s - drift
+        if expected_gp[i] < 0:
+            expected_gp[i] = 0.0
+            tap = i
+        if expected_gn[i] < 0:
+            expected_gn[i] = 0.0
+            tan = i
+        if expected_gp[i] > threshold or expected_gn[i] > threshold:
+            expected_ta.append(i)
+            expected_tai.append(tap if expected_gp[i] > threshold else tan)
+            expected_gp[i] = expected_gn[i] = 0.0
+
+    np.testing.assert_array_equal(ta, expected_ta)
+    np.testing.assert_array_equal(tai, expected_tai)
+    np.testing.assert_allclose(gp, expected_gp, atol=1e-9)
+    np.testing.assert_allclose(gn, expected_gn, atol=1e-9)
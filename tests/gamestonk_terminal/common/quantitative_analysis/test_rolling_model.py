@@ -0,0 +1,90 @@
+# IMPORTATION STANDARD
+
+# IMPORTATION THIRDPARTY
+import numpy as np
+import pandas as pd
+import pytest
+
+# IMPORTATION INTERNAL
+from gamestonk_terminal.common.quantitative_analysis import rolling_model
+
+
+@pytest.fixture(name="df")
+def fixture_df():
+    rng = np.random.default_rng(seed=7)
+    index = pd.date_range("2020-01-01", periods=250, freq="B")
+    return pd.Series(
+        100.0 + rng.standard_normal(250).cumsum(), index=index, name="AdjClose"
+    )
+
+
+@pytest.mark.parametrize("length", [5, 14, 60])
+def test_get_rolling_avg_matches_pandas(df, length):
+    df_ma, df_sd = rolling_model.get_rolling_avg(df, length)
+    roll = df.rolling(length, center=True, min_periods=1)
+
+    np.testing.assert_allclose(
+        df_ma[df.name].to_numpy(), roll.mean().to_numpy(), atol=1e-8
+    )
+    np.testing.assert_allclose(
+        df_sd[df.name].to_numpy(), roll.std().to_numpy(), atol=1e-8
+    )
+
+
+@pytest.mark.parametrize("length", [5, 14, 60])
+def test_get_spread_matches_pandas(df, length):
+    df_sd, df_var = rolling_model.get_spread(df, length)
+    expected_sd = df.rolling(length).std().dropna()
+    expected_var = df.rolling(length).var().dropna()
+
+    assert (df_sd.index == expected_sd.index).all()
+    np.testing.assert_allclose(
+        df_sd[f"STDEV_{length}"].to_numpy(), expected_sd.to_numpy(), atol=1e-8
+    )
+    np.testing.assert_allclose(
+        df_var[f"VAR_{length}"].to_numpy(), expected_var.to_numpy(), atol=1e-8
+    )
+
+
+@pytest.mark.parametrize(
+    "length, quantile_pct",
+    [
+        (14, 0.1),
+        (14, 0.5),
+        (30, 0.75),
+    ],
+)
+def test_get_quantile_matches_pandas(df, length, quantile_pct):
+    df_med, df_quantile = rolling_model.get_quantile(df, length, quantile_pct)
+    expected_med = df.rolling(length).median().dropna()
+    expected_qtl = (
+        df.rolling(length).quantile(quantile_pct, interpolation="linear").dropna()
+    )
+
+    assert (df_med.index == expected_med.index).all()
+    np.testing.assert_allclose(
+        df_med[f"MEDIAN_{length}"].to_numpy(), expected_med.to_numpy(), atol=1e-8
+    )
+    np.testing.assert_allclose(
+        df_quantile[f"QTL_{length}_{quantile_pct}"].to_numpy(),
+        expected_qtl.to_numpy(),
+        atol=1e-8,
+    )
+
+
+@pytest.mark.parametrize("length", [5, 14, 60])
+def test_get_skew_matches_pandas(df, length):
+    result = rolling_model.get_skew(df, length)
+    expected = df.rolling(length).skew().dropna()
+
+    assert (result.index == expected.index).all()
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), atol=1e-8)
+
+
+@pytest.mark.parametrize("length", [5, 14, 60])
+def test_get_kurtosis_matches_pandas(df, length):
+    result = rolling_model.get_kurtosis(df, length)
+    expected = df.rolling(length).kurt().dropna()
+
+    assert (result.index == expected.index).all()
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), atol=1e-8)